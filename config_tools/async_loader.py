@@ -0,0 +1,119 @@
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .config_loader import ConfigLoader
+from .config_registry import kwargs_key
+
+# A top-level, unindented `authentication_path: value` line, optionally quoted and with a trailing comment.
+AUTH_PATH_PATTERN = re.compile(rb'^authentication_path[ \t]*:[ \t]*(?P<value>[^#\r\n]*?)[ \t]*(?:#[^\r\n]*)?\r?$',
+                               re.MULTILINE)
+
+
+def _read_bytes(path: Path) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def _read_main(path: Path) -> Tuple[Path, bytes, Optional[Path]]:
+    """Return the resolved path, contents and likely resolved authentication_path of a config file."""
+    resolved = path.resolve()
+    raw = _read_bytes(resolved)
+    auth_path = guess_authentication_path(raw)
+    return resolved, raw, auth_path.resolve() if auth_path is not None else None
+
+
+def guess_authentication_path(raw: bytes) -> Optional[Path]:
+    """Return the authentication_path a YAML document most likely declares, without parsing it.
+
+    Only used to start reading the auth file early; a wrong guess just means the loader reads the file itself.
+    """
+    match = AUTH_PATH_PATTERN.search(raw)
+    if match is None:
+        return None
+    value = match.group('value').strip()
+    if len(value) >= 2 and value[:1] == value[-1:] and value[:1] in (b'"', b"'"):
+        value = value[1:-1]
+    if not value:
+        return None
+    try:
+        return Path(value.decode('utf-8'))
+    except UnicodeDecodeError:
+        return None
+
+
+class AsyncConfigLoader:
+    """Loads ConfigLoader instances from asyncio code without blocking the event loop.
+
+    File reads, parsing, log directory creation and validation run in a bounded thread pool, and
+    the authentication file is read while the main file is being parsed. Concurrent load() calls
+    for the same path, rules and options share one load. Use one instance per event loop.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, loader_factory: Callable[..., ConfigLoader] = ConfigLoader):
+        """Create the executor; max_workers bounds how many files are read and parsed at once."""
+        self.loader_factory = loader_factory
+        self.loads = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='config-load')
+        self._inflight: Dict[Tuple, 'asyncio.Future[ConfigLoader]'] = {}
+
+    async def load(self, config_path: Union[str, Path], config_rules=None, auth_rules=None,
+                   **loader_kwargs) -> ConfigLoader:
+        """Load and validate a config; callers asking for an in-flight load wait for the same result."""
+        path = Path(os.path.abspath(config_path))
+        key = (str(path), id(config_rules), id(auth_rules), kwargs_key(loader_kwargs))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(path, config_rules, auth_rules, loader_kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the load for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    async def load_many(self, config_paths: Iterable[Union[str, Path]], config_rules=None, auth_rules=None,
+                        return_exceptions: bool = False, **loader_kwargs) -> List[Any]:
+        """Load several configs concurrently and return the loaders in the order of config_paths."""
+        return await asyncio.gather(
+            *(self.load(path, config_rules, auth_rules, **loader_kwargs) for path in config_paths),
+            return_exceptions=return_exceptions,
+        )
+
+    @property
+    def inflight(self) -> int:
+        """Number of distinct loads currently running."""
+        return len(self._inflight)
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the executor; loads already running are allowed to finish when wait=True."""
+        self._executor.shutdown(wait=wait)
+
+    async def __aenter__(self) -> 'AsyncConfigLoader':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _load(self, path: Path, config_rules, auth_rules, loader_kwargs: Dict[str, Any]) -> ConfigLoader:
+        loop = asyncio.get_running_loop()
+        prefetched: Dict[Path, Any] = {}
+        try:
+            resolved, raw, auth_path = await loop.run_in_executor(self._executor, _read_main, path)
+        except OSError:
+            pass  # Let the loader raise its usual error for missing or unreadable files.
+        else:
+            prefetched[resolved] = raw
+            if auth_path is not None:
+                # Submitted before the loader so it is never queued behind a task that waits on it.
+                prefetched[auth_path] = self._executor.submit(_read_bytes, auth_path)
+
+        loader = await loop.run_in_executor(self._executor, self._build, path, config_rules, auth_rules,
+                                            prefetched, loader_kwargs)
+        self.loads += 1
+        return loader
+
+    def _build(self, path: Path, config_rules, auth_rules, prefetched, loader_kwargs) -> ConfigLoader:
+        return self.loader_factory(path, config_rules=config_rules, auth_rules=auth_rules,
+                                   prefetched=prefetched, **loader_kwargs)
@@ -0,0 +1,184 @@
+"""Validate many config files in parallel and stream the results as JSON lines.
+
+Usage:
+    python -m config_tools.bulk_validate configs/ --pattern "**/config.yaml" \\
+        --config-rules config_tools.validation_rules_config:config_rules \\
+        --auth-rules config_tools.validation_rules_auth:auth_rules
+"""
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+import yaml
+
+from .compiled_rules import CompiledRules
+from .config_cache import fast_safe_load
+from .config_compose import compose
+from .utils import normalize_config
+
+# A top-level `authentication_path: value` line, optionally quoted and with a trailing comment.
+AUTH_PATH_LINE = re.compile(rb'^authentication_path[ \t]*:[ \t]*(?P<value>[^#\r\n]*?)[ \t]*(?:#[^\r\n]*)?\r?$',
+                            re.MULTILINE)
+
+# Per-process state set up once by the pool initializer, so rules are never pickled per task.
+_config_plan: Optional[CompiledRules] = None
+_auth_plan: Optional[CompiledRules] = None
+
+
+def import_rules(spec: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Import a rules dict from a 'package.module:attribute' spec; None gives empty rules."""
+    if not spec:
+        return {}
+    module_name, _, attribute = spec.partition(':')
+    if not attribute:
+        raise ValueError(f"Rules spec must look like 'package.module:attribute'. Found: '{spec}'")
+    rules = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(rules, dict):
+        raise ValueError(f"Rules spec '{spec}' does not refer to a dict.")
+    return rules
+
+
+def _init_worker(config_rules_spec: Optional[str], auth_rules_spec: Optional[str]) -> None:
+    global _config_plan, _auth_plan
+    _config_plan = CompiledRules(import_rules(config_rules_spec))
+    _auth_plan = CompiledRules(import_rules(auth_rules_spec))
+
+
+def _read_config(path: Path) -> Dict:
+    with open(path, 'rb') as file:
+        try:
+            return normalize_config(fast_safe_load(file.read()))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML file: {e}")
+
+
+def validate_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """Parse and validate one config and its authentication file without setting up any logger."""
+    result: Dict[str, Any] = {'path': str(path), 'ok': False, 'errors': [], 'timings_ms': {}}
+    timings = result['timings_ms']
+    try:
+        started = time.perf_counter()
+        config, _ = compose(_read_config(Path(path)), path)
+        timings['parse'] = round((time.perf_counter() - started) * 1000, 3)
+
+        started = time.perf_counter()
+        errors = [violation.message for violation in _config_plan.validate(config).violations]
+        timings['validate'] = round((time.perf_counter() - started) * 1000, 3)
+
+        auth_path = config.get('authentication_path')
+        if auth_path:
+            started = time.perf_counter()
+            auth_path_obj = Path(auth_path)
+            if not auth_path_obj.is_file():
+                errors.append(f"Authentication path '{auth_path}' does not exist or is not a valid file.")
+            else:
+                auth_config = _read_config(auth_path_obj)
+                errors.extend(violation.message for violation in _auth_plan.validate(auth_config).violations)
+            timings['auth'] = round((time.perf_counter() - started) * 1000, 3)
+
+        result['errors'] = errors
+        result['ok'] = not errors
+    except (OSError, ValueError) as e:
+        result['errors'] = [str(e)]
+    except Exception as e:
+        # Reported per file so one unexpected failure never aborts the rest of the run.
+        result['errors'] = [f"Unexpected error validating '{path}': {e!r}"]
+    return result
+
+
+def authentication_files(paths: Iterable[Union[str, Path]]) -> Set[Path]:
+    """Return the resolved files named by a top-level `authentication_path` line in any of the given configs."""
+    found = set()
+    for path in paths:
+        try:
+            raw = Path(path).read_bytes()
+        except OSError:
+            continue
+        for match in AUTH_PATH_LINE.finditer(raw):
+            value = match.group('value').strip(b'\'"')
+            if value:
+                found.add(Path(os.fsdecode(value)).resolve())
+    return found
+
+
+def find_config_files(root: Union[str, Path], pattern: str = '**/*.yaml',
+                      include_authentication_files: bool = False) -> List[Path]:
+    """Return the config files under root matching the glob pattern, in sorted order.
+
+    Files that a matched config names as its authentication_path are left out unless include_authentication_files is set.
+    """
+    root = Path(root)
+    if root.is_file():
+        return [root]
+    paths = sorted(path for path in root.glob(pattern) if path.is_file())
+    if include_authentication_files:
+        return paths
+    auth_files = authentication_files(paths)
+    return [path for path in paths if path.resolve() not in auth_files]
+
+
+def validate_files(paths: Iterable[Union[str, Path]], config_rules_spec: Optional[str] = None,
+                   auth_rules_spec: Optional[str] = None, workers: Optional[int] = None,
+                   chunksize: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Validate files across a process pool, yielding results in input order.
+
+    Results are not reordered by completion, so one slow file holds back the results after it.
+
+    Rules are given as import specs so each worker imports and compiles them once.
+    """
+    paths = [str(path) for path in paths]
+    if not paths:
+        return
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, min(256, len(paths) // (workers * 4)))
+
+    if workers == 1:
+        _init_worker(config_rules_spec, auth_rules_spec)
+        yield from map(validate_file, paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(config_rules_spec, auth_rules_spec)) as executor:
+        yield from executor.map(validate_file, paths, chunksize=chunksize)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns 1 if any config failed validation."""
+    parser = argparse.ArgumentParser(description="Validate config files in parallel and print JSON lines.")
+    parser.add_argument('root', help="Directory to search, or a single config file")
+    parser.add_argument('--pattern', default='**/*.yaml', help="Glob pattern relative to root (default: **/*.yaml)")
+    parser.add_argument('--include-auth-files', action='store_true',
+                        help="Also validate files that a matched config names as its authentication_path")
+    parser.add_argument('--config-rules', default=None, help="Rules spec, e.g. config_tools.validation_rules_config:config_rules")
+    parser.add_argument('--auth-rules', default=None, help="Rules spec, e.g. config_tools.validation_rules_auth:auth_rules")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunksize', type=int, default=None, help="Files per task sent to a worker")
+    args = parser.parse_args(argv)
+
+    # Fail fast on a bad spec instead of in every worker.
+    import_rules(args.config_rules)
+    import_rules(args.auth_rules)
+
+    failed = 0
+    started = time.perf_counter()
+    paths = find_config_files(args.root, args.pattern, args.include_auth_files)
+    for result in validate_files(paths, args.config_rules, args.auth_rules, args.workers, args.chunksize):
+        failed += not result['ok']
+        sys.stdout.write(json.dumps(result) + '\n')
+    sys.stdout.flush()
+
+    elapsed = time.perf_counter() - started
+    print(f"Validated {len(paths)} files in {elapsed:.2f}s, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+import re
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, List, Optional, Pattern, Union
+
+# Offending items quoted in an error message; every offending index is always listed.
+MAX_QUOTED_ITEMS = 5
+
+
+class CollectionValidator(ABC):
+    """Base class for validators that check every item of a list-valued config entry in one pass.
+
+    Instances are callables with the rules-dict validator signature `(key, value)` and raise a single
+    ValueError listing all offending indices. Subclasses precompute their lookup structures once and
+    implement find_violations().
+    """
+
+    description = "invalid item(s)"
+
+    def __call__(self, key: str, value: Any) -> None:
+        message = self.check(key, value)
+        if message is not None:
+            raise ValueError(message)
+
+    def check(self, key: str, value: Any) -> Optional[str]:
+        """Return an error message for the value, or None when every item is valid."""
+        items = self._items(value)
+        if items is None:
+            return f"Config key '{key}' must be a list. Found: {type(value).__name__}"
+        indices = self.find_violations(items)
+        if not indices:
+            return None
+        quoted = ", ".join(repr(items[index]) for index in indices[:MAX_QUOTED_ITEMS])
+        if len(indices) > MAX_QUOTED_ITEMS:
+            quoted += ", ..."
+        return (f"Config key '{key}' has {len(indices)} {self.description} at indices {indices}. "
+                f"Found: {quoted}")
+
+    @abstractmethod
+    def find_violations(self, items: List[Any]) -> List[int]:
+        """Return the index of every offending item, in order."""
+
+    def _items(self, value: Any) -> Optional[List[Any]]:
+        return value if isinstance(value, (list, tuple)) else None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class AllowedValues(CollectionValidator):
+    """Every item must be one of `allowed`; membership is checked against a frozenset.
+
+    A single string is accepted as a one-item list, as with ConfigValidator.validate_string_in_list.
+    """
+
+    description = "value(s) outside the allowed set"
+
+    def __init__(self, allowed: Iterable[Any]):
+        self.allowed = frozenset(allowed)
+
+    def find_violations(self, items: List[Any]) -> List[int]:
+        allowed = self.allowed
+        try:
+            return [index for index, item in enumerate(items) if item not in allowed]
+        except TypeError:
+            # Unhashable items (lists, dicts) can never be members.
+            return [index for index, item in enumerate(items) if not _is_member(item, allowed)]
+
+    def _items(self, value: Any) -> Optional[List[Any]]:
+        return [value] if isinstance(value, str) else super()._items(value)
+
+    def __repr__(self):
+        return f"AllowedValues(<{len(self.allowed)} values>)"
+
+
+class AllowedIntValues(CollectionValidator):
+    """Every item must be an integer from `allowed`, stored as a sorted 64-bit array and binary-searched.
+
+    Uses about 8 bytes per allowed ID instead of the ~60 a frozenset of ints costs, for very large ID lists.
+    """
+
+    description = "value(s) outside the allowed set"
+
+    def __init__(self, allowed: Iterable[int]):
+        self.allowed = array('q', sorted(set(allowed)))
+
+    def find_violations(self, items: List[Any]) -> List[int]:
+        allowed = self.allowed
+        size = len(allowed)
+        violations = []
+        for index, item in enumerate(items):
+            if type(item) is not int:
+                violations.append(index)
+                continue
+            position = bisect_left(allowed, item)
+            if position == size or allowed[position] != item:
+                violations.append(index)
+        return violations
+
+    def __repr__(self):
+        return f"AllowedIntValues(<{len(self.allowed)} values>)"
+
+
+class UniqueItems(CollectionValidator):
+    """No item may repeat; every repeat after the first occurrence is reported."""
+
+    description = "duplicate item(s)"
+
+    def find_violations(self, items: List[Any]) -> List[int]:
+        seen = set()
+        add = seen.add
+        violations = []
+        for index, item in enumerate(items):
+            try:
+                if item in seen:
+                    violations.append(index)
+                else:
+                    add(item)
+            except TypeError:
+                # Unhashable items are compared by a hashable canonical form that ignores mapping key order.
+                marker = _canonical(item)
+                if marker in seen:
+                    violations.append(index)
+                else:
+                    add(marker)
+        return violations
+
+
+class EachIntInRange(CollectionValidator):
+    """Every item must be an integer (not a bool) within the optional inclusive bounds."""
+
+    def __init__(self, min_value: Optional[int] = None, max_value: Optional[int] = None):
+        self.min_value = float('-inf') if min_value is None else min_value
+        self.max_value = float('inf') if max_value is None else max_value
+        self.description = f"item(s) that are not integers in [{min_value}, {max_value}]"
+
+    def find_violations(self, items: List[Any]) -> List[int]:
+        low, high = self.min_value, self.max_value
+        return [index for index, item in enumerate(items)
+                if type(item) is not int or not low <= item <= high]
+
+
+class EachMatches(CollectionValidator):
+    """Every item must be a string that fully matches `pattern`, compiled once."""
+
+    def __init__(self, pattern: Union[str, Pattern], flags: int = 0):
+        self.pattern = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        self.description = f"item(s) not matching '{self.pattern.pattern}'"
+
+    def find_violations(self, items: List[Any]) -> List[int]:
+        fullmatch = self.pattern.fullmatch
+        return [index for index, item in enumerate(items)
+                if not isinstance(item, str) or fullmatch(item) is None]
+
+
+class EachLengthBetween(CollectionValidator):
+    """Every item must be a string, list or mapping whose length is within the optional inclusive bounds."""
+
+    def __init__(self, min_length: Optional[int] = None, max_length: Optional[int] = None):
+        self.min_length = 0 if min_length is None else min_length
+        self.max_length = float('inf') if max_length is None else max_length
+        self.description = f"item(s) with length outside [{min_length}, {max_length}]"
+
+    def find_violations(self, items: List[Any]) -> List[int]:
+        low, high = self.min_length, self.max_length
+        return [index for index, item in enumerate(items)
+                if not isinstance(item, (str, list, tuple, dict)) or not low <= len(item) <= high]
+
+
+def _canonical(item: Any) -> Any:
+    """Return a hashable stand-in for an item that compares equal exactly when the items do."""
+    if isinstance(item, dict):
+        return ('__dict__', frozenset((key, _canonical(value)) for key, value in item.items()))
+    if isinstance(item, list):
+        return ('__list__', tuple(_canonical(value) for value in item))
+    if isinstance(item, set):
+        return frozenset(item)
+    try:
+        hash(item)
+    except TypeError:
+        return ('__unhashable__', repr(item))
+    return item
+
+
+def _is_member(item: Any, allowed: frozenset) -> bool:
+    try:
+        return item in allowed
+    except TypeError:
+        return False
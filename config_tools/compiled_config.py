@@ -0,0 +1,144 @@
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .config_compose import Dependency, compose, dependencies_fresh
+
+# Artifact layout: header | pickled (normalized config, include/extends dependency records).
+# Header: magic, format version, CRC-32 of the payload, source mtime_ns, source size, payload length.
+ARTIFACT_MAGIC = b'CTCFGART'
+ARTIFACT_FORMAT_VERSION = 4  # 2: nested keys are normalized; 3: include/extends dependencies; 4: dunder directives
+ARTIFACT_SUFFIX = '.compiled'
+ARTIFACT_HEADER = struct.Struct('<8sHIQQQ')
+
+
+def artifact_path_for(path: Union[str, Path]) -> Path:
+    """Return the compiled artifact path that sits next to a YAML file."""
+    path = Path(path)
+    return path.with_name(path.name + ARTIFACT_SUFFIX)
+
+
+def write_artifact(source_path: Path, config: Dict[str, Any], source_stat: os.stat_result,
+                   output_path: Optional[Path] = None, dependencies: Sequence[Dependency] = ()) -> Path:
+    """Write a normalized config as a versioned, checksummed artifact and return its path.
+
+    The artifact gets the source file's permission bits, since auth artifacts hold the same secrets.
+    `dependencies` are the include/extends files the config was composed from; the artifact is
+    stale once any of them changes.
+    """
+    output_path = Path(output_path) if output_path else artifact_path_for(source_path)
+    payload = pickle.dumps((config, list(dependencies)), protocol=pickle.HIGHEST_PROTOCOL)
+    header = ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT_VERSION, zlib.crc32(payload),
+                                  source_stat.st_mtime_ns, source_stat.st_size, len(payload))
+
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, source_stat.st_mode & 0o777)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(header + payload)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    return output_path
+
+
+def load_artifact(artifact_path: Path, source_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Return the config stored in an artifact, or None if it is missing, corrupt or stale.
+
+    The artifact is stale when the source YAML exists and its mtime or size differs from the one
+    compiled (an older mtime too, as restored by a rollback), or when a file it includes or extends
+    changed. Artifacts are unpickled, so only load ones produced by
+    a trusted deploy step.
+    """
+    entry = load_artifact_entry(artifact_path, source_path)
+    return entry[0] if entry is not None else None
+
+
+def load_artifact_entry(artifact_path: Path,
+                        source_path: Optional[Path] = None) -> Optional[Tuple[Dict[str, Any], List[Dependency]]]:
+    """Like load_artifact(), but also return the fragment files the config was composed from."""
+    try:
+        with open(artifact_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if len(data) < ARTIFACT_HEADER.size:
+        return None
+    magic, version, checksum, mtime_ns, size, length = ARTIFACT_HEADER.unpack_from(data)
+    if magic != ARTIFACT_MAGIC or version != ARTIFACT_FORMAT_VERSION:
+        return None
+
+    if source_path is not None:
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
+            source_stat = None
+        if source_stat is not None and (source_stat.st_mtime_ns != mtime_ns or source_stat.st_size != size):
+            return None
+
+    payload = memoryview(data)[ARTIFACT_HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        return None
+    try:
+        config, dependencies = pickle.loads(payload)
+    except Exception:
+        return None
+    if not isinstance(config, dict) or not dependencies_fresh(dependencies):
+        return None
+    return config, dependencies
+
+
+def load_compiled_config(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the config for a YAML path from its compiled artifact, if a fresh one exists."""
+    entry = load_compiled_entry(path)
+    return entry[0] if entry is not None else None
+
+
+def load_compiled_entry(path: Path) -> Optional[Tuple[Dict[str, Any], List[Dependency]]]:
+    """Like load_compiled_config(), but also return the fragment files the config was composed from."""
+    if path.suffix == ARTIFACT_SUFFIX:
+        return load_artifact_entry(path, path.with_name(path.stem))
+    return load_artifact_entry(artifact_path_for(path), path)
+
+
+def compile_config(config_path: Union[str, Path], config_rules=None, auth_rules=None,
+                   include_auth: bool = True) -> Dict[str, Path]:
+    """Parse, normalize, compose and validate a config (and its auth file) and write compiled artifacts.
+
+    Returns a mapping of source path to artifact path. Raises ValueError on validation errors.
+    """
+    from .config_cache import fast_safe_load
+    from .config_validator import ConfigValidator
+    from .utils import normalize_config
+    import yaml
+
+    def parse(path: Path):
+        source_stat = os.stat(path)
+        with open(path, 'rb') as file:
+            raw = file.read()
+        try:
+            return normalize_config(fast_safe_load(raw)), source_stat
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML file: {e}")
+
+    config_path = Path(config_path).resolve()
+    config, config_stat = parse(config_path)
+    config, dependencies = compose(config, config_path)
+    ConfigValidator(config, config_rules or {}).validate(collect_all=True)
+    artifacts = {config_path: write_artifact(config_path, config, config_stat, dependencies=dependencies)}
+
+    auth_path = config.get('authentication_path')
+    if include_auth and auth_path:
+        auth_path = Path(auth_path)
+        if not auth_path.is_file():
+            raise FileNotFoundError(f"Authentication path '{auth_path}' does not exist or is not a valid file.")
+        auth_config, auth_stat = parse(auth_path)
+        ConfigValidator(auth_config, auth_rules or {}).validate(collect_all=True)
+        artifacts[auth_path] = write_artifact(auth_path, auth_config, auth_stat)
+    return artifacts
@@ -0,0 +1,217 @@
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .collection_validators import CollectionValidator
+from .config_index import PATH_SEPARATOR, resolve_path
+from .config_validator import ConfigValidator, BEARER_TOKEN_PATTERN
+
+# A compiled check returns an error message, or None when the value is valid.
+Check = Callable[[str, Any], Optional[str]]
+
+
+class Violation(NamedTuple):
+    """A single rule violation."""
+    key: str
+    message: str
+
+
+class ValidationReport:
+    """Every violation found for one config."""
+
+    __slots__ = ('violations',)
+
+    def __init__(self, violations: Tuple[Violation, ...] = ()):
+        self.violations = violations
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self):
+        return f"<ValidationReport ok={self.ok} violations={len(self.violations)}>"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable form of the report."""
+        return {'ok': self.ok, 'errors': [{'key': v.key, 'message': v.message} for v in self.violations]}
+
+    def raise_for_errors(self) -> None:
+        """Raise a ValueError listing every violation, if there are any."""
+        if self.violations:
+            raise ValueError("; ".join(v.message for v in self.violations))
+
+
+VALID_REPORT = ValidationReport()
+
+
+def _check_https_url(key, value):
+    if not value.lower().startswith('https://'):
+        return f"Config key '{key}' must start with 'HTTPS://'. Found: '{value}'"
+    if not value.endswith('/'):
+        return f"Config key '{key}' must end with '/'. Found: '{value}'"
+    return None
+
+
+def _check_log_prefix(key, value):
+    if not value.lower().endswith('_'):
+        return f"log_name_prefix '{key}' must end with '_'. Found: '{value}'"
+    return None
+
+
+def _check_non_empty_string(key, value):
+    if not isinstance(value, str) or not value.strip():
+        return f"Config key '{key}' must be a non-empty string. Found: '{value}'"
+    return None
+
+
+def _check_bearer_token(key, value):
+    if not isinstance(value, str) or not value.strip():
+        return f"Config key '{key}' must be a non-empty string. Found: '{value}'"
+    if not BEARER_TOKEN_PATTERN.fullmatch(value):
+        return f"Auth Config key '{key}' must be a Bearer Token in the format 'Bearer <UUID>'. Found: '{value}'"
+    return None
+
+
+def _compile_int_range(min_value: Optional[int] = None, max_value: Optional[int] = None) -> Check:
+    def check(key, value):
+        if min_value is not None and value < min_value:
+            return f"Config key '{key}' must be greater than or equal to {min_value}. Found: {value}"
+        if max_value is not None and value > max_value:
+            return f"Config key '{key}' must be less than or equal to {max_value}. Found: {value}"
+        return None
+    return check
+
+
+def _compile_date(min_date: Optional[date] = None) -> Check:
+    if min_date is None:
+        # Fixed when the rules are compiled rather than recomputed for every value.
+        min_date = datetime.now().date() - timedelta(days=(365*2)+1)
+
+    def check(key, value):
+        if not isinstance(value, date):
+            return f"Config key '{key}' must be a valid date object. Found: '{value}'"
+        if value < min_date:
+            return f"Config key '{key}' must be on or after {min_date}. Found: {value}"
+        return None
+    return check
+
+
+def _compile_string_in_list(target_list: List[str]) -> Check:
+    allowed = frozenset(target_list)
+
+    def check(key, value):
+        items = [value] if isinstance(value, str) else value
+        if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+            return f"Config key '{key}' must be a string or a list of strings. Found: {value}"
+        for item in items:
+            if item not in allowed:
+                return f"Config key '{key}' contains an invalid value '{item}'. Allowed values are: {target_list}"
+        return None
+    return check
+
+
+_PLAIN_CHECKS: Dict[Callable, Check] = {
+    ConfigValidator.validate_https_url: _check_https_url,
+    ConfigValidator.validate_log_prefix: _check_log_prefix,
+    ConfigValidator.validate_non_empty_string: _check_non_empty_string,
+    ConfigValidator.validate_qTest_bearer_token: _check_bearer_token,
+}
+
+_PARAMETERIZED_CHECKS: Dict[Callable, Callable[..., Check]] = {
+    ConfigValidator.validate_int_range: _compile_int_range,
+    ConfigValidator.validate_date: _compile_date,
+    ConfigValidator.validate_string_in_list: _compile_string_in_list,
+}
+
+
+def _type_error_message(key: str, value: Any) -> str:
+    return f"Config key '{key}' has an unexpected type {type(value).__name__}. Found: {value!r}"
+
+
+def _wrap_validator(validator: Callable[[str, Any], None]) -> Check:
+    """Adapt an arbitrary raising validator to the compiled check signature."""
+    def check(key, value):
+        try:
+            validator(key, value)
+        except ValueError as e:
+            return str(e)
+        except (TypeError, AttributeError):
+            return _type_error_message(key, value)
+        return None
+    return check
+
+
+def compile_validator(validator: Callable[[str, Any], None]) -> Check:
+    """Return a non-raising check for a rules-dict validator.
+
+    Built-in ConfigValidator methods, bare or bound with functools.partial keyword arguments,
+    are specialized with their bounds, sets and patterns fixed now (so a bare validate_date gets
+    today's cutoff); collection validators already are, and their non-raising check() is used
+    directly. Anything else is wrapped.
+    """
+    if isinstance(validator, CollectionValidator):
+        return validator.check
+    if isinstance(validator, partial) and not validator.args and validator.func in _PARAMETERIZED_CHECKS:
+        try:
+            return _PARAMETERIZED_CHECKS[validator.func](**(validator.keywords or {}))
+        except TypeError:
+            return _wrap_validator(validator)
+    try:
+        plain = _PLAIN_CHECKS.get(validator)
+        factory = _PARAMETERIZED_CHECKS.get(validator)
+    except TypeError:
+        plain = factory = None
+    if plain is None and factory is not None:
+        try:
+            plain = factory()
+        except TypeError:
+            plain = None
+    return plain or _wrap_validator(validator)
+
+
+class CompiledRules:
+    """A validation plan built once from a rules dict and reusable across many configs."""
+
+    def __init__(self, rules: Dict[str, Dict[str, Any]]):
+        """Split required keys out and compile each validator; dotted keys target nested values."""
+        self.rules = rules
+        self.dotted_keys = frozenset(key for key in rules if PATH_SEPARATOR in key)
+        self.required_keys: Tuple[str, ...] = tuple(key for key, rule in rules.items() if rule.get('required'))
+        self.checks: Tuple[Tuple[str, Check], ...] = tuple(
+            (key, compile_validator(rule['validator'])) for key, rule in rules.items() if rule.get('validator') is not None
+        )
+
+    def validate(self, config: Dict[str, Any]) -> ValidationReport:
+        """Check a config against every rule and report all violations, including wrong-typed values."""
+        get = config.get
+        dotted = self.dotted_keys
+        violations = None
+        for key in self.required_keys:
+            value = get(key)
+            if value is None and key in dotted:
+                value = resolve_path(config, key)
+            if value is None:
+                violations = violations or []
+                violations.append(Violation(key, f"Missing required config key: '{key}'"))
+        for key, check in self.checks:
+            value = get(key)
+            if value is None and key in dotted:
+                value = resolve_path(config, key)
+            if value is not None:
+                try:
+                    message = check(key, value)
+                except (TypeError, AttributeError):
+                    # A specialized check given a value of the wrong type, e.g. an int for a URL.
+                    message = _type_error_message(key, value)
+                if message is not None:
+                    violations = violations or []
+                    violations.append(Violation(key, message))
+        return ValidationReport(tuple(violations)) if violations else VALID_REPORT
+
+    def validate_many(self, configs: Iterable[Dict[str, Any]]) -> List[ValidationReport]:
+        """Validate each config and return one report per config."""
+        validate = self.validate
+        return [validate(config) for config in configs]
@@ -0,0 +1,159 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Union, Optional, Dict, Any, List, Sequence, Tuple
+
+from .config_compose import Dependency, dependencies_fresh
+
+CACHE_FORMAT_VERSION = 4  # 2: nested keys are normalized; 3: include/extends dependencies; 4: dunder directives
+CACHE_MAGIC = b'CTCACHE'
+
+
+def fast_safe_load(stream: Any) -> Any:
+    """Parse YAML with the C-accelerated safe loader when libyaml is available."""
+    # Imported here so modules that only read caches or compiled artifacts never import PyYAML.
+    import yaml
+
+    # libyaml's C loader is ~10x faster than the pure-Python one; fall back when PyYAML was built without it.
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _is_private(target: Union[Path, int]) -> bool:
+    """Return True if a path or open file is owned by the current user and not writable by group or others."""
+    if not hasattr(os, 'getuid'):
+        return True
+    stat = os.stat(target)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+class ConfigCache:
+    """Binary on-disk cache of normalized config dicts, keyed on path, mtime, size and content hash.
+
+    Entries for composed configs also record their include/extends files and are only reused while those are unchanged.
+    Entries are unpickled, so anyone who can write to the cache directory can run code in every loader using it.
+    The directory is created private (0o700), and on POSIX a directory or entry that is not owned by the current
+    user or is writable by others is ignored.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """Initialize the cache; the directory is created on first write."""
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/miss counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def cache_file_for(self, path: Path) -> Path:
+        """Return the cache file used for a resolved config path."""
+        digest = hashlib.sha256(str(path).encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{digest}.pickle"
+
+    def load(self, path: Path, raw: bytes) -> Optional[Dict]:
+        """Return the cached config for `path` if it matches the file's current stat and content, else None."""
+        entry = self.load_entry(path, raw)
+        return entry[0] if entry is not None else None
+
+    def load_entry(self, path: Path, raw: bytes) -> Optional[Tuple[Dict, List[Dependency]]]:
+        """Like load(), but also return the fragment files the cached config was composed from."""
+        stat = path.stat()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        entry = self._read_entry(self.cache_file_for(path))
+
+        if (entry is not None
+                and entry.get('path') == str(path)
+                and entry.get('mtime_ns') == stat.st_mtime_ns
+                and entry.get('size') == stat.st_size
+                and entry.get('content_hash') == content_hash
+                and dependencies_fresh(entry.get('dependencies', ()))):
+            self._count(hit=True)
+            return entry['config'], list(entry.get('dependencies', ()))
+
+        self._count(hit=False)
+        return None
+
+    def store(self, path: Path, raw: bytes, config: Dict, dependencies: Sequence[Dependency] = ()) -> None:
+        """Write the normalized config for `path` atomically; failures only cost a future cache miss."""
+        stat = path.stat()
+        entry = {
+            'path': str(path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'content_hash': hashlib.sha256(raw).hexdigest(),
+            'config': config,
+            'dependencies': list(dependencies),
+        }
+        try:
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        cache_file = self.cache_file_for(path)
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(self.cache_dir):
+                return
+            # Write to a private temp file and rename over the target so concurrent writers never
+            # expose a partially written entry; the last complete write wins.
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=cache_file.stem, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    tmp_file.write(CACHE_MAGIC + bytes([CACHE_FORMAT_VERSION]) + payload)
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every cache file and reset the counters."""
+        if self.cache_dir.is_dir():
+            for cache_file in self.cache_dir.glob('*.pickle'):
+                try:
+                    cache_file.unlink()
+                except OSError:
+                    pass
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _read_entry(self, cache_file: Path) -> Optional[Dict]:
+        """Read a cache entry, discarding files that are truncated, corrupt or from another format version."""
+        try:
+            if not _is_private(self.cache_dir):
+                return None
+            with open(cache_file, 'rb') as file:
+                if not _is_private(file.fileno()):
+                    return None
+                data = file.read()
+        except OSError:
+            return None
+
+        header = CACHE_MAGIC + bytes([CACHE_FORMAT_VERSION])
+        if data.startswith(header):
+            try:
+                entry = pickle.loads(data[len(header):])
+                if isinstance(entry, dict):
+                    return entry
+            except Exception:
+                pass
+
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+        return None
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
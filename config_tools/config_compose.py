@@ -0,0 +1,217 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .utils import normalize_config
+
+# Top-level keys naming the files a config is composed from; they are removed from the result. The dunder
+# names keep plain 'extends' or 'include' keys usable as ordinary config data.
+DIRECTIVE_KEYS = ('__extends__', '__include__')
+
+# (resolved path, mtime_ns, size, sha256 of the contents) of a fragment file a config was composed from.
+Dependency = Tuple[str, int, int, str]
+
+
+class _Fragment(NamedTuple):
+    mtime_ns: int
+    size: int
+    content_hash: str
+    payload: bytes
+
+
+def has_directives(config: Mapping) -> bool:
+    """Return True if a parsed config names other files to include or extend."""
+    return any(key in config for key in DIRECTIVE_KEYS)
+
+
+def deep_merge(base: Dict, override: Mapping) -> Dict:
+    """Merge `override` into `base` and return it.
+
+    Mappings present on both sides are merged key by key; any other value from `override`,
+    including lists and null, replaces the base value. Nested mappings of `base` are copied
+    before they are merged into, so objects shared through YAML aliases are left untouched.
+    """
+    for key, value in override.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, Mapping):
+            base[key] = deep_merge(dict(current), value)
+        else:
+            base[key] = value
+    return base
+
+
+def _read_fragment(path: Path) -> bytes:
+    try:
+        with open(path, 'rb') as file:
+            return file.read()
+    except (FileNotFoundError, IsADirectoryError):
+        raise FileNotFoundError(f"Included config '{path}' does not exist or is not a valid file.")
+
+
+def _parse_fragment(raw: bytes, path: Path) -> Dict:
+    import yaml
+    from .config_cache import fast_safe_load
+
+    try:
+        return normalize_config(fast_safe_load(raw))
+    except yaml.YAMLError as e:
+        raise ValueError(f"Error parsing YAML file '{path}': {e}")
+
+
+class FragmentCache:
+    """Parsed, normalized fragment files shared by every loader in the process.
+
+    Entries are keyed by resolved path and reused while the file's mtime and size are unchanged,
+    or its content hash is, so each base file is parsed once per change. They hold the pickled
+    config and every load unpickles a private copy, which is several times faster than parsing
+    and keeps one loader's merges from leaking into another's. Concurrent loads of the same
+    fragment wait for a single parse.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize the cache; least recently used fragments beyond maxsize are dropped."""
+        if maxsize < 1:
+            raise ValueError(f"Fragment cache maxsize must be at least 1. Found: {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.parses = 0
+        self._entries: "OrderedDict[Path, _Fragment]" = OrderedDict()
+        self._path_locks: Dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> Tuple[Dict, Dependency]:
+        """Return a private copy of a resolved fragment path's config and its dependency record."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise FileNotFoundError(f"Included config '{path}' does not exist or is not a valid file.")
+
+        with self._lock:
+            path_lock = self._path_locks.setdefault(path, threading.Lock())
+        with path_lock:
+            with self._lock:
+                entry = self._entries.get(path)
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                hit = True
+            else:
+                raw = _read_fragment(path)
+                content_hash = hashlib.sha256(raw).hexdigest()
+                hit = entry is not None and entry.content_hash == content_hash
+                if hit:
+                    entry = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)  # Touched, not changed.
+                else:
+                    config = _parse_fragment(raw, path)
+                    entry = _Fragment(stat.st_mtime_ns, stat.st_size, content_hash,
+                                      pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+            with self._lock:
+                self._entries[path] = entry
+                self._entries.move_to_end(path)
+                if hit:
+                    self.hits += 1
+                else:
+                    self.parses += 1
+                self._evict()
+
+        return pickle.loads(entry.payload), (str(path), entry.mtime_ns, entry.size, entry.content_hash)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and parse counters and the number of cached fragments."""
+        with self._lock:
+            return {'hits': self.hits, 'parses': self.parses, 'fragments': len(self._entries)}
+
+    def clear(self) -> None:
+        """Drop every cached fragment and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._path_locks.clear()
+            self.hits = 0
+            self.parses = 0
+
+    def _evict(self) -> None:
+        """Drop least recently used fragments beyond maxsize; callers must hold the lock."""
+        while len(self._entries) > self.maxsize:
+            path, _ = self._entries.popitem(last=False)
+            self._path_locks.pop(path, None)
+
+
+_DEFAULT_FRAGMENT_CACHE = FragmentCache()
+
+
+def default_fragment_cache() -> FragmentCache:
+    """Return the process-wide fragment cache used when none is given."""
+    return _DEFAULT_FRAGMENT_CACHE
+
+
+def compose(config: Dict, path: Union[str, Path],
+            fragments: Optional[FragmentCache] = None) -> Tuple[Dict, List[Dependency]]:
+    """Resolve the __include__/__extends__ directives of a parsed, normalized config read from `path`.
+
+    Files listed under `__extends__` are merged first, in order, then those under `__include__`, then the
+    config's own keys; each later source is deep-merged over the earlier ones (see deep_merge()).
+    Paths are relative to the file naming them, and fragments may use directives themselves.
+    Returns the composed config and the fragment files it was built from; a config without
+    directives is returned as is. Raises ValueError on an include cycle.
+    """
+    if not has_directives(config):
+        return config, []
+    fragments = fragments or _DEFAULT_FRAGMENT_CACHE
+    resolved = Path(path).resolve()
+    dependencies: Dict[str, Dependency] = {}
+    composed = _compose(config, resolved, fragments, (resolved,), dependencies)
+    return composed, list(dependencies.values())
+
+
+def _directive_paths(config: Mapping, directive: str, path: Path) -> List[str]:
+    value = config.get(directive)
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) and item.strip() for item in value):
+        raise ValueError(f"'{directive}' in '{path}' must be a path or a list of paths. Found: {value}")
+    return value
+
+
+def _compose(config: Mapping, path: Path, fragments: FragmentCache, stack: Tuple[Path, ...],
+             dependencies: Dict[str, Dependency]) -> Dict:
+    composed: Dict[str, Any] = {}
+    for directive in DIRECTIVE_KEYS:
+        for name in _directive_paths(config, directive, path):
+            fragment_path = (path.parent / name.strip()).resolve()
+            if fragment_path in stack:
+                chain = " -> ".join(str(item) for item in stack + (fragment_path,))
+                raise ValueError(f"Include cycle detected: {chain}")
+            fragment, dependency = fragments.load(fragment_path)
+            dependencies.setdefault(dependency[0], dependency)
+            if has_directives(fragment):
+                fragment = _compose(fragment, fragment_path, fragments, stack + (fragment_path,), dependencies)
+            deep_merge(composed, fragment)
+    return deep_merge(composed, {key: value for key, value in config.items() if key not in DIRECTIVE_KEYS})
+
+
+def dependencies_fresh(dependencies: Iterable[Dependency]) -> bool:
+    """Return True if every recorded fragment file still has the recorded contents.
+
+    Files whose mtime and size match are trusted without being read; others are re-hashed.
+    """
+    for path, mtime_ns, size, content_hash in dependencies:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+            continue
+        if stat.st_size != size:
+            return False
+        try:
+            with open(path, 'rb') as file:
+                if hashlib.sha256(file.read()).hexdigest() != content_hash:
+                    return False
+        except OSError:
+            return False
+    return True
@@ -0,0 +1,325 @@
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+from collections.abc import Mapping
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from .utils import SensitiveDict
+
+MANIFEST_FORMAT_VERSION = 1
+# Keys the loader inserts that are not part of the config's content.
+EXCLUDED_KEYS = frozenset({'logger'})
+SECRETS_EXCLUDED = 'excluded'
+SECRETS_HMAC = 'hmac-sha256'
+
+
+def _encode(value: Any, emit: Callable[[str], None], secret_key: Optional[bytes], ancestors: Set[int]) -> None:
+    """Emit a type-tagged, length-prefixed encoding in which equal content always encodes the same way."""
+    kind = type(value)
+    if kind is str:
+        emit(f"s{len(value)}:")
+        emit(value)
+    elif kind is bool:
+        emit('T' if value else 'F')
+    elif kind is int:
+        emit(f"i{value};")
+    elif kind is float:
+        emit(f"f{value!r};")
+    elif value is None:
+        emit('N')
+    elif isinstance(value, SensitiveDict):
+        if secret_key is None:
+            emit('X')
+        else:
+            emit(f"H{_secret_digest(value, secret_key)};")
+    elif isinstance(value, (Mapping, list, tuple, set, frozenset)):
+        if id(value) in ancestors:
+            raise ValueError("Recursive config values cannot be fingerprinted.")
+        ancestors.add(id(value))
+        if isinstance(value, Mapping):
+            # Keys are ordered by their encoding, so neither insertion order nor key type matters.
+            items = sorted(((canonical_encoding(key), item) for key, item in value.items()), key=_first)
+            emit(f"m{len(items)}:")
+            for key, item in items:
+                emit(key)
+                _encode(item, emit, secret_key, ancestors)
+        elif isinstance(value, (set, frozenset)):
+            encoded = sorted(canonical_encoding(item, secret_key) for item in value)
+            emit(f"u{len(encoded)}:")
+            emit(''.join(encoded))
+        else:
+            emit(f"l{len(value)}:")
+            for item in value:
+                _encode(item, emit, secret_key, ancestors)
+        ancestors.discard(id(value))
+    elif isinstance(value, datetime):
+        emit(f"t{value.isoformat()};")
+    elif isinstance(value, date):
+        emit(f"a{value.isoformat()};")
+    elif isinstance(value, (bytes, bytearray)):
+        emit(f"b{bytes(value).hex()};")
+    elif isinstance(value, Path):
+        emit(f"p{len(str(value))}:")
+        emit(str(value))
+    elif isinstance(value, (bool, int, float, str)):
+        # Subclasses (such as IntEnum) are encoded as their base value.
+        base = next(base for base in (bool, int, float, str) if isinstance(value, base))
+        _encode(base(value), emit, secret_key, ancestors)
+    else:
+        raise ValueError(f"Config values of type {kind.__name__} cannot be fingerprinted.")
+
+
+def _first(pair):
+    return pair[0]
+
+
+def canonical_encoding(value: Any, secret_key: Optional[bytes] = None) -> str:
+    """Return the canonical encoding of a config value.
+
+    SensitiveDict values are encoded as an HMAC-SHA256 of their data keyed by `secret_key`, or as
+    a fixed placeholder without one, so secrets never appear in the encoding.
+    """
+    parts: List[str] = []
+    _encode(value, parts.append, secret_key, set())
+    return ''.join(parts)
+
+
+def _digest(encoding: str) -> str:
+    return hashlib.sha256(encoding.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _secret_digest(value: SensitiveDict, secret_key: bytes) -> str:
+    encoding = canonical_encoding(value.get_data())
+    return hmac.new(secret_key, encoding.encode('utf-8', 'surrogatepass'), hashlib.sha256).hexdigest()
+
+
+class ConfigFingerprint:
+    """sha256 digests of each top-level section of a config and of the whole config.
+
+    The whole-config digest is computed from the section digests, so two configs with the same
+    digest have the same content for every section. `secrets` records how SensitiveDict sections
+    were handled: 'excluded' (left out) or 'hmac-sha256' (included as salted hashes).
+    """
+
+    __slots__ = ('sections', 'digest', 'secrets')
+
+    def __init__(self, sections: Dict[str, str], secrets: str = SECRETS_EXCLUDED):
+        self.sections = dict(sorted(sections.items()))
+        self.secrets = secrets
+        self.digest = _digest(canonical_encoding(self.sections))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConfigFingerprint):
+            return NotImplemented
+        return self.digest == other.digest and self.secrets == other.secrets
+
+    def __hash__(self) -> int:
+        return hash((self.digest, self.secrets))
+
+    def __repr__(self):
+        return f"<ConfigFingerprint {self.digest[:12]} sections={len(self.sections)} secrets={self.secrets}>"
+
+    def as_manifest(self, source: Optional[str] = None) -> Dict[str, Any]:
+        """Return a JSON-serializable manifest of the fingerprint."""
+        return {
+            'format': MANIFEST_FORMAT_VERSION,
+            'source': source,
+            'secrets': self.secrets,
+            'digest': self.digest,
+            'sections': self.sections,
+        }
+
+    @classmethod
+    def from_manifest(cls, manifest: Dict[str, Any]) -> 'ConfigFingerprint':
+        """Rebuild a fingerprint from a manifest, checking its format and whole-config digest."""
+        if not isinstance(manifest, dict) or manifest.get('format') != MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported fingerprint manifest format. Expected format {MANIFEST_FORMAT_VERSION}.")
+        sections = manifest.get('sections')
+        if not isinstance(sections, dict):
+            raise ValueError("Fingerprint manifest has no 'sections' mapping.")
+        fingerprint = cls(sections, manifest.get('secrets', SECRETS_EXCLUDED))
+        if fingerprint.digest != manifest.get('digest'):
+            raise ValueError("Fingerprint manifest digest does not match its sections; the manifest is corrupt.")
+        return fingerprint
+
+
+def fingerprint_config(config: Mapping, secret_key: Optional[bytes] = None,
+                       exclude: Iterable[str] = EXCLUDED_KEYS) -> ConfigFingerprint:
+    """Fingerprint every top-level section of a config except the `exclude` keys.
+
+    SensitiveDict sections (such as 'auth') are left out unless a secret_key is given, in which
+    case they are included as HMAC-SHA256 digests that change when the secret does but cannot be
+    reversed or compared across keys. A LazyConfig has every section parsed.
+    """
+    exclude = frozenset(exclude)
+    sections = {}
+    for key in list(config):
+        if key in exclude:
+            continue
+        value = config[key]
+        if isinstance(value, SensitiveDict) and secret_key is None:
+            continue
+        sections[str(key)] = _digest(canonical_encoding(value, secret_key))
+    return ConfigFingerprint(sections, SECRETS_EXCLUDED if secret_key is None else SECRETS_HMAC)
+
+
+class ConfigDiff:
+    """Dotted paths that were added, removed or changed between two configs."""
+
+    __slots__ = ('added', 'removed', 'changed')
+
+    def __init__(self, added: List[str], removed: List[str], changed: List[str]):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    @property
+    def identical(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def __bool__(self) -> bool:
+        """True when anything differs."""
+        return not self.identical
+
+    def __repr__(self):
+        return f"<ConfigDiff added={len(self.added)} removed={len(self.removed)} changed={len(self.changed)}>"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'identical': self.identical, 'added': self.added, 'removed': self.removed, 'changed': self.changed}
+
+
+def diff_fingerprints(old: ConfigFingerprint, new: ConfigFingerprint) -> ConfigDiff:
+    """Compare two fingerprints section by section; this is all a manifest allows."""
+    if old.secrets != new.secrets:
+        raise ValueError(f"Cannot compare fingerprints with secrets '{old.secrets}' and '{new.secrets}'.")
+    return ConfigDiff(
+        added=sorted(new.sections.keys() - old.sections.keys()),
+        removed=sorted(old.sections.keys() - new.sections.keys()),
+        changed=sorted(key for key in old.sections.keys() & new.sections.keys()
+                       if old.sections[key] != new.sections[key]),
+    )
+
+
+def diff_configs(old: Mapping, new: Mapping, secret_key: Optional[bytes] = None,
+                 old_fingerprint: Optional[ConfigFingerprint] = None,
+                 new_fingerprint: Optional[ConfigFingerprint] = None) -> ConfigDiff:
+    """Structurally compare two configs and report the dotted paths that differ.
+
+    Sections whose digests match are skipped without being walked; pass fingerprints already
+    computed (e.g. ConfigLoader.fingerprint()) to avoid hashing again. Secret sections are only
+    reported as a whole, and only when a secret_key is given.
+    """
+    old_fingerprint = old_fingerprint or fingerprint_config(old, secret_key)
+    new_fingerprint = new_fingerprint or fingerprint_config(new, secret_key)
+    diff = diff_fingerprints(old_fingerprint, new_fingerprint)
+
+    added, removed, changed = list(diff.added), list(diff.removed), []
+    for key in diff.changed:
+        old_value, new_value = old.get(key), new.get(key)
+        if isinstance(old_value, SensitiveDict) or isinstance(new_value, SensitiveDict):
+            changed.append(key)
+        else:
+            _diff_values(key, old_value, new_value, added, removed, changed)
+    return ConfigDiff(sorted(added), sorted(removed), sorted(changed))
+
+
+def _diff_values(path: str, old: Any, new: Any, added: List[str], removed: List[str], changed: List[str]) -> None:
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        for key in old.keys() | new.keys():
+            child = f"{path}.{key}"
+            if key not in new:
+                removed.append(child)
+            elif key not in old:
+                added.append(child)
+            else:
+                _diff_values(child, old[key], new[key], added, removed, changed)
+        return
+    if type(old) is not type(new) or old != new:
+        changed.append(path)
+
+
+def write_manifest(fingerprint: ConfigFingerprint, path: Union[str, Path], source: Optional[str] = None) -> None:
+    """Write a fingerprint manifest as JSON."""
+    Path(path).write_text(json.dumps(fingerprint.as_manifest(source), indent=2) + '\n', encoding='utf-8')
+
+
+def read_manifest(path: Union[str, Path]) -> ConfigFingerprint:
+    """Read a fingerprint manifest written by write_manifest()."""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding='utf-8'))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Fingerprint manifest '{path}' is not valid JSON: {e}")
+    return ConfigFingerprint.from_manifest(manifest)
+
+
+def _read_config(path: Path, main_config: bool = True) -> Dict:
+    """Parse a config file through ConfigLoader's own parse path, without setting up a logger.
+
+    Like ConfigLoader, only the main config is composed from __extends__/__include__ fragments.
+    """
+    from .config_compose import compose
+    from .config_loader import parse_yaml
+
+    with open(path, 'r') as file:
+        config = parse_yaml(file)
+    return compose(config, path)[0] if main_config else config
+
+
+def fingerprint_file(path: Union[str, Path], secret_key: Optional[bytes] = None) -> ConfigFingerprint:
+    """Fingerprint a config file as ConfigLoader would load it.
+
+    With a secret_key the authentication file is read and included as the 'auth' section.
+    """
+    config = _read_config(Path(path))
+    auth_path = config.get('authentication_path')
+    if secret_key is not None and auth_path:
+        config['auth'] = SensitiveDict(_read_config(Path(auth_path), main_config=False))
+    return fingerprint_config(config, secret_key)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; `check` returns 1 if the config differs from the manifest."""
+    parser = argparse.ArgumentParser(description="Write or check config fingerprint manifests.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    write_parser = subparsers.add_parser('write', help="Fingerprint a config and write a manifest")
+    write_parser.add_argument('config_path', type=Path)
+    write_parser.add_argument('manifest_path', type=Path, nargs='?', help="Output file (default: stdout)")
+    check_parser = subparsers.add_parser('check', help="Compare a config against a manifest")
+    check_parser.add_argument('config_path', type=Path)
+    check_parser.add_argument('manifest_path', type=Path)
+    for subparser in (write_parser, check_parser):
+        subparser.add_argument('--secret-key-env', default=None, metavar='NAME',
+                               help="Environment variable holding the HMAC key; includes the auth file as salted hashes")
+    args = parser.parse_args(argv)
+
+    secret_key = None
+    if args.secret_key_env:
+        if not os.environ.get(args.secret_key_env):
+            print(f"Environment variable '{args.secret_key_env}' is not set.", file=sys.stderr)
+            return 2
+        secret_key = os.environ[args.secret_key_env].encode('utf-8')
+
+    try:
+        fingerprint = fingerprint_file(args.config_path, secret_key)
+        if args.command == 'write':
+            if args.manifest_path is None:
+                sys.stdout.write(json.dumps(fingerprint.as_manifest(str(args.config_path)), indent=2) + '\n')
+            else:
+                write_manifest(fingerprint, args.manifest_path, source=str(args.config_path))
+            return 0
+        diff = diff_fingerprints(read_manifest(args.manifest_path), fingerprint)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    sys.stdout.write(json.dumps(diff.as_dict()) + '\n')
+    return 0 if diff.identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+import threading
+from datetime import date, datetime
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .lazy_config import LazyConfig
+
+PATH_SEPARATOR = '.'
+_MISSING = object()
+_TRUE_STRINGS = frozenset({'true', 'yes', 'on', '1'})
+_FALSE_STRINGS = frozenset({'false', 'no', 'off', '0'})
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None), list, date, datetime})
+
+
+def resolve_path(config: Mapping, path: str) -> Any:
+    """Return the value at a dotted key path by walking nested mappings, or None if any part is missing.
+
+    A top-level key that itself contains dots is matched first. Used where building an index is not
+    worth it, such as validating a single config.
+    """
+    value = config.get(path)
+    if value is not None or PATH_SEPARATOR not in path:
+        return value
+    node: Any = config
+    for part in path.split(PATH_SEPARATOR):
+        if not isinstance(node, Mapping):
+            return None
+        child = node.get(part)
+        if child is None and part.lstrip('-').isdigit():
+            child = node.get(int(part))  # Integer YAML keys are addressed by their string form.
+        if child is None:
+            return None
+        node = child
+    return node
+
+
+def coerce(path: str, value: Any, type: Callable[[Any], Any]) -> Any:
+    """Convert a config value to `type`, raising ValueError if it cannot be represented exactly.
+
+    Booleans accept true/false, yes/no, on/off and 1/0 strings; list and tuple wrap a single value.
+    """
+    if type is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    elif type in (list, tuple):
+        return type(value) if isinstance(value, (list, tuple)) else type([value])
+    elif type is int and not isinstance(value, bool):
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str):
+            try:
+                return int(value.strip())
+            except ValueError:
+                pass
+    elif type is not int:
+        if isinstance(value, type):
+            return value
+        try:
+            return type(value)
+        except (TypeError, ValueError):
+            pass
+    name = getattr(type, '__name__', repr(type))
+    raise ValueError(f"Config key '{path}' cannot be converted to {name}. Found: {value!r}")
+
+
+def _flatten(root: str, value: Any, paths: Dict[str, Any]) -> List[str]:
+    """Add `root` and every dotted path below it to `paths`; returns the paths added."""
+    added = []
+    append = added.append
+    ancestors: Set[int] = set()
+
+    def visit(path: str, node: Any) -> None:
+        paths[path] = node
+        append(path)
+        # Exact type checks first: isinstance() against the Mapping ABC is slow for the many leaves.
+        if type(node) in _LEAF_TYPES or not isinstance(node, Mapping) or id(node) in ancestors:
+            return
+        ancestors.add(id(node))
+        for key, child in node.items():
+            visit(f"{path}{PATH_SEPARATOR}{key}", child)
+        ancestors.discard(id(node))
+
+    visit(root, value)
+    return added
+
+
+class ConfigIndex:
+    """Flattened map of every dotted key path in a config to its value.
+
+    Each nested mapping is walked once when the index is built, so a lookup is one dict access
+    whatever the depth. Lists are leaves: 'a.b' returns the whole list. Sections of a LazyConfig are
+    indexed the first time a path under them is looked up, which parses (and validates) the section.
+    Instances are not modified after they are shared, except to add those lazy sections; use
+    apply_changes() to get the index of a reloaded config.
+    """
+
+    def __init__(self, config: Mapping, _paths: Optional[Dict[str, Any]] = None,
+                 _roots: Optional[Dict[str, List[str]]] = None):
+        self.config = config
+        self._lock = threading.Lock()
+        if _paths is not None:
+            self._paths = _paths
+            self._roots = _roots
+            return
+
+        self._paths = {}
+        self._roots = {}
+        items = config.loaded_items() if isinstance(config, LazyConfig) else config
+        for key in list(items):
+            self._roots[key] = _flatten(key, items[key], self._paths)
+
+    def get(self, path: str, default: Any = None, type: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Return the value at `path`, or `default` when it is missing or null.
+
+        With `type` the value is converted (see coerce()); the default is returned as given.
+        """
+        value = self._paths.get(path, _MISSING)
+        if value is _MISSING:
+            value = self._load_root(path)
+        if value is _MISSING or value is None:
+            return default
+        return value if type is None else coerce(path, value, type)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._paths or self._load_root(path) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def paths(self) -> List[str]:
+        """Return every path indexed so far, in config order."""
+        return list(self._paths)
+
+    def apply_changes(self, config: Mapping, changed_keys: Iterable[str]) -> 'ConfigIndex':
+        """Return the index of `config`, re-walking only the top-level keys in `changed_keys`.
+
+        Paths under unchanged keys are carried over from this index, whose values are equal.
+        """
+        paths = dict(self._paths)
+        roots = dict(self._roots)
+        lazy = isinstance(config, LazyConfig)
+        loaded = config.loaded_keys() if lazy else None
+        for key in changed_keys:
+            for path in roots.pop(key, ()):
+                paths.pop(path, None)
+            if key in config and (not lazy or key in loaded):
+                roots[key] = _flatten(key, config[key], paths)
+        return ConfigIndex(config, paths, roots)
+
+    def _load_root(self, path: str) -> Any:
+        """Index the top-level section a path falls under if it is not indexed yet."""
+        root = path.partition(PATH_SEPARATOR)[0]
+        if root in self._roots or root not in self.config:
+            return _MISSING
+        with self._lock:
+            if root not in self._roots:
+                value = self.config[root]
+                # Copied and swapped so concurrent readers never see a dict being resized.
+                paths = dict(self._paths)
+                self._roots[root] = _flatten(root, value, paths)
+                self._paths = paths
+        return self._paths.get(path, _MISSING)
+
+    def __repr__(self):
+        return f"<ConfigIndex paths={len(self._paths)} sections={len(self._roots)}>"
@@ -1,51 +1,164 @@
 from pathlib import Path
-from typing import Union, Optional, Dict
-import yaml
+from typing import TYPE_CHECKING, Any, Union, Optional, Dict, Callable, List, Set, Tuple
 import json
 import logging
-from datetime import date, datetime
+import threading
+from contextlib import nullcontext
 
+from .compiled_config import ARTIFACT_SUFFIX, load_compiled_entry
+from .config_compose import Dependency, compose, has_directives
+from .config_index import ConfigIndex
+from .config_registry import ConfigRegistry, stat_signature
 from .config_validator import ConfigValidator
+from .frozen_config import FrozenConfig, freeze, freeze_changes
+from .lazy_config import LazyConfig
+from .startup_metrics import MetricSink, PhaseTimings
 from .prepare_logger import prepare_logger
-from config_tools.utils import SensitiveDict, CustomJSONEncoder
+from config_tools.utils import SensitiveDict, CustomJSONEncoder, normalize_config
+
+# PyYAML and the optional-feature modules are imported where they are used, so loading a
+# compiled artifact never imports them.
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .config_cache import ConfigCache
+    from .config_fingerprint import ConfigDiff, ConfigFingerprint
+    from .config_watcher import FileWatcher
+    from .memory_profile import MemoryTrace
+    from .secret_providers import SecretProvider
+    from .shared_config import SharedConfigPublisher
+
+_REGISTRY_LOCK = threading.Lock()
+_MISSING = object()
+# Keys the loader inserts itself; they are never diffed against the YAML source on reload.
+_RESERVED_KEYS = frozenset({'logger', 'auth'})
+
+
+def parse_yaml(source: Any) -> Optional[Dict]:
+    """Parse and normalize YAML text, bytes or an open file exactly as ConfigLoader parses uncached files."""
+    import yaml
+
+    try:
+        return normalize_config(yaml.safe_load(source))
+    except yaml.YAMLError as e:
+        raise ValueError(f"Error parsing YAML file: {e}")
+
+
+def _untraced(name: str):
+    """Stand-in for MemoryTrace.phase when memory tracing is off."""
+    return nullcontext()
+
 
 class ConfigLoader:
     """Class to load and validate configuration from YAML files."""
     
-    def __init__(self, config_path: Union[str, Path], config_rules=None, auth_rules=None):
-        """Initialize ConfigLoader and load/validate the configuration."""
-        try:
-            self.config_path: Path = self.ensure_path_object(config_path)
-            self.validate_yaml_path(self.config_path)
-            self.config: Optional[Dict] = self.extract_config_from_yaml(self.config_path)
+    def __init__(self, config_path: Union[str, Path], config_rules=None, auth_rules=None,
+                 cache: Optional['ConfigCache'] = None, async_logging: bool = False, lazy: bool = False,
+                 metric_sinks: Optional[List[MetricSink]] = None, use_compiled: bool = False,
+                 secret_provider: Optional['SecretProvider'] = None, secret_ttl: Optional[float] = None,
+                 prefetched: Optional[Dict[Path, 'Union[bytes, Future[bytes]]']] = None,
+                 trace_memory: bool = False):
+        """Initialize ConfigLoader and load/validate the configuration; see the README for the optional modes."""
+        self._reload_lock = threading.RLock()
+        self._subscribers: List[Callable[[FrozenConfig, Set[str]], None]] = []
+        self._watcher: Optional['FileWatcher'] = None
+        self._snapshot: Optional[FrozenConfig] = None
+        self._fingerprint = None
+        self.timings = PhaseTimings()
+        self._prefetched = dict(prefetched) if prefetched else {}
+        self.dependencies: List[Dependency] = []
+        self.source_signatures: Dict[Path, Optional[tuple]] = {}
+        phase = self.timings.phase
+        self.memory_trace: Optional['MemoryTrace'] = None
+        if trace_memory:
+            from .memory_profile import MemoryTrace
+
+            self.memory_trace = MemoryTrace()
+            self.memory_trace.start()
+        trace = self.memory_trace.phase if self.memory_trace is not None else _untraced
 
+        try:
+            self.cache = cache
+            self.lazy = lazy
+            self.use_compiled = use_compiled
             self.config_rules = config_rules or {}
             self.auth_rules = auth_rules or {}
+            self.secret_provider = secret_provider
+            self.secret_ttl = secret_ttl
+            with phase('resolve_path'):
+                self.config_path: Path = self.ensure_path_object(config_path)
+                self.validate_yaml_path(self.config_path)
+            with trace('parse_yaml'), phase('parse_yaml'):
+                self.config: Optional[Dict] = self.extract_config_from_yaml(self.config_path, main_config=True)
 
-            log_path = self.get_log_path()
-            log_name_prefix = self.get_log_name_prefix()
-            self.logger = prepare_logger(log_path, log_name_prefix)
+            with phase('log_path'):
+                log_path = self.get_log_path()
+                log_name_prefix = self.get_log_name_prefix()
+                max_age_days, max_total_bytes = self.get_log_retention()
+            with phase('prepare_logger'):
+                self.logger = prepare_logger(log_path, log_name_prefix, async_mode=async_logging,
+                                             max_age_days=max_age_days, max_total_bytes=max_total_bytes)
             self.logger.info(f"Logger initialized with log output directory: '{log_path}'")
 
             self.config["logger"] = self.logger
 
             if self.config is not None:
-                self.validate_config(self.config)
+                with trace('validate'), phase('validate'):
+                    self.validate_config(self.config)
                 self.logger.info("Config validated successfully")
 
-            if 'authentication_path' in self.config:
-                auth_path = self.config['authentication_path']
-                self.load_authentication_config(auth_path)
-                self.logger.info(f"Authentication config loaded from '{auth_path}'")
-                self.logger.info(f'Config loaded successfully. Loaded config:\n {json.dumps(self.config, indent=4, cls=CustomJSONEncoder)}')
+            if 'authentication_path' in self.config or secret_provider is not None:
+                auth_path = self.config.get('authentication_path')
+                with trace('load_auth'), phase('load_auth'):
+                    self.load_authentication_config(auth_path)
+                self.logger.info(f"Authentication config loaded from '{auth_path or secret_provider.describe()}'")
+                if isinstance(self.config, LazyConfig):
+                    self.logger.info(f"Config loaded lazily. Top-level keys: {list(self.config)}")
+                else:
+                    self.logger.info(f'Config loaded successfully. Loaded config:\n {json.dumps(self.config, indent=4, cls=CustomJSONEncoder)}')
+
+            with phase('index'):
+                self.index = ConfigIndex(self.config)
 
-        except (FileNotFoundError, IsADirectoryError, ValueError, yaml.YAMLError) as e:
+        except (FileNotFoundError, IsADirectoryError, ValueError) as e:
             raise e
+        finally:
+            self._prefetched = {}
+            if self.memory_trace is not None:
+                self.memory_trace.stop()
+
+        self.logger.debug(f"Config startup timings: {self.timings}")
+        if metric_sinks:
+            self.timings.emit(metric_sinks, tags={'config': self.config_path.name})
+
+    @classmethod
+    def get_or_load(cls, config_path: Union[str, Path], config_rules=None, auth_rules=None, **loader_kwargs) -> 'ConfigLoader':
+        """Return a process-wide shared loader for the path and rules, reloading only when the files change."""
+        return cls.registry().get_or_load(config_path, config_rules=config_rules, auth_rules=auth_rules, **loader_kwargs)
+
+    @classmethod
+    def registry(cls) -> ConfigRegistry:
+        """Return the process-wide registry used by get_or_load, creating it on first use."""
+        registry = cls.__dict__.get('_registry')
+        if registry is None:
+            with _REGISTRY_LOCK:
+                registry = cls.__dict__.get('_registry')
+                if registry is None:
+                    registry = ConfigRegistry(cls)
+                    cls._registry = registry
+        return registry
 
     def get_config(self) -> Dict:
         """Return the loaded configuration."""
         return self.config
 
+    def get(self, path: str, default: Any = None, type: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Return the value at a dotted key path such as 'database.pool.size', or `default` if it is missing or null.
+
+        Lookups are a single dict access at any depth. With `type` the value is converted (int, float,
+        bool, str, list, ...) and a ValueError is raised if it cannot be.
+        """
+        return self.index.get(path, default, type)
+
     def get_log_path(self) -> str:
         """Return the log path, or 'logs/' if not specified or invalid."""
         log_path = self.config.get('log_output_path', 'logs') if self.config else 'logs'
@@ -64,6 +177,19 @@ class ConfigLoader:
         """Return the log name prefix from the config."""
         return self.config.get('log_name_prefix', self.config.get('log name prefix', ''))
 
+    def get_log_retention(self) -> Tuple[Optional[int], Optional[int]]:
+        """Return the log_retention_days and log_max_total_bytes limits, checked before the logger exists.
+
+        Raises ValueError unless each is unset or a positive integer.
+        """
+        limits = []
+        for key in ('log_retention_days', 'log_max_total_bytes'):
+            value = self.config.get(key)
+            if value is not None and (type(value) is not int or value < 1):
+                raise ValueError(f"Config key '{key}' must be a positive integer. Found: {value!r}")
+            limits.append(value)
+        return limits[0], limits[1]
+
     def ensure_path_object(self, path_string_or_path: Union[str, Path]) -> Path:
         """Convert a string or Path object to a normalized Path object."""
         if isinstance(path_string_or_path, str):
@@ -79,34 +205,114 @@ class ConfigLoader:
             raise FileNotFoundError(f"The file '{path}' does not exist.")
         if not path.is_file():
             raise IsADirectoryError(f"'{path}' is a directory, not a file.")
-        if not path.suffix == ".yaml":
+        if not (path.suffix == ".yaml" or (path.suffix == ARTIFACT_SUFFIX and path.stem.endswith(".yaml"))):
             raise ValueError(f"'{path}' is not a YAML file. Must end with .yaml.")
 
-    def extract_config_from_yaml(self, path: Path) -> Optional[Dict]:
-        """Extract and normalize configuration from a YAML file."""
-        try:
+    def extract_config_from_yaml(self, path: Path, main_config: bool = False) -> Optional[Dict]:
+        """Extract and normalize configuration from a YAML file.
+
+        The cache and lazy modes only apply to the main config (main_config=True), never to auth files;
+        for the main config, the files it was composed from become `self.dependencies`.
+        The file's stat signature is recorded in `source_signatures` before it is read.
+        """
+        config, dependencies = self._extract_config(path, main_config)
+        if main_config:
+            self.dependencies = dependencies
+        return config
+
+    def _extract_config(self, path: Path, main_config: bool = False) -> Tuple[Optional[Dict], List[Dependency]]:
+        """Like extract_config_from_yaml(), but return the dependencies instead of recording them."""
+        self.source_signatures[path] = stat_signature(path)
+        # Naming an artifact as the config path is an explicit opt-in of its own.
+        if self.use_compiled or path.suffix == ARTIFACT_SUFFIX:
+            compiled = load_compiled_entry(path)
+            if compiled is not None:
+                return compiled[0], compiled[1] if main_config else []
+            if path.suffix == ARTIFACT_SUFFIX:
+                raise ValueError(f"Compiled config '{path}' is corrupt, stale or from another format version.")
+
+        if main_config and self.lazy:
+            lazy_config = LazyConfig.from_file(path, on_load=self._validate_section)
+            # Composed configs are merged eagerly.
+            if lazy_config is not None and not has_directives(lazy_config):
+                return lazy_config, []
+
+        if main_config and self.cache is not None:
+            return self._extract_config_with_cache(path)
+
+        raw = self._take_prefetched(path)
+        if raw is not None:
+            config = parse_yaml(raw)
+        else:
             with open(path, 'r') as file:
-                config_data = yaml.safe_load(file)
+                config = parse_yaml(file)
+        if main_config:
+            return compose(config, path)
+        return config, []
+
+    def _take_prefetched(self, path: Path) -> Optional[bytes]:
+        """Return and forget prefetched contents for a path, waiting if they are still being read."""
+        if not self._prefetched:
+            return None
+        raw = self._prefetched.pop(path.resolve(), None)
+        if raw is not None and not isinstance(raw, bytes):
+            try:
+                raw = raw.result()
+            except OSError:
+                return None  # Read it again here so the usual error is raised.
+        return raw
+
+    def _extract_config_with_cache(self, path: Path) -> Tuple[Dict, List[Dependency]]:
+        """Return the normalized config from the cache, parsing with the C loader on a miss."""
+        import yaml
+        from .config_cache import fast_safe_load
 
-                if not isinstance(config_data, dict):
-                    raise ValueError("YAML file content is not a valid dictionary.")
+        raw = self._take_prefetched(path)
+        if raw is None:
+            with open(path, 'rb') as file:
+                raw = file.read()
 
-                return {key.strip().replace(" ", "_"): value for key, value in config_data.items()}
+        cached = self.cache.load_entry(path, raw)
+        if cached is not None:
+            return cached
 
+        try:
+            config_data = fast_safe_load(raw)
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML file: {e}")
 
+        config, dependencies = compose(normalize_config(config_data), path)
+        self.cache.store(path, raw, config, dependencies)
+        return config, dependencies
+
     def validate_config(self, config: Dict) -> None:
         """Validate the config using the provided config_rules."""
+        rules = self.config_rules
+        if isinstance(config, LazyConfig):
+            # Only required sections are parsed now; the rest are validated when first accessed.
+            loaded = config.loaded_keys()
+            rules = {key: rule for key, rule in rules.items()
+                     if rule.get('required') or key in loaded or key.partition('.')[0] in loaded}
         try:
-            validator = ConfigValidator(config, self.config_rules)
+            validator = ConfigValidator(config, rules)
             validator.validate()
         except ValueError as e:
             self.logger.error(f"Config validation error: {e}")
             raise ValueError(f"Config validation error: {e}")
 
-    def load_authentication_config(self, auth_path: str) -> None:
+    def _validate_section(self, key: str, value) -> None:
+        """Validate one lazily loaded section against its rules, including dotted rules below it."""
+        rules = self._rules_for(self.config_rules, {key})
+        if rules:
+            ConfigValidator({key: value}, rules).validate()
+
+    def load_authentication_config(self, auth_path: Optional[str]) -> None:
         """Load and validate the authentication config from the specified path."""
+        if self.secret_provider is not None or self.secret_ttl is not None:
+            self.config["auth"] = self._secret_backed_auth(auth_path)
+            self.logger.info("Authentication data validated successfully")
+            return
+
         auth_path_obj = Path(auth_path)
         if not auth_path_obj.exists() or not auth_path_obj.is_file():
             raise FileNotFoundError(f"Authentication path '{auth_path}' does not exist or is not a valid file.")
@@ -119,3 +325,226 @@ class ConfigLoader:
         validator = ConfigValidator(self.config['auth'].get_data(), self.auth_rules)
         validator.validate()
         self.logger.info("Authentication data validated successfully")
+
+    def _secret_backed_auth(self, auth_path: Optional[str]) -> SensitiveDict:
+        """Return a SensitiveDict that reads through a SecretCache; the first fetch is validated here."""
+        from .secret_providers import FileSecretProvider, SecretCache
+
+        provider = self.secret_provider
+        if provider is None:
+            if not auth_path:
+                raise ValueError("secret_ttl requires 'authentication_path' in the config or a secret_provider.")
+            provider = FileSecretProvider(auth_path, use_compiled=self.use_compiled)
+        cache_kwargs = {} if self.secret_ttl is None else {'ttl': self.secret_ttl}
+        cache = SecretCache(provider, validator=lambda data: ConfigValidator(data, self.auth_rules).validate(),
+                            logger=self.logger, **cache_kwargs)
+        cache.refresh()
+        return SensitiveDict(source=cache)
+
+    def memory_breakdown(self) -> Dict:
+        """Return the deep size of each top-level config key, counting shared objects once."""
+        from .memory_profile import memory_breakdown
+
+        return memory_breakdown(self.config)
+
+    def memory_report(self, path: Optional[Union[str, Path]] = None) -> Dict:
+        """Return the key breakdown and any load-time tracemalloc phases, written as JSON to `path` if given."""
+        from .memory_profile import write_report
+
+        report = {
+            'config_path': str(self.config_path),
+            'breakdown': self.memory_breakdown(),
+            'trace': self.memory_trace.as_dict() if self.memory_trace is not None else None,
+        }
+        if path is not None:
+            write_report(report, path)
+        return report
+
+    def fingerprint(self, secret_key: Optional[bytes] = None) -> 'ConfigFingerprint':
+        """Return sha256 digests of each top-level section and of the whole config (see config_fingerprint).
+
+        Auth data is left out unless a secret_key is given, in which case it is included as an HMAC.
+        The secret-free fingerprint is computed once per loaded or reloaded config.
+        """
+        from .config_fingerprint import fingerprint_config
+
+        config = self.config
+        if secret_key is not None:
+            return fingerprint_config(config, secret_key)
+        cached = self._fingerprint
+        if cached is None or cached[0] is not config:
+            cached = (config, fingerprint_config(config))
+            self._fingerprint = cached
+        return cached[1]
+
+    def diff(self, other: 'ConfigLoader', secret_key: Optional[bytes] = None) -> 'ConfigDiff':
+        """Return the dotted paths added, removed or changed in `other`'s config relative to this one.
+
+        Sections with equal fingerprints are skipped without being compared.
+        """
+        from .config_fingerprint import diff_configs
+
+        return diff_configs(self.config, other.config, secret_key,
+                            self.fingerprint(secret_key), other.fingerprint(secret_key))
+
+    def snapshot(self) -> FrozenConfig:
+        """Return a deeply frozen copy of the current config; reloads swap in a new one atomically.
+
+        The snapshot is built once per config version and can be shared between threads without copying.
+        With lazy=True this parses and validates every section that was not loaded yet.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._reload_lock:
+                if self._snapshot is None:
+                    self._snapshot = freeze(self.config)
+                snapshot = self._snapshot
+        return snapshot
+
+    def publish_shared(self, publisher: Optional['SharedConfigPublisher'] = None,
+                       include_secrets: bool = False) -> 'SharedConfigPublisher':
+        """Publish the validated config to shared memory for worker processes and return the publisher.
+
+        Workers attach with SharedConfigReader(publisher.name). Authentication data is left out
+        unless include_secrets=True.
+        """
+        from .shared_config import SharedConfigPublisher
+
+        publisher = publisher or SharedConfigPublisher()
+        publisher.publish(self.config, include_secrets=include_secrets)
+        self.logger.info(f"Config version {publisher.version} published to shared memory '{publisher.name}'")
+        return publisher
+
+    def subscribe(self, callback: Callable[[FrozenConfig, Set[str]], None]) -> None:
+        """Register a callback invoked with (snapshot, changed_keys) after each successful reload."""
+        with self._reload_lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[FrozenConfig, Set[str]], None]) -> None:
+        """Remove a previously registered reload callback."""
+        with self._reload_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start_reload(self, interval: float = 1.0, use_inotify: bool = True) -> None:
+        """Start watching the config and authentication files and reload them when they change."""
+        with self._reload_lock:
+            if self._watcher is not None:
+                return
+            from .config_watcher import FileWatcher
+
+            self._watcher = FileWatcher(self._watched_paths(), lambda changed: self.reload(),
+                                        interval=interval, use_inotify=use_inotify,
+                                        on_error=lambda e: self.logger.error(f"Config reload watcher error: {e}"))
+            self._watcher.start()
+            self.logger.info(f"Config reload enabled using {self._watcher.backend} watcher")
+
+    def stop_reload(self) -> None:
+        """Stop the background file watcher."""
+        with self._reload_lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.stop()
+
+    def close(self) -> None:
+        """Stop the reload watcher and the background secret refresh; the loaded config stays readable."""
+        self.stop_reload()
+        auth = self.config.get('auth') if self.config else None
+        if isinstance(auth, SensitiveDict) and auth.source is not None:
+            auth.source.close()
+
+    def reload(self) -> bool:
+        """Re-read the config files, revalidate only changed keys and swap in the new config.
+
+        Returns True if a new config was installed. On any error the last good config is kept.
+        With lazy=True every section of the old and new file is parsed to find the changed keys.
+        """
+        with self._reload_lock:
+            try:
+                # Dependencies are only recorded once the new config is installed below.
+                new_config, dependencies = self._extract_config(self.config_path, main_config=True)
+                changed_keys = self._changed_keys(self.config, new_config)
+
+                ConfigValidator(new_config, self._rules_for(self.config_rules, changed_keys)).validate()
+
+                auth = self._reload_authentication(new_config, changed_keys)
+            except Exception as e:
+                # Any error, including a TypeError from a validator given a wrong-typed value, keeps the last good config.
+                self.logger.error(f"Config reload failed, keeping last good config: {e}")
+                return False
+
+            if not changed_keys and auth is self.config.get('auth'):
+                self.dependencies = dependencies  # Same config, possibly rebuilt from edited fragments.
+                return False
+
+            new_config['logger'] = self.logger
+            if auth is not None:
+                new_config['auth'] = auth
+                if auth is not self.config.get('auth'):
+                    changed_keys.add('auth')
+
+            # Unchanged sections keep their frozen values, so a reload only copies what changed.
+            snapshot = freeze_changes(self._snapshot, new_config, changed_keys)
+            index = self.index.apply_changes(new_config, changed_keys)
+            self.config = new_config
+            self.dependencies = dependencies
+            self.index = index
+            self._snapshot = snapshot
+            if self._watcher is not None:
+                self._watcher.set_paths(self._watched_paths())
+            subscribers = list(self._subscribers)
+
+        self.logger.info(f"Config reloaded. Changed keys: {sorted(changed_keys)}")
+        for callback in subscribers:
+            try:
+                callback(snapshot, changed_keys)
+            except Exception as e:
+                self.logger.error(f"Config reload subscriber {callback!r} failed: {e}")
+        return True
+
+    def _watched_paths(self) -> List[Path]:
+        """Return the files the reload watcher should observe."""
+        paths = [self.config_path] + [Path(dependency[0]) for dependency in self.dependencies]
+        if self.config.get('authentication_path'):
+            paths.append(Path(self.config['authentication_path']))
+        return paths
+
+    def _reload_authentication(self, new_config: Dict, changed_keys: Set[str]) -> Optional[SensitiveDict]:
+        """Return the auth data for a reloaded config, reusing the current SensitiveDict if nothing changed."""
+        current = self.config.get('auth')
+        auth_path = new_config.get('authentication_path')
+        if current is not None and current.source is not None:
+            # Secrets rotate through the cache; a changed file only triggers an early refresh.
+            if self.secret_provider is None and 'authentication_path' in changed_keys:
+                current.source.close()
+                return self._secret_backed_auth(auth_path)
+            current.source.refresh()
+            return current
+        if not auth_path:
+            return None
+
+        auth_path_obj = Path(auth_path)
+        if not auth_path_obj.exists() or not auth_path_obj.is_file():
+            raise FileNotFoundError(f"Authentication path '{auth_path}' does not exist or is not a valid file.")
+
+        new_auth = self.extract_config_from_yaml(auth_path_obj) or {}
+        if current is None or 'authentication_path' in changed_keys:
+            auth_changed = set(self.auth_rules)
+        else:
+            auth_changed = self._changed_keys(current.get_data(), new_auth)
+            if not auth_changed:
+                return current
+
+        ConfigValidator(new_auth, self._rules_for(self.auth_rules, auth_changed)).validate()
+        return SensitiveDict(new_auth)
+
+    @staticmethod
+    def _changed_keys(old: Dict, new: Dict) -> Set[str]:
+        """Return top-level keys that were added, removed or whose values differ."""
+        return {key for key in old.keys() | new.keys()
+                if key not in _RESERVED_KEYS and old.get(key, _MISSING) != new.get(key, _MISSING)}
+
+    @staticmethod
+    def _rules_for(rules: Dict, keys: Set[str]) -> Dict:
+        """Return the subset of rules that apply to the given top-level keys, including dotted rules below them."""
+        return {key: rule for key, rule in rules.items() if key in keys or key.partition('.')[0] in keys}
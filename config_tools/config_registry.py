@@ -0,0 +1,120 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from .config_compose import Dependency, dependencies_fresh
+
+
+def stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return a cheap change signature for a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def kwargs_key(loader_kwargs: Dict[str, Any]) -> Tuple:
+    """Return a hashable key for loader keyword arguments; unhashable values are keyed by identity."""
+    key = []
+    for name, value in sorted(loader_kwargs.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = id(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+class _RegistryEntry:
+    """A registry slot; its lock makes concurrent requests for the same key wait on a single load."""
+
+    __slots__ = ('lock', 'loader', 'signatures', 'dependencies', 'config_rules', 'auth_rules')
+
+    def __init__(self, config_rules, auth_rules):
+        self.lock = threading.Lock()
+        self.loader = None
+        self.signatures: Dict[Path, Optional[Tuple[int, int, int]]] = {}
+        self.dependencies: Sequence[Dependency] = ()
+        self.config_rules = config_rules
+        self.auth_rules = auth_rules
+
+    def is_fresh(self) -> bool:
+        """Return True if a loader is held and none of its source files changed since it was loaded."""
+        if self.loader is None:
+            return False
+        return (all(stat_signature(path) == signature for path, signature in self.signatures.items())
+                and dependencies_fresh(self.dependencies))
+
+
+class ConfigRegistry:
+    """Thread-safe, size-bounded LRU registry of loaded and validated ConfigLoader instances.
+
+    Callers own the loaders they are handed: the registry never closes a loader it evicts, invalidates or
+    replaces, so a caller still holding one keeps its reload watcher and secret refresh running.
+    """
+
+    def __init__(self, loader_factory: Callable[..., Any], maxsize: int = 32):
+        """Initialize the registry with the callable used to build loaders on a miss."""
+        if maxsize < 1:
+            raise ValueError(f"Registry maxsize must be at least 1. Found: {maxsize}")
+        self.loader_factory = loader_factory
+        self.maxsize = maxsize
+        self.loads = 0
+        self._entries: "OrderedDict[Tuple, _RegistryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, config_path, config_rules=None, auth_rules=None, **loader_kwargs):
+        """Return a shared loader for the path and rules, loading it at most once per change of the files."""
+        resolved = Path(config_path).resolve()
+        key = (str(resolved), id(config_rules), id(auth_rules), kwargs_key(loader_kwargs))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.config_rules is not config_rules or entry.auth_rules is not auth_rules:
+                entry = _RegistryEntry(config_rules, auth_rules)
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+
+        # Only the entry lock is held while loading, so loads of different keys proceed in parallel.
+        with entry.lock:
+            if entry.is_fresh():
+                return entry.loader
+
+            signatures = {resolved: stat_signature(resolved)}
+            loader = self.loader_factory(resolved, config_rules=config_rules, auth_rules=auth_rules, **loader_kwargs)
+            # The loader records each file's signature before reading it, so an edit made while it was
+            # loading is never mistaken for the version it loaded.
+            signatures.update(getattr(loader, 'source_signatures', {}))
+            auth_path = loader.config.get('authentication_path') if loader.config else None
+            if auth_path and Path(auth_path) not in signatures:
+                signatures[Path(auth_path)] = stat_signature(Path(auth_path))
+
+            entry.loader = loader
+            entry.signatures = signatures
+            entry.dependencies = list(getattr(loader, 'dependencies', ()))
+            with self._lock:
+                self.loads += 1
+            return loader
+
+    def invalidate(self, config_path=None) -> None:
+        """Drop the entries for a path, or every entry when no path is given."""
+        with self._lock:
+            if config_path is None:
+                self._entries.clear()
+                return
+            resolved = str(Path(config_path).resolve())
+            for key in [key for key in self._entries if key[0] == resolved]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond maxsize; callers must hold the registry lock."""
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -2,6 +2,10 @@ from typing import Dict, Any, Optional, Union, List
 from datetime import datetime, date, timedelta
 import re
 
+from .config_index import resolve_path
+
+BEARER_TOKEN_PATTERN = re.compile(r'^Bearer [a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$')
+
 class ConfigValidator:
     """Class to validate configuration against a set of rules."""
     
@@ -10,15 +14,28 @@ class ConfigValidator:
         self.config = config
         self.rules = rules
 
-    def validate(self) -> None:
-        """Run validation on the config."""
+    def validate(self, collect_all: bool = False) -> None:
+        """Run validation on the config.
+
+        Rule keys may be dotted paths ('database.pool.size') that target nested values.
+        With collect_all=True every rule is checked and a single ValueError lists all violations.
+        """
+        errors: List[str] = []
         for key, rule in self.rules.items():
-            value = self.config.get(key)
-            if 'required' in rule and rule['required'] and value is None:
-                raise ValueError(f"Missing required config key: '{key}'")
-            
-            if value is not None and 'validator' in rule:
-                rule['validator'](key, value)
+            value = resolve_path(self.config, key)
+            try:
+                if 'required' in rule and rule['required'] and value is None:
+                    raise ValueError(f"Missing required config key: '{key}'")
+
+                if value is not None and 'validator' in rule:
+                    rule['validator'](key, value)
+            except ValueError as e:
+                if not collect_all:
+                    raise
+                errors.append(str(e))
+
+        if errors:
+            raise ValueError("; ".join(errors))
 
     @staticmethod
     def validate_https_url(key: str, value: str) -> None:
@@ -53,10 +70,8 @@ class ConfigValidator:
         """Ensure that a string is a valid bearer token."""
         if not isinstance(value, str) or not value.strip():
             raise ValueError(f"Config key '{key}' must be a non-empty string. Found: '{value}'")
-        
-        bearer_token_pattern = re.compile(r'^Bearer [a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$')
-        
-        if not bearer_token_pattern.fullmatch(value):
+
+        if not BEARER_TOKEN_PATTERN.fullmatch(value):
             raise ValueError(f"Auth Config key '{key}' must be a Bearer Token in the format 'Bearer <UUID>'. Found: '{value}'")
 
     @staticmethod
@@ -79,6 +94,8 @@ class ConfigValidator:
         elif not isinstance(value, list) or not all(isinstance(item, str) for item in value):
             raise ValueError(f"Config key '{key}' must be a string or a list of strings. Found: {value}")
         
+        # One set build makes the whole check O(n + m) instead of scanning target_list per item.
+        allowed = set(target_list)
         for item in value:
-            if item not in target_list:
+            if item not in allowed:
                 raise ValueError(f"Config key '{key}' contains an invalid value '{item}'. Allowed values are: {target_list}")
@@ -0,0 +1,175 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from .config_registry import stat_signature
+
+# inotify(7) event masks; editors commonly save by writing a temp file and renaming it over the original.
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_inotify():
+    """Return libc with inotify bound, or None when the platform does not provide it."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """Background watcher that calls `on_change` with the set of changed files.
+
+    Uses inotify on Linux and falls back to polling stat signatures elsewhere. Exceptions raised by
+    `on_change` are passed to `on_error` (logged by default) and never stop the watcher.
+    """
+
+    def __init__(self, paths: Iterable[Path], on_change: Callable[[Set[Path]], None],
+                 interval: float = 1.0, debounce: float = 0.05, use_inotify: bool = True,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """Initialize the watcher; call start() to begin watching."""
+        self.on_change = on_change
+        self.on_error = on_error
+        self.interval = interval
+        self.debounce = debounce
+        self._paths: Dict[Path, Optional[Tuple[int, int, int]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._libc = _load_inotify() if use_inotify else None
+        self._inotify_fd: Optional[int] = None
+        self._watched_dirs: Dict[int, Path] = {}
+        self.set_paths(paths)
+
+    @property
+    def backend(self) -> str:
+        """Return 'inotify' or 'polling'."""
+        return 'inotify' if self._inotify_fd is not None else 'polling'
+
+    def set_paths(self, paths: Iterable[Path]) -> None:
+        """Replace the set of watched files."""
+        with self._lock:
+            self._paths = {Path(path).resolve(): stat_signature(Path(path)) for path in paths}
+            if self._inotify_fd is not None:
+                self._add_directory_watches()
+
+    def start(self) -> None:
+        """Start the watcher thread."""
+        if self._thread is not None:
+            return
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                self._inotify_fd = fd
+                with self._lock:
+                    self._add_directory_watches()
+        self._stop.clear()
+        target = self._run_inotify if self._inotify_fd is not None else self._run_polling
+        self._thread = threading.Thread(target=target, name='config-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify descriptor."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+            self._watched_dirs = {}
+
+    def _add_directory_watches(self) -> None:
+        """Watch the parent directory of each file so rename-over saves are seen; callers hold the lock."""
+        known = set(self._watched_dirs.values())
+        for directory in {path.parent for path in self._paths}:
+            if directory in known:
+                continue
+            wd = self._libc.inotify_add_watch(self._inotify_fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self._watched_dirs[wd] = directory
+
+    def _changed_paths(self) -> Set[Path]:
+        """Return files whose stat signature changed since the last check and record the new ones."""
+        changed = set()
+        with self._lock:
+            for path, signature in self._paths.items():
+                current = stat_signature(path)
+                if current != signature:
+                    self._paths[path] = current
+                    changed.add(path)
+        return changed
+
+    def _notify(self, changed: Set[Path]) -> None:
+        if not changed:
+            return
+        try:
+            self.on_change(changed)
+        except Exception as e:
+            if self.on_error is not None:
+                try:
+                    self.on_error(e)
+                    return
+                except Exception:
+                    pass
+            logging.getLogger(__name__).exception(f"Config watcher callback failed for {sorted(map(str, changed))}")
+
+    def _run_polling(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._notify(self._changed_paths())
+
+    def _run_inotify(self) -> None:
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._inotify_fd], [], [], self.interval)
+            if not readable:
+                continue
+            if not self._drain_events():
+                continue
+            # Let a burst of writes settle, then drain it so one save triggers one reload.
+            if self._stop.wait(self.debounce):
+                break
+            self._drain_events()
+            self._notify(self._changed_paths())
+
+    def _drain_events(self) -> bool:
+        """Read pending inotify events and return True if any concern a watched file."""
+        relevant = False
+        while True:
+            try:
+                data = os.read(self._inotify_fd, 65536)
+            except BlockingIOError:
+                return relevant
+            except OSError:
+                return relevant
+            if not data:
+                return relevant
+            with self._lock:
+                offset = 0
+                while offset < len(data):
+                    wd, _, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                    offset += EVENT_HEADER.size
+                    name = data[offset:offset + name_len].rstrip(b'\0')
+                    offset += name_len
+                    directory = self._watched_dirs.get(wd)
+                    if directory is not None and directory / os.fsdecode(name) in self._paths:
+                        relevant = True
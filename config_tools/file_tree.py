@@ -0,0 +1,203 @@
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional, TextIO, Union
+
+_LEADING_DIGITS = re.compile(r'\d+')
+# Directories shallower than this are scanned as separate thread-pool tasks; deeper ones inline.
+DEFAULT_PARALLEL_DEPTH = 2
+WRITE_BUFFER_SIZE = 1 << 20
+
+_Item = Union[str, 'Future[List[_Item]]']
+
+
+def extract_number(entry: str) -> float:
+    """Return the leading number of a name, or infinity so unnumbered names sort last."""
+    if entry[:1].isdigit():
+        match = _LEADING_DIGITS.match(entry)
+        if match:
+            return int(match.group())
+    return float('inf')
+
+
+def _entry_sort_key(entry: os.DirEntry):
+    return extract_number(entry.name), entry.name
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    # DirEntry caches the type from the directory listing; like os.path.isdir, errors mean "not a directory".
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+class TreeFilter:
+    """Exclusion rules compiled once: prefix/suffix tuples for str.startswith/endswith and a set of folder names.
+
+    Folder names are excluded for every entry; prefixes, suffixes and filetypes only apply to files.
+    """
+
+    def __init__(self, exclude_prefixes: Optional[Iterable[str]] = None, exclude_suffixes: Optional[Iterable[str]] = None,
+                 exclude_filetypes: Optional[Iterable[str]] = None, exclude_folders: Optional[Iterable[str]] = None):
+        self.prefixes = tuple(exclude_prefixes or ())
+        # Filetypes are matched as plain suffixes, so both lists collapse into one endswith() call.
+        self.suffixes = tuple(exclude_suffixes or ()) + tuple(exclude_filetypes or ())
+        self.folders = frozenset(exclude_folders or ())
+
+    def excludes_file(self, name: str) -> bool:
+        return name.startswith(self.prefixes) or name.endswith(self.suffixes)
+
+
+class _TreeScanner:
+    """Renders directories into output chunks, handing shallow subdirectories to a thread pool."""
+
+    def __init__(self, tree_filter: TreeFilter, executor: Optional[ThreadPoolExecutor], parallel_depth: int):
+        self.filter = tree_filter
+        self.executor = executor
+        self.parallel_depth = parallel_depth
+
+    def scan(self, path: str, prefix: str, depth: int) -> List[_Item]:
+        """Return the rendered lines of a directory as strings, with futures standing in for subtrees
+        that are still being scanned. Tasks never wait on other tasks, so the pool cannot deadlock."""
+        try:
+            with os.scandir(path) as iterator:
+                entries = [entry for entry in iterator if entry.name not in self.filter.folders]
+        except PermissionError:
+            return [f"{prefix}├── [Permission Denied]\n"]
+        entries.sort(key=_entry_sort_key)
+
+        items: List[_Item] = []
+        lines: List[str] = []
+        excludes_file = self.filter.excludes_file
+        parallel = self.executor is not None and depth < self.parallel_depth
+        last = len(entries) - 1
+        for i, entry in enumerate(entries):
+            # The connector is chosen before file exclusions apply, as in the original script.
+            if i == last:
+                connector, child_prefix = "└──", prefix + "    "
+            else:
+                connector, child_prefix = "├──", prefix + "│   "
+            if _is_dir(entry):
+                lines.append(f"{prefix}{connector} {entry.name}/\n")
+                if parallel:
+                    items.append(''.join(lines))
+                    lines = []
+                    items.append(self.executor.submit(self.scan, entry.path, child_prefix, depth + 1))
+                else:
+                    lines.extend(self.scan(entry.path, child_prefix, depth + 1))
+            elif not excludes_file(entry.name):
+                lines.append(f"{prefix}{connector} {entry.name}\n")
+        if lines:
+            items.append(''.join(lines))
+        return items
+
+
+def _drain(items: List[_Item]) -> Iterator[str]:
+    for item in items:
+        if isinstance(item, str):
+            yield item
+        else:
+            yield from _drain(item.result())
+
+
+def iter_file_tree(target_path: str, tree_filter: Optional[TreeFilter] = None, workers: Optional[int] = None,
+                   parallel_depth: int = DEFAULT_PARALLEL_DEPTH) -> Iterator[str]:
+    """Yield the tree below target_path as text chunks in deterministic (sorted) order.
+
+    Subtrees are scanned concurrently by `workers` threads (the ThreadPoolExecutor default when None,
+    sequentially when 0); chunks are yielded as soon as everything before them is known.
+    """
+    tree_filter = tree_filter or TreeFilter()
+    if workers == 0:
+        yield from _drain(_TreeScanner(tree_filter, None, parallel_depth).scan(target_path, "│   ", 0))
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='file-tree') as executor:
+        yield from _drain(_TreeScanner(tree_filter, executor, parallel_depth).scan(target_path, "│   ", 0))
+
+
+def write_file_tree(target_path: str, stream: TextIO, tree_filter: Optional[TreeFilter] = None,
+                    workers: Optional[int] = None, parallel_depth: int = DEFAULT_PARALLEL_DEPTH) -> None:
+    """Write the root line and the tree below target_path to a text stream."""
+    stream.write(f"{os.path.basename(target_path)}/\n")
+    for chunk in iter_file_tree(target_path, tree_filter, workers, parallel_depth):
+        stream.write(chunk)
+
+
+def delete_existing_file_trees(output_prefix: str) -> None:
+    """Delete existing file trees matching the output_path prefix."""
+    directory = os.path.dirname(output_prefix) or "."
+    base_name = os.path.basename(output_prefix)
+    for file_name in os.listdir(directory):
+        if file_name.startswith(base_name) and file_name.endswith('.txt'):
+            file_path = os.path.join(directory, file_name)
+            try:
+                os.remove(file_path)
+                print(f"Deleted existing file: {file_path}")
+            except OSError as e:
+                print(f"Error deleting file {file_path}: {e}")
+
+
+def _quoted(values: Iterable[str]) -> str:
+    return ', '.join(f"'{value}'" for value in values)
+
+
+def generate_file_tree(target_path, output_path, exclude_prefixes=None, exclude_suffixes=None, exclude_filetypes=None,
+                       exclude_folders=None, delete_existing=False, workers: Optional[int] = None) -> str:
+    """Write the file tree of target_path to '<output_path>_<timestamp>.txt' and return that file name."""
+    exclude_prefixes = exclude_prefixes or []
+    exclude_suffixes = exclude_suffixes or []
+    exclude_filetypes = exclude_filetypes or []
+    exclude_folders = exclude_folders or []
+
+    if delete_existing:
+        delete_existing_file_trees(output_path)
+
+    timestamp = datetime.now(timezone.utc).strftime('%y%m%dZ%H%M%S')
+    output_file = f"{output_path}_{timestamp}.txt"
+    tree_filter = TreeFilter(exclude_prefixes, exclude_suffixes, exclude_filetypes, exclude_folders)
+
+    with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as file:
+        file.write(f"Target Path: {target_path}\n")
+        file.write(f"Output Path: {output_file}\n")
+        file.write(f"Exclude Prefixes: {_quoted(exclude_prefixes)}\n")
+        file.write(f"Exclude Suffixes: {_quoted(exclude_suffixes)}\n")
+        file.write(f"Exclude Filetypes: {_quoted(exclude_filetypes)}\n")
+        file.write(f"Exclude Folders: {_quoted(exclude_folders)}\n\n")
+        write_file_tree(target_path, file, tree_filter, workers)
+    return output_file
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; writes the tree to a timestamped file, or to stdout with --stdout."""
+    parser = argparse.ArgumentParser(description="Write a sorted text tree of a directory.")
+    parser.add_argument('target_path')
+    parser.add_argument('output_path', nargs='?', default='file_tree',
+                        help="Output prefix; '_<timestamp>.txt' is appended (default: file_tree)")
+    parser.add_argument('--exclude-prefix', action='append', default=[], dest='exclude_prefixes')
+    parser.add_argument('--exclude-suffix', action='append', default=[], dest='exclude_suffixes')
+    parser.add_argument('--exclude-filetype', action='append', default=[], dest='exclude_filetypes')
+    parser.add_argument('--exclude-folder', action='append', default=[], dest='exclude_folders')
+    parser.add_argument('--delete-existing', action='store_true', help="Delete earlier trees with the same prefix")
+    parser.add_argument('--workers', type=int, default=None, help="Scanner threads (0 = sequential)")
+    parser.add_argument('--stdout', action='store_true', help="Print the tree instead of writing a file")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.target_path):
+        print(f"Target path '{args.target_path}' is not a directory.", file=sys.stderr)
+        return 1
+    if args.stdout:
+        tree_filter = TreeFilter(args.exclude_prefixes, args.exclude_suffixes, args.exclude_filetypes, args.exclude_folders)
+        write_file_tree(args.target_path, sys.stdout, tree_filter, args.workers)
+        return 0
+    output_file = generate_file_tree(args.target_path, args.output_path, args.exclude_prefixes, args.exclude_suffixes,
+                                     args.exclude_filetypes, args.exclude_folders, args.delete_existing, args.workers)
+    print(f"File tree written to '{output_file}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
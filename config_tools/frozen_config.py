@@ -0,0 +1,132 @@
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .utils import SensitiveDict
+
+# Key layouts shared by every FrozenConfig with the same keys in the same order, so repeated
+# record-like sections (lists of same-shaped dicts, per-tenant tables) store their keys only once.
+_shapes: Dict[Tuple[str, ...], Dict[str, int]] = {}
+_shapes_lock = threading.Lock()
+MAX_SHARED_SHAPES = 65536
+
+
+def _shape_for(keys: Tuple[str, ...]) -> Dict[str, int]:
+    """Return the shared key-to-position index for a key layout."""
+    shape = _shapes.get(keys)
+    if shape is None:
+        shape = {key: position for position, key in enumerate(keys)}
+        with _shapes_lock:
+            if len(_shapes) < MAX_SHARED_SHAPES:
+                shape = _shapes.setdefault(keys, shape)
+    return shape
+
+
+def freeze(value: Any) -> Any:
+    """Return a deeply immutable copy of a config value.
+
+    Mappings become FrozenConfig, lists and tuples become tuples, sets become frozensets,
+    and SensitiveDict contents are frozen inside a new SensitiveDict
+    (read-through ones, backed by a secret source, are kept as-is). Other values are returned as-is.
+    """
+    if isinstance(value, FrozenConfig):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenConfig(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, SensitiveDict):
+        if value.source is not None:
+            return value  # Read-through secrets must keep rotating, so they are shared, not copied.
+        return SensitiveDict(freeze(value.get_data()))
+    return value
+
+
+def freeze_changes(previous: Optional['FrozenConfig'], data: Mapping, changed_keys: Iterable[Any]) -> 'FrozenConfig':
+    """Freeze a new version of a config, reusing `previous`'s frozen values for keys not in `changed_keys`."""
+    if previous is None:
+        return freeze(data)
+    changed_keys = set(changed_keys)
+    values = {}
+    for key in data:
+        if key in changed_keys or key not in previous:
+            values[key] = freeze(data[key])
+        else:
+            values[key] = previous[key]
+    return FrozenConfig._from_frozen(values)
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen value, with plain dicts and lists."""
+    if isinstance(value, FrozenConfig):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    if isinstance(value, SensitiveDict):
+        if value.source is not None:
+            return value
+        return SensitiveDict(thaw(value.get_data()))
+    return value
+
+
+class FrozenConfig(Mapping):
+    """Immutable, compact config mapping that is safe to share between threads without copies or locks.
+
+    Values are reachable by key or, when the key is a valid identifier that does not clash with a
+    Mapping method, as attributes: `snapshot.retry_attempts`.
+    """
+
+    __slots__ = ('_index', '_values')
+
+    def __init__(self, data: Mapping):
+        """Freeze a mapping recursively; string keys are interned."""
+        keys = tuple(sys.intern(key) if isinstance(key, str) else key for key in data)
+        object.__setattr__(self, '_index', _shape_for(keys))
+        object.__setattr__(self, '_values', tuple(freeze(data[key]) for key in data))
+
+    @classmethod
+    def _from_frozen(cls, values: Dict[Any, Any]) -> 'FrozenConfig':
+        """Wrap values that are already frozen without copying them again."""
+        config = object.__new__(cls)
+        keys = tuple(sys.intern(key) if isinstance(key, str) else key for key in values)
+        object.__setattr__(config, '_index', _shape_for(keys))
+        object.__setattr__(config, '_values', tuple(values.values()))
+        return config
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._values[self._index[key]]
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[self._index[name]]
+        except KeyError:
+            raise AttributeError(f"FrozenConfig has no key or attribute '{name}'") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("FrozenConfig is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("FrozenConfig is immutable")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self):
+        return f"FrozenConfig({dict(zip(self._index, self._values))!r})"
+
+    def __reduce__(self):
+        # The values are frozen already, so unpickling rebuilds the mapping without freezing them again.
+        return _unpickle_frozen, (dict(zip(self._index, self._values)),)
+
+
+def _unpickle_frozen(values: Dict[Any, Any]) -> FrozenConfig:
+    return FrozenConfig._from_frozen(values)
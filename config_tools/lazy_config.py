@@ -0,0 +1,253 @@
+import re
+import threading
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .config_registry import stat_signature
+from .utils import normalize_config, normalize_nested
+
+# A block-style top-level key, matched right after a newline: a line that starts in column 0 and is not
+# a comment, sequence item, flow collection, document marker, directive, tag, anchor or alias, up to
+# the first ': ' (or ':' at end of line). Anchoring on a literal '\n' lets the regex engine skip
+# straight to line starts instead of trying every byte.
+TOP_LEVEL_KEY_PATTERN = re.compile(rb'\n(?![ \t\r\n#\-%{\[?&*!|>]|\.\.\.)([^\r\n]+?)[ \t]*:(?=[ \t\r\n]|\Z)')
+DOCUMENT_MARKER_PATTERN = re.compile(rb'\n(?:---|\.\.\.)')
+# Any line starting in column 0 that is not blank, a comment or an item of an indentless sequence. Each one
+# must be a key matched above; anything else (explicit '? key' entries, anchors, tags...) cannot be indexed.
+COLUMN_ZERO_LINE_PATTERN = re.compile(rb'\n(?!\Z|[ \t\r\n#]|-(?:[ \t\r\n]|\Z))')
+UTF8_BOM = b'\xef\xbb\xbf'
+# A value that opens a quoted scalar or flow collection on its key's line. If it is not closed on that
+# line, its continuation lines may start in column 0 and look like keys themselves.
+OPEN_VALUE_PATTERN = re.compile(rb'[ \t]*(?:"(?:[^"\\\r\n]|\\.)*("?)|\'(?:[^\'\r\n]|\'\')*(\'?)|([\[{]))')
+SCAN_CHUNK_SIZE = 1 << 20
+
+
+def _safe_load(raw: bytes) -> Any:
+    # The same loader as eager parsing, so a file loads identically with and without lazy=True.
+    # Deferred so importing this module does not pull in PyYAML.
+    import yaml
+    return yaml.safe_load(raw)
+
+
+def normalize_key(raw_key: bytes) -> str:
+    """Return the normalized form of a raw top-level YAML key, unquoting it if needed."""
+    if raw_key[:1] in (b'"', b"'"):
+        key = _safe_load(raw_key)
+    else:
+        key = raw_key.decode('utf-8')
+    return key.strip().replace(" ", "_")
+
+
+def _first_content_offset(block: bytes) -> Optional[int]:
+    """Return the offset of the first line that is neither blank nor a comment."""
+    pos = 0
+    while pos < len(block):
+        newline = block.find(b'\n', pos)
+        line_end = newline if newline != -1 else len(block)
+        stripped = block[pos:line_end].strip()
+        if stripped and not stripped.startswith(b'#'):
+            return pos
+        if newline == -1:
+            break
+        pos = newline + 1
+    return None
+
+
+def _value_continues(line: bytes) -> bool:
+    """Return True if the value after a top-level key may continue on the following lines."""
+    match = OPEN_VALUE_PATTERN.match(line)
+    if match is None:
+        return False
+    if match.group(3):
+        # Flow collections are only trusted when their brackets balance on the key's own line.
+        return line.count(b'[') + line.count(b'{') != line.count(b']') + line.count(b'}')
+    return not (match.group(1) or match.group(2))
+
+
+def index_top_level_keys(path: Path, chunk_size: int = SCAN_CHUNK_SIZE) -> Optional[Dict[str, Tuple[int, int]]]:
+    """Map each normalized top-level key to the byte range of its section in one scan of the file.
+
+    The file is scanned in fixed-size chunks, so memory use does not depend on the file size.
+    Returns None when the document is not a plain block mapping (flow style, multiple documents,
+    directives, explicit '?' keys, a byte order mark) or a top-level value spans lines on its own
+    (multi-line quoted scalars, flow collections), and must be parsed eagerly instead.
+    """
+    import yaml
+
+    starts = []
+    first_content = None
+    carry = b''
+    offset = 0
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            block = carry + chunk
+            block_offset = offset - len(carry)
+            offset += len(chunk)
+            if chunk:
+                # Only scan whole lines; the partial last line is carried into the next chunk.
+                cut = block.rfind(b'\n') + 1
+                block, carry = block[:cut], block[cut:]
+            if not block:
+                if chunk:
+                    continue
+                break
+
+            if first_content is None:
+                first_content = _first_content_offset(block)
+                if first_content is not None:
+                    first_content += block_offset
+
+            # Prefix a newline so the first line of the block is matched like every other line.
+            scanned = b'\n' + block
+            if (block_offset == 0 and block.startswith((b'---', b'...', b'%', UTF8_BOM))) or DOCUMENT_MARKER_PATTERN.search(scanned):
+                return None
+            keys_in_block = 0
+            for match in TOP_LEVEL_KEY_PATTERN.finditer(scanned):
+                line_end = scanned.find(b'\n', match.end())
+                if _value_continues(scanned[match.end():line_end if line_end != -1 else len(scanned)]):
+                    return None
+                starts.append((match.group(1), block_offset + match.start()))
+                keys_in_block += 1
+            if keys_in_block != len(COLUMN_ZERO_LINE_PATTERN.findall(scanned)):
+                return None
+            if not chunk:
+                break
+
+    if not starts or first_content != starts[0][1]:
+        return None
+
+    sections: Dict[str, Tuple[int, int]] = {}
+    ends = [start for _, start in starts[1:]] + [offset]
+    for (raw_key, start), end in zip(starts, ends):
+        try:
+            key = normalize_key(raw_key)
+        except (yaml.YAMLError, UnicodeDecodeError, AttributeError):
+            return None
+        sections[key] = (start, end)
+    return sections
+
+
+class LazyConfig(MutableMapping):
+    """Config mapping that parses each top-level section of a YAML file on first access.
+
+    `on_load(key, value)` runs before a parsed section is cached, so rules for a section are only
+    checked when that section is used; if it raises, the section is not cached.
+    Keys assigned directly (e.g. 'logger', 'auth') are held in memory alongside the file sections.
+    """
+
+    def __init__(self, path: Path, sections: Dict[str, Tuple[int, int]],
+                 on_load: Optional[Callable[[str, Any], None]] = None):
+        self.path = path
+        self.on_load = on_load
+        self._sections = sections
+        self._values: Dict[str, Any] = {}
+        self._full: Optional[Dict[str, Any]] = None
+        self._signature = stat_signature(path)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_file(cls, path: Path, on_load: Optional[Callable[[str, Any], None]] = None) -> Optional['LazyConfig']:
+        """Index the file and return a LazyConfig, or None if it has to be parsed eagerly."""
+        sections = index_top_level_keys(path)
+        if sections is None:
+            return None
+        return cls(path, sections, on_load)
+
+    def loaded_keys(self):
+        """Return the keys whose values are already in memory."""
+        return set(self._values)
+
+    def loaded_items(self) -> Dict[str, Any]:
+        """Return the values already in memory, without parsing any other section."""
+        with self._lock:
+            return dict(self._values)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if key not in self._sections:
+            raise KeyError(key)
+
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            value = self._parse_section(key)
+            if self.on_load is not None:
+                self.on_load(key, value)
+            self._values[key] = value
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            found = key in self._values or key in self._sections
+            self._values.pop(key, None)
+            self._sections.pop(key, None)
+            if not found:
+                raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._sections
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._sections
+        for key in list(self._values):
+            if key not in self._sections:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._sections) + sum(1 for key in self._values if key not in self._sections)
+
+    def __repr__(self):
+        return f"<LazyConfig '{self.path}' keys={len(self)} loaded={len(self._values)}>"
+
+    def _parse_section(self, key: str) -> Any:
+        """Parse one section from its byte range; callers hold the lock."""
+        if self._full is not None:
+            return self._full[key]
+        if stat_signature(self.path) != self._signature:
+            raise ValueError(f"'{self.path}' changed after it was indexed; reload the config.")
+
+        import yaml
+
+        start, end = self._sections[key]
+        with open(self.path, 'rb') as file:
+            file.seek(start)
+            raw = file.read(end - start)
+
+        try:
+            parsed = _safe_load(raw)
+        except yaml.YAMLError:
+            # Sections that use aliases to anchors defined elsewhere need the whole document.
+            parsed = None
+        if isinstance(parsed, dict) and len(parsed) == 1:
+            return normalize_nested(next(iter(parsed.values())))
+        full = self._parse_full()
+        if key not in full:
+            raise KeyError(key)
+        return full[key]
+
+    def _parse_full(self) -> Dict[str, Any]:
+        """Parse the whole file once and serve every later section from it; callers hold the lock."""
+        import yaml
+
+        try:
+            with open(self.path, 'rb') as file:
+                data = _safe_load(file.read())
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML file: {e}")
+        self._full = normalize_config(data)
+        if self._full.keys() != self._sections.keys():
+            # The index misread the file, so none of its byte ranges can be trusted: serve every
+            # section, including ones already parsed, from the full parse from now on.
+            for key in self._sections:
+                self._values.pop(key, None)
+            self._sections = {key: (0, 0) for key in self._full}
+        return self._full
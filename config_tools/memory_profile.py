@@ -0,0 +1,162 @@
+import json
+import logging
+import sys
+import tracemalloc
+from collections.abc import Mapping
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+from .frozen_config import FrozenConfig
+from .lazy_config import LazyConfig
+from .utils import SensitiveDict
+
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), date, datetime, Path)
+
+
+def _children(obj: Any) -> Iterator[Any]:
+    """Yield the objects a config value holds references to; anything unrecognized is a leaf."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield key
+            yield value
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    elif isinstance(obj, FrozenConfig):
+        # The key index is shared by every FrozenConfig of the same shape; it is counted once.
+        yield object.__getattribute__(obj, '_index')
+        yield object.__getattribute__(obj, '_values')
+    elif isinstance(obj, LazyConfig):
+        yield obj.loaded_items()
+    elif isinstance(obj, SensitiveDict):
+        if obj.source is None:
+            yield obj.get_data()
+        else:
+            peek = getattr(obj.source, 'peek', None)  # Never fetch secrets just to measure them.
+            cached = peek() if peek is not None else None
+            if cached is not None:
+                yield cached
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """Return the bytes held by a config value and everything it contains.
+
+    Objects already in `seen` (by id) are skipped and new ones are added, so passing the same set
+    across calls counts shared objects only once. Loggers and other non-config objects count their
+    shallow size only.
+    """
+    return _walk(obj, set() if seen is None else seen)[0]
+
+
+def _walk(obj: Any, seen: Set[int]):
+    total = 0
+    objects = 0
+    stack = [obj]
+    getsizeof = sys.getsizeof
+    while stack:
+        current = stack.pop()
+        object_id = id(current)
+        if object_id in seen:
+            continue
+        seen.add(object_id)
+        total += getsizeof(current)
+        objects += 1
+        if not isinstance(current, _ATOMIC_TYPES) and not isinstance(current, logging.Logger):
+            stack.extend(_children(current))
+    return total, objects
+
+
+def memory_breakdown(config: Mapping) -> Dict[str, Any]:
+    """Return the deep size of each top-level key, largest first.
+
+    Objects shared between keys are charged to the first key (in config order) that reaches them.
+    Unparsed sections of a LazyConfig are reported with loaded=False and no size.
+    """
+    values = config.loaded_items() if isinstance(config, LazyConfig) else config
+    container_bytes = sys.getsizeof(config)
+    seen = {id(config), id(values)}
+
+    breakdown = {}
+    for key in list(config):
+        if key not in values:
+            breakdown[key] = {'bytes': 0, 'objects': 0, 'loaded': False}
+            continue
+        size, objects = _walk(key, seen)
+        value_size, value_objects = _walk(values[key], seen)
+        breakdown[key] = {'bytes': size + value_size, 'objects': objects + value_objects, 'loaded': True}
+
+    ordered = dict(sorted(breakdown.items(), key=lambda item: item[1]['bytes'], reverse=True))
+    return {
+        'total_bytes': container_bytes + sum(entry['bytes'] for entry in ordered.values()),
+        'container_bytes': container_bytes,
+        'keys': ordered,
+    }
+
+
+class MemoryTrace:
+    """tracemalloc measurements of named load phases: net allocation, peak and top allocation sites."""
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.phases: List[Dict[str, Any]] = []
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracemalloc if it is not already running; stop() only stops what start() started."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the allocations made inside the block."""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        before = tracemalloc.take_snapshot()
+        current_before, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current_after, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            self.phases.append({
+                'phase': name,
+                'allocated_bytes': current_after - current_before,
+                'peak_bytes': max(peak - current_before, 0),
+                'top_sites': self._top_sites(before, after),
+            })
+
+    def _top_sites(self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ]
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+        sites = []
+        for stat in diff[:self.top]:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            sites.append({'site': f"{frame.filename}:{frame.lineno}", 'bytes': stat.size_diff, 'count': stat.count_diff})
+        return sites
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'phases': self.phases}
+
+
+def write_report(report: Dict[str, Any], path: Union[str, Path, None] = None) -> str:
+    """Serialize a memory report to JSON, writing it to `path` when given; returns the JSON text."""
+    text = json.dumps(report, indent=2, default=str)
+    if path is not None:
+        Path(path).write_text(text, encoding='utf-8')
+    return text
@@ -1,50 +1,417 @@
+import atexit
+import gzip
+import hashlib
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import Logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
+import re
+import shutil
 import sys
 import os
+import time
+import threading
 from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+OVERFLOW_POLICIES = ('block', 'drop', 'count')
+# How long stopping an async logger waits for room in a full queue before giving up until the next attempt.
+STOP_TIMEOUT = 10.0
+_async_handles = []
+_setup_lock = threading.RLock()
+# Open loggers keyed by (absolute log directory, file prefix); see prepare_logger.
+_LOGGER_POOL: Dict[Tuple[str, str], '_PooledLogger'] = {}
+_compression_executor: Optional[ThreadPoolExecutor] = None
+# What follows the prefix in the names prepare_logger gives log files ('<prefix>2024_01_31_235959.log')
+# and their rotations ('.log.1.gz', '.log.1' when compression is off, or '.log.1.<ns>' when it failed).
+LOG_FILE_SUFFIX_PATTERN = r'\d{4}_\d{2}_\d{2}_\d{6}\.log(?:\.\d+(?:\.gz|\.\d+)?)?'
 
 class CustomFormatter(logging.Formatter):
-    """Custom formatter for microsecond-level timestamp logging."""
-    
+    """Custom formatter for microsecond-level timestamp logging.
+
+    The date part of each timestamp is formatted once per second and reused for later records.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, formatted pieces); replaced as a whole so concurrent readers see a consistent tuple.
+        self._cached_second = (None, None, None)
+
     def formatTime(self, record, datefmt=None):
         """Format log timestamp to include milliseconds."""
-        ct = self.converter(record.created)
+        second = int(record.created)
+        cached_second, cached_datefmt, pieces = self._cached_second
+        if cached_second != second or cached_datefmt != datefmt:
+            t = datetime.fromtimestamp(second)
+            if datefmt:
+                # Format around '%f' so the cached pieces stay valid for the whole second.
+                pieces = [t.strftime(part) for part in datefmt.split('%f')]
+            else:
+                pieces = [t.strftime("%Y-%m-%d %H:%M:%S") + ","]
+            self._cached_second = (second, datefmt, pieces)
+
         if datefmt:
-            s = datetime.fromtimestamp(record.created).strftime(datefmt)
+            if len(pieces) == 1:
+                return pieces[0]
+            micros = min(int(round((record.created - second) * 1000000)), 999999)
+            return ("%06d" % micros).join(pieces)
+        return pieces[0] + "%03d" % (record.msecs)
+
+
+class OverflowQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that blocks, drops, or drops and counts records when full."""
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = 'block'):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}. Found: '{overflow}'")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record):
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == 'count':
+                with self._dropped_lock:
+                    self.dropped += 1
+
+
+class BlockingQueueListener(QueueListener):
+    """QueueListener whose stop sentinel waits for room in a bounded queue instead of failing when it is full."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel, timeout=STOP_TIMEOUT)
+
+
+class AsyncLoggingHandle:
+    """Owns the QueueListener behind an async logger and stops it exactly once."""
+
+    def __init__(self, listener: QueueListener, queue_handler: OverflowQueueHandler):
+        self.listener = listener
+        self.queue_handler = queue_handler
+        self.stopped = False
+        self._lock = threading.Lock()
+
+    def stop(self) -> None:
+        """Flush queued records to the real handlers and stop the listener thread.
+
+        If the queue stays full for STOP_TIMEOUT seconds the handle is left running, so a later call
+        (at the latest the one at interpreter exit) can try again.
+        """
+        with self._lock:
+            if self.stopped:
+                return
+            try:
+                self.listener.stop()
+            except queue.Full:
+                logging.getLogger(__name__).error("Async logging queue stayed full; listener not stopped yet")
+                return
+            self.stopped = True
+        for handler in self.listener.handlers:
+            handler.flush()
+        if self.queue_handler.dropped:
+            for handler in self.listener.handlers:
+                handler.handle(logging.makeLogRecord({
+                    'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING', 'created': time.time(),
+                    'msg': f"Async logging dropped {self.queue_handler.dropped} records because the queue was full",
+                }))
+                handler.flush()
+
+
+def stop_async_logging() -> None:
+    """Flush and stop every async logging listener started by prepare_logger."""
+    with _setup_lock:
+        handles = list(_async_handles)
+    for handle in handles:
+        _stop_async_handle(handle)
+
+
+def _stop_async_handle(handle: AsyncLoggingHandle) -> None:
+    """Stop a handle and forget it once it has stopped; handles that could not stop are retried at exit."""
+    handle.stop()
+    if handle.stopped:
+        with _setup_lock:
+            if handle in _async_handles:
+                _async_handles.remove(handle)
+
+
+# One hook for every handle, so stopped or evicted handles are not kept alive until exit.
+atexit.register(stop_async_logging)
+
+
+def _compressor() -> ThreadPoolExecutor:
+    """Return the single background thread that compresses rotated logs and applies retention."""
+    global _compression_executor
+    with _setup_lock:
+        if _compression_executor is None:
+            _compression_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-compress')
+        return _compression_executor
+
+
+def _gzip_file(source: str, dest: str) -> None:
+    """Compress source into dest atomically and remove source."""
+    tmp_dest = f"{dest}.tmp"
+    with open(source, 'rb') as file_in, gzip.open(tmp_dest, 'wb', compresslevel=6) as file_out:
+        shutil.copyfileobj(file_in, file_out, 1 << 20)
+    os.replace(tmp_dest, dest)
+    os.remove(source)
+
+
+def apply_retention(log_path: str, output_name_prefix: str = "", max_age_days: Optional[float] = None,
+                    max_total_bytes: Optional[int] = None, keep: Iterable[str] = ()) -> List[str]:
+    """Delete this prefix's log files and compressed archives that are too old or over the size budget.
+
+    Only names prepare_logger gives this exact prefix are considered, so other prefixes sharing the
+    directory (including longer ones such as 'app_worker_' for 'app_') and files still waiting for
+    compression are left alone. Oldest files go first; paths in `keep` (logs still being written) and
+    every log file held open by a pooled logger are never deleted. Returns the deleted paths.
+    """
+    keep = {os.path.abspath(path) for path in keep} | _open_log_files()
+    name_pattern = re.compile(re.escape(output_name_prefix) + LOG_FILE_SUFFIX_PATTERN)
+    files = []
+    try:
+        with os.scandir(log_path) as entries:
+            for entry in entries:
+                if name_pattern.fullmatch(entry.name) is None or os.path.abspath(entry.path) in keep:
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return []
+
+    files.sort()
+    deleted = []
+    total = sum(size for _, size, _ in files)
+    cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+    for mtime, size, path in files:
+        too_old = cutoff is not None and mtime < cutoff
+        over_budget = max_total_bytes is not None and total > max_total_bytes
+        if not (too_old or over_budget):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        deleted.append(path)
+    return deleted
+
+
+def _open_log_files() -> Set[str]:
+    """Return the absolute paths of the log files pooled loggers are writing to."""
+    with _setup_lock:
+        handlers = [handler for entry in _LOGGER_POOL.values() for handler in entry.handlers]
+    return {os.path.abspath(handler.baseFilename) for handler in handlers if isinstance(handler, logging.FileHandler)}
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that gzips rotated files on a background thread and enforces retention.
+
+    Rotated files are named '<file>.1.gz' ... '<file>.<backupCount>.gz'. A rollover waits for the
+    previous compression to finish so the numbered chain is never shifted underneath it. A rotation
+    that fails to compress is kept uncompressed as '<file>.<n>.<ns timestamp>', outside the chain, so
+    later rollovers never overwrite it; retention counts it like any other log. Compression and
+    retention errors are reported through this module's logger and never stop the handler.
+    With compress=False rotations keep the plain '<file>.<n>' names and only retention runs in the background.
+    """
+
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0, encoding: Optional[str] = None,
+                 max_age_days: Optional[float] = None, max_total_bytes: Optional[int] = None,
+                 retention_prefix: str = "", compress: bool = True):
+        for name, value in (('max_age_days', max_age_days), ('max_total_bytes', max_total_bytes)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0):
+                raise ValueError(f"{name} must be a positive number. Found: {value!r}")
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        if compress:
+            self.namer = self._gz_name
+            self.rotator = self._rotate
         else:
-            t = datetime.fromtimestamp(record.created)
-            s = t.strftime("%Y-%m-%d %H:%M:%S") + ",%03d" % (record.msecs)
-        return s
+            self.rotator = self._rotate_plain
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+        self.retention_prefix = retention_prefix
+        self._pending: Optional[Future] = None
+        if max_age_days is not None or max_total_bytes is not None:
+            self._pending = _compressor().submit(self._apply_retention)
+
+    @staticmethod
+    def _gz_name(name: str) -> str:
+        return name + ".gz"
+
+    def _rotate(self, source: str, dest: str) -> None:
+        # Only a rename happens on the logging thread; compression runs in the background.
+        pending = f"{dest[:-len('.gz')]}.pending"
+        os.replace(source, pending)
+        self._pending = _compressor().submit(self._compress, pending, dest)
+
+    def _rotate_plain(self, source: str, dest: str) -> None:
+        os.replace(source, dest)
+        if self.max_age_days is not None or self.max_total_bytes is not None:
+            self._pending = _compressor().submit(self._apply_retention)
+
+    def _compress(self, source: str, dest: str) -> None:
+        # Errors are reported to this module's logger rather than the handler's own, which may be
+        # waiting on this task inside doRollover().
+        try:
+            _gzip_file(source, dest)
+        except OSError as e:
+            # Keep the uncompressed records under a name no later rotation reuses.
+            kept = f"{dest[:-len('.gz')]}.{time.time_ns()}"
+            try:
+                os.replace(source, kept)
+            except OSError as rename_error:
+                logging.getLogger(__name__).error(f"Could not compress or rename rotated log '{source}': {rename_error}")
+            else:
+                logging.getLogger(__name__).warning(f"Could not compress rotated log '{source}', kept it as '{kept}': {e}")
+        self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        if self.max_age_days is None and self.max_total_bytes is None:
+            return
+        try:
+            apply_retention(os.path.dirname(self.baseFilename), self.retention_prefix, self.max_age_days,
+                            self.max_total_bytes, keep=[self.baseFilename])
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Log retention in '{os.path.dirname(self.baseFilename)}' failed: {e}")
+
+    def wait_for_compression(self) -> None:
+        """Block until the most recent compression and retention pass has finished.
+
+        A task that failed is reported once and then forgotten, so later rollovers are not blocked by it.
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            try:
+                pending.result()
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Background log compression failed: {e}")
+
+    def doRollover(self):
+        self.wait_for_compression()
+        super().doRollover()
+
+    def close(self):
+        super().close()
+        self.wait_for_compression()
+
+
+class _PooledLogger:
+    """A logger and the handlers it owns for one (log_path, output_name_prefix) pair."""
 
-def prepare_logger(log_path: str, output_name_prefix="") -> Logger:
-    """Create and configure a logger with console and rotating file handlers."""
-    
-    if not os.path.exists(log_path):
-        os.makedirs(log_path)  # Ensure log directory exists
+    __slots__ = ('logger', 'handlers', 'async_handle')
 
-    timestamp_str = datetime.now().strftime('%Y_%m_%d_%H%M%S')
-    log_file = os.path.join(log_path, f"{output_name_prefix}{timestamp_str}.log")
+    def __init__(self, logger: Logger, handlers: List[logging.Handler], async_handle: Optional[AsyncLoggingHandle]):
+        self.logger = logger
+        self.handlers = handlers
+        self.async_handle = async_handle
 
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)
+    def close(self) -> None:
+        if self.async_handle is not None:
+            _stop_async_handle(self.async_handle)
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        for handler in self.handlers:
+            handler.close()
 
-    log_format = CustomFormatter(fmt='%(asctime)s %(levelname)s: %(message)s',
-                                 datefmt='%Y-%m-%d %H:%M:%S.%f')
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(log_format)
+def _pool_key(log_path: str, output_name_prefix: str) -> Tuple[str, str]:
+    return os.path.abspath(log_path), output_name_prefix
 
-    # File handler with log rotation
-    file_handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(log_format)
 
-    if not logger.hasHandlers():
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+def close_logger(log_path: str, output_name_prefix: str = "") -> None:
+    """Flush and close the pooled handlers for a log directory and prefix."""
+    with _setup_lock:
+        entry = _LOGGER_POOL.pop(_pool_key(log_path, output_name_prefix), None)
+    if entry is not None:
+        entry.close()
+
+
+def close_all_loggers() -> None:
+    """Flush and close every pooled logger; the next prepare_logger call starts new log files."""
+    with _setup_lock:
+        entries = list(_LOGGER_POOL.values())
+        _LOGGER_POOL.clear()
+    for entry in entries:
+        entry.close()
+
+
+def prepare_logger(log_path: str, output_name_prefix="", async_mode: bool = False,
+                   queue_size: int = 10000, overflow: str = 'block', compress: bool = True,
+                   max_age_days: Optional[float] = None, max_total_bytes: Optional[int] = None) -> Logger:
+    """Return the logger for a log directory and file prefix, with console and rotating file handlers.
+
+    Loggers are pooled per (log_path, output_name_prefix): the first call creates the log directory,
+    the timestamped log file and its handlers, and later calls return the same logger without opening
+    anything. Files rotated out at 10 MB (5 kept) are gzip-compressed in the background unless
+    compress=False; either way, max_age_days and max_total_bytes bound the prefix's logs and archives on disk.
+
+    With async_mode=True, records go through a bounded queue to a background QueueListener so
+    logging calls never wait on disk or terminal I/O. `overflow` chooses what happens when the queue
+    is full: 'block' waits, 'drop' discards the record, 'count' discards it and counts the drop.
+    The listener is flushed and stopped at interpreter exit. Pooled loggers keep the mode they were
+    created with.
+    """
+    key = _pool_key(log_path, output_name_prefix)
+    entry = _LOGGER_POOL.get(key)
+    if entry is not None:
+        return entry.logger
+
+    # Loaders may be built concurrently (see AsyncConfigLoader); only one of them may create the handlers.
+    with _setup_lock:
+        entry = _LOGGER_POOL.get(key)
+        if entry is not None:
+            return entry.logger
+
+        if not os.path.exists(log_path):
+            os.makedirs(log_path, exist_ok=True)  # Ensure log directory exists
+
+        timestamp_str = datetime.now().strftime('%Y_%m_%d_%H%M%S')
+        log_file = os.path.join(log_path, f"{output_name_prefix}{timestamp_str}.log")
+
+        # One named logger per key, so loaders with different log directories never share handlers;
+        # the name is stable so reopening a closed key reuses the logger object instead of leaking one.
+        key_digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:12]
+        logger = logging.getLogger(f"{__name__}.{key_digest}")
+        logger.setLevel(logging.DEBUG)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+
+        log_format = CustomFormatter(fmt='%(asctime)s %(levelname)s: %(message)s',
+                                     datefmt='%Y-%m-%d %H:%M:%S.%f')
+
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(log_format)
+
+        # File handler with log rotation
+        file_handler = CompressingRotatingFileHandler(log_file, maxBytes=10485760, backupCount=5,
+                                                      max_age_days=max_age_days, max_total_bytes=max_total_bytes,
+                                                      retention_prefix=output_name_prefix, compress=compress)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(log_format)
+
+        async_handle = None
+        if async_mode:
+            log_queue = queue.Queue(maxsize=queue_size)
+            queue_handler = OverflowQueueHandler(log_queue, overflow)
+            listener = BlockingQueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+            listener.start()
+            async_handle = AsyncLoggingHandle(listener, queue_handler)
+            _async_handles.append(async_handle)
+            logger.addHandler(queue_handler)
+        else:
+            logger.addHandler(console_handler)
+            logger.addHandler(file_handler)
 
-    return logger
+        _LOGGER_POOL[key] = _PooledLogger(logger, [console_handler, file_handler], async_handle)
+        return logger
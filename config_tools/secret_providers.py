@@ -0,0 +1,198 @@
+import json
+import logging
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from .compiled_config import load_compiled_config
+from .utils import normalize_config
+
+
+class SecretProvider(ABC):
+    """Source of secret data; subclasses implement fetch()."""
+
+    @abstractmethod
+    def fetch(self) -> Dict[str, Any]:
+        """Return the current secrets as a normalized dict."""
+
+    def describe(self) -> str:
+        return self.__class__.__name__
+
+
+class FileSecretProvider(SecretProvider):
+    """Reads secrets from a YAML file, or with use_compiled=True from its compiled artifact when that is fresh."""
+
+    def __init__(self, path: Union[str, Path], use_compiled: bool = False):
+        self.path = Path(path)
+        self.use_compiled = use_compiled
+
+    def fetch(self) -> Dict[str, Any]:
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Authentication path '{self.path}' does not exist or is not a valid file.")
+        if self.use_compiled:
+            compiled = load_compiled_config(self.path)
+            if compiled is not None:
+                return compiled
+
+        import yaml
+        from .config_cache import fast_safe_load
+
+        with open(self.path, 'rb') as file:
+            try:
+                return normalize_config(fast_safe_load(file.read()))
+            except yaml.YAMLError as e:
+                raise ValueError(f"Error parsing YAML file: {e}")
+
+    def describe(self) -> str:
+        return f"file '{self.path}'"
+
+
+class UnixSocketSecretProvider(SecretProvider):
+    """Requests secrets from a local agent on a Unix socket, a stand-in for a vault.
+
+    The agent receives `request` and replies with a JSON object, then closes the connection.
+    """
+
+    def __init__(self, socket_path: Union[str, Path], request: bytes = b'GET\n', timeout: float = 5.0):
+        self.socket_path = str(socket_path)
+        self.request = request
+        self.timeout = timeout
+
+    def fetch(self) -> Dict[str, Any]:
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(self.timeout)
+            connection.connect(self.socket_path)
+            connection.sendall(self.request)
+            connection.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = connection.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        try:
+            data = json.loads(b''.join(chunks))
+        except ValueError as e:
+            raise ValueError(f"Secret agent at '{self.socket_path}' returned invalid JSON: {e}")
+        return normalize_config(data)
+
+    def describe(self) -> str:
+        return f"socket '{self.socket_path}'"
+
+
+class SecretCache:
+    """In-memory TTL cache in front of a SecretProvider.
+
+    get() returns the cached value without I/O while it is fresh. A background thread refreshes it
+    once `refresh_ahead` of the TTL has passed, so callers normally never wait. Refreshes are
+    single-flight: concurrent callers that find the value expired wait for one fetch instead of
+    each fetching. A refresh that fails or does not pass `validator` keeps the previous value, which
+    is served (and the failure logged) until a refresh succeeds. The thread holds the cache only
+    weakly and exits once close() is called or the cache is garbage collected.
+    """
+
+    def __init__(self, provider: SecretProvider, ttl: float = 300.0, refresh_ahead: float = 0.8,
+                 validator: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 logger: Optional[logging.Logger] = None, background: bool = True):
+        if ttl <= 0:
+            raise ValueError(f"Secret TTL must be positive. Found: {ttl}")
+        if not 0 < refresh_ahead <= 1:
+            raise ValueError(f"refresh_ahead must be in (0, 1]. Found: {refresh_ahead}")
+        self.provider = provider
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.validator = validator
+        self.logger = logger or logging.getLogger(__name__)
+        self.refreshes = 0
+        self._value: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._background = background
+
+    def get(self) -> Dict[str, Any]:
+        """Return the secrets, fetching synchronously only when nothing fresh is cached."""
+        value = self._value
+        if value is not None and time.monotonic() < self._expires_at:
+            return value
+        if value is None:
+            return self.refresh(force=False)
+        try:
+            return self.refresh(force=False)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Secret refresh from {self.provider.describe()} failed, serving expired value: {e}")
+            # Serve the stale value without I/O until the next retry instead of fetching on every call.
+            self._expires_at = time.monotonic() + self._retry_delay()
+            return value
+
+    def peek(self) -> Optional[Dict[str, Any]]:
+        """Return the cached value, even if expired, without fetching."""
+        return self._value
+
+    def refresh(self, force: bool = True) -> Dict[str, Any]:
+        """Fetch and validate new secrets; with force=False a value refreshed meanwhile is reused."""
+        with self._refresh_lock:
+            if not force and self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+            data = self.provider.fetch()
+            if self.validator is not None:
+                self.validator(data)
+            self._value = data
+            self._expires_at = time.monotonic() + self.ttl
+            self.refreshes += 1
+        self._ensure_background_refresh()
+        return data
+
+    def close(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _ensure_background_refresh(self) -> None:
+        if not self._background or self._thread is not None or self._stop.is_set():
+            return
+        self._thread = threading.Thread(target=self._run, args=(weakref.ref(self), self._stop),
+                                        name='secret-refresh', daemon=True)
+        weakref.finalize(self, self._stop.set)
+        self._thread.start()
+
+    @staticmethod
+    def _run(cache_ref: 'weakref.ref[SecretCache]', stop: threading.Event) -> None:
+        # Only a weak reference is kept between refreshes, so a cache nobody closed can still be collected.
+        while True:
+            cache = cache_ref()
+            if cache is None:
+                return
+            delay = cache._expires_at - cache.ttl * (1 - cache.refresh_ahead) - time.monotonic()
+            cache = None
+            if stop.wait(max(0.0, delay)):
+                return
+            cache = cache_ref()
+            if cache is None:
+                return
+            retry_delay = cache._background_refresh()
+            cache = None
+            if retry_delay is not None and stop.wait(retry_delay):
+                return
+
+    def _background_refresh(self) -> Optional[float]:
+        """Refresh once from the background thread; returns the back-off delay if the refresh failed."""
+        try:
+            self.refresh(force=True)
+            self.logger.debug(f"Secrets refreshed from {self.provider.describe()}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Secret refresh from {self.provider.describe()} failed, keeping cached value: {e}")
+            return self._retry_delay()
+
+    def _retry_delay(self) -> float:
+        """Back-off between failed refreshes: the refresh-ahead window, capped at 30s."""
+        return min(self.ttl * (1 - self.refresh_ahead) or self.ttl, 30.0)
@@ -0,0 +1,180 @@
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional
+
+from .frozen_config import FrozenConfig, freeze
+from .utils import SensitiveDict
+
+# Segment layout: magic (8 bytes) | version (u64) | payload length (u64) | reserved (u64) | pickled FrozenConfig.
+# The version works as a seqlock: it is odd while a publication is being written and even once it is complete.
+SEGMENT_MAGIC = b'CTSHM\x00\x02\x00'
+HEADER = struct.Struct('<8sQQQ')
+VERSION = struct.Struct('<Q')
+VERSION_OFFSET = 8
+LENGTH = struct.Struct('<Q')
+LENGTH_OFFSET = 16
+MIN_CAPACITY = 64 * 1024
+
+
+def shareable_config(config: Mapping, include_secrets: bool = False) -> Dict[str, Any]:
+    """Return a plain dict suitable for publishing: no logger, and no SensitiveDict unless opted in."""
+    shareable = {}
+    for key, value in config.items():
+        if isinstance(value, logging.Logger):
+            continue
+        if isinstance(value, SensitiveDict):
+            if not include_secrets:
+                continue
+            value = SensitiveDict(_plain(value.get_data()))
+        shareable[key] = _plain(value)
+    return shareable
+
+
+def _plain(value: Any) -> Any:
+    """Convert mapping types such as FrozenConfig or LazyConfig to dicts so payloads stay compact."""
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+class SharedConfigPublisher:
+    """Publishes a validated config into a shared memory segment that worker processes can attach to."""
+
+    def __init__(self, name: Optional[str] = None, capacity: Optional[int] = None):
+        """Prepare a publisher; the segment is created on the first publish() unless a capacity is given."""
+        self._requested_name = name
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self.version = 0
+        if capacity is not None:
+            self._create(capacity)
+
+    @property
+    def name(self) -> str:
+        """Return the segment name workers pass to SharedConfigReader."""
+        if self._shm is None:
+            raise ValueError("Nothing has been published yet.")
+        return self._shm.name
+
+    def publish(self, config: Mapping, include_secrets: bool = False) -> int:
+        """Write a new config version to the segment and return its version number.
+
+        Secrets held in SensitiveDict values are left out unless include_secrets=True.
+        """
+        # Frozen here, once, so each reader unpickles straight into a FrozenConfig without another copy.
+        payload = pickle.dumps(freeze(shareable_config(config, include_secrets)), protocol=pickle.HIGHEST_PROTOCOL)
+        if self._shm is None:
+            self._create(max(MIN_CAPACITY, len(payload) * 2))
+        capacity = self._shm.size - HEADER.size
+        if len(payload) > capacity:
+            raise ValueError(f"Config payload of {len(payload)} bytes exceeds the shared segment capacity of "
+                             f"{capacity} bytes. Create the publisher with a larger capacity.")
+
+        buf = self._shm.buf
+        writing = self.version * 2 + 1
+        VERSION.pack_into(buf, VERSION_OFFSET, writing)
+        LENGTH.pack_into(buf, LENGTH_OFFSET, len(payload))
+        buf[HEADER.size:HEADER.size + len(payload)] = payload
+        # Published last, so a reader that sees the even version also sees the length and payload written for it.
+        VERSION.pack_into(buf, VERSION_OFFSET, writing + 1)
+        self.version += 1
+        return self.version
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach from the segment and, by default, remove it."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
+
+    def _create(self, capacity: int) -> None:
+        self._shm = shared_memory.SharedMemory(name=self._requested_name, create=True, size=HEADER.size + capacity)
+        HEADER.pack_into(self._shm.buf, 0, SEGMENT_MAGIC, 0, 0, 0)
+
+
+class SharedConfigReader:
+    """Read-only view of a published config; `changed` is a cheap check for a newer version."""
+
+    def __init__(self, name: str):
+        """Attach to a segment created by SharedConfigPublisher."""
+        self.name = name
+        self._shm = None
+        self._mmap = None
+        if sys.platform.startswith('linux') and os.path.exists(f"/dev/shm/{name.lstrip('/')}"):
+            # Map the segment read-only directly so attaching never registers it with the
+            # multiprocessing resource tracker, which would unlink it when a worker exits.
+            with open(f"/dev/shm/{name.lstrip('/')}", 'rb') as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buf = self._mmap
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._buf = self._shm.buf
+
+        magic = HEADER.unpack_from(self._buf, 0)[0]
+        if magic != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"Shared memory segment '{name}' does not hold a published config.")
+        self._version = -1
+        self._config: Optional[FrozenConfig] = None
+
+    @property
+    def version(self) -> int:
+        """Return the latest complete version published (0 before the first publication)."""
+        return VERSION.unpack_from(self._buf, VERSION_OFFSET)[0] // 2
+
+    @property
+    def changed(self) -> bool:
+        """Return True if a version newer than the last one read has been published."""
+        return self.version != self._version
+
+    def read(self, retries: int = 100) -> FrozenConfig:
+        """Return the published config, deserializing straight from the segment only when it changed."""
+        for _ in range(retries):
+            before = VERSION.unpack_from(self._buf, VERSION_OFFSET)[0]
+            if before % 2:
+                time.sleep(0)
+                continue
+            if before // 2 == self._version and self._config is not None:
+                return self._config
+            if before == 0:
+                raise ValueError(f"Nothing has been published to '{self.name}' yet.")
+
+            length = LENGTH.unpack_from(self._buf, LENGTH_OFFSET)[0]
+            view = memoryview(self._buf)[HEADER.size:HEADER.size + length]
+            try:
+                data = pickle.loads(view)
+            except Exception:
+                data = None
+            finally:
+                view.release()
+
+            # A publication that started while we were reading invalidates what we read.
+            if VERSION.unpack_from(self._buf, VERSION_OFFSET)[0] == before and isinstance(data, FrozenConfig):
+                self._config = data
+                self._version = before // 2
+                return self._config
+        raise ValueError(f"Could not read a consistent config from '{self.name}'.")
+
+    def close(self) -> None:
+        """Detach from the segment without removing it."""
+        self._config = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._shm is not None:
+            self._buf = None
+            self._shm.close()
+            self._shm = None
@@ -0,0 +1,91 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class MetricSink(ABC):
+    """Receives phase timings; subclasses implement emit()."""
+
+    @abstractmethod
+    def emit(self, name: str, value_ms: float, tags: Optional[Dict[str, str]] = None) -> None:
+        """Send one timing in milliseconds."""
+
+
+class StatsdSink(MetricSink):
+    """Sends timings as StatsD 'ms' metrics over UDP, by default to a local agent on port 8125."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8125, prefix: str = 'config_tools'):
+        self.address = (host, port)
+        self.prefix = prefix
+        import socket
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def emit(self, name: str, value_ms: float, tags: Optional[Dict[str, str]] = None) -> None:
+        line = f"{self.prefix}.{name}:{value_ms:.3f}|ms"
+        if tags:
+            line += "|#" + ",".join(f"{key}:{value}" for key, value in tags.items())
+        try:
+            self._socket.sendto(line.encode('utf-8'), self.address)
+        except OSError:
+            pass  # Metrics are best effort; a missing agent must never break startup.
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+class _Phase:
+    __slots__ = ('timings', 'name', 'started')
+
+    def __init__(self, timings: 'PhaseTimings', name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.monotonic_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timings.record(self.name, time.monotonic_ns() - self.started)
+        return False
+
+
+class PhaseTimings:
+    """Monotonic-clock durations of named phases, in the order they ran."""
+
+    def __init__(self):
+        self.spans: List[Tuple[str, int]] = []
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager that records how long its block took."""
+        return _Phase(self, name)
+
+    def record(self, name: str, duration_ns: int) -> None:
+        self.spans.append((name, duration_ns))
+
+    @property
+    def total_ms(self) -> float:
+        return sum(duration for _, duration in self.spans) / 1e6
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return phase durations in milliseconds; repeated phases are summed."""
+        durations: Dict[str, float] = {}
+        for name, duration in self.spans:
+            durations[name] = durations.get(name, 0.0) + duration / 1e6
+        return durations
+
+    def emit(self, sinks: Iterable[MetricSink], tags: Optional[Dict[str, str]] = None) -> None:
+        """Send every phase and the total to each sink; sink errors are ignored."""
+        durations = self.as_dict()
+        durations['total'] = self.total_ms
+        for sink in sinks:
+            for name, value_ms in durations.items():
+                try:
+                    sink.emit(f"startup.{name}", value_ms, tags)
+                except Exception:
+                    pass
+
+    def __repr__(self):
+        phases = ", ".join(f"{name}={value:.3f}ms" for name, value in self.as_dict().items())
+        return f"<PhaseTimings {phases}>"
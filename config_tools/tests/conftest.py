@@ -3,11 +3,26 @@ from pathlib import Path
 import pytest
 import yaml
 from config_tools.config_loader import ConfigLoader
+from config_tools.prepare_logger import close_all_loggers
 
 # Add the root directory to the Python path (ensure it points to the parent of config_tools_module)
 root_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(root_dir))
 
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Close pooled loggers and clear the shared registry after each test."""
+    yield
+    close_all_loggers()
+    ConfigLoader.registry().invalidate()
+
+
+@pytest.fixture
+def base_config(tmp_path):
+    """Minimal valid config content that logs into the test's temporary directory."""
+    return {'log_output_path': str(tmp_path / 'logs'), 'log_name_prefix': 'test_'}
+
+
 @pytest.fixture
 def create_temp_yaml_file(tmp_path):
     """Fixture to create a temporary YAML file and return its path."""
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from config_tools.async_loader import AsyncConfigLoader, guess_authentication_path
+from config_tools.config_loader import ConfigLoader
+
+
+class SlowLoader(ConfigLoader):
+    """ConfigLoader that blocks until released, so concurrent callers overlap."""
+
+    release = threading.Event()
+    prefetched_paths = []
+
+    def __init__(self, *args, prefetched=None, **kwargs):
+        SlowLoader.prefetched_paths.append(sorted(str(path) for path in prefetched or {}))
+        SlowLoader.release.wait(5)
+        super().__init__(*args, prefetched=prefetched, **kwargs)
+
+
+@pytest.fixture
+def slow_loader():
+    SlowLoader.release.clear()
+    SlowLoader.prefetched_paths = []
+    yield SlowLoader
+    SlowLoader.release.set()
+
+
+@pytest.mark.parametrize('raw, expected', [
+    (b"a: 1\nauthentication_path: /etc/auth.yaml  # secrets\n", '/etc/auth.yaml'),
+    (b"authentication_path: 'quoted path.yaml'\r\n", 'quoted path.yaml'),
+    (b"nested:\n  authentication_path: /etc/auth.yaml\n", None),
+    (b"authentication_path:\n", None),
+])
+def test_guess_authentication_path(raw, expected):
+    guessed = guess_authentication_path(raw)
+    assert (str(guessed) if guessed is not None else None) == expected
+
+
+def test_concurrent_loads_of_one_path_share_a_single_load(base_config, create_temp_yaml_file, slow_loader):
+    config_file = create_temp_yaml_file(base_config)
+
+    async def run():
+        async with AsyncConfigLoader(max_workers=4, loader_factory=slow_loader) as loader:
+            tasks = [asyncio.ensure_future(loader.load(config_file)) for _ in range(10)]
+            await asyncio.sleep(0.05)
+            assert loader.inflight == 1
+            slow_loader.release.set()
+            results = await asyncio.gather(*tasks)
+            return loader, results
+
+    loader, results = asyncio.run(run())
+
+    assert loader.loads == 1
+    assert all(result is results[0] for result in results)
+    assert loader.inflight == 0
+
+
+def test_different_options_are_separate_loads(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+
+    async def run():
+        async with AsyncConfigLoader() as loader:
+            eager, lazy = await asyncio.gather(loader.load(config_file), loader.load(config_file, lazy=True))
+            return loader.loads, eager, lazy
+
+    loads, eager, lazy = asyncio.run(run())
+
+    assert loads == 2
+    assert eager is not lazy and lazy.lazy
+
+
+def test_cancelled_caller_does_not_cancel_shared_load(base_config, create_temp_yaml_file, slow_loader):
+    config_file = create_temp_yaml_file(base_config)
+
+    async def run():
+        async with AsyncConfigLoader(loader_factory=slow_loader) as loader:
+            first = asyncio.ensure_future(loader.load(config_file))
+            second = asyncio.ensure_future(loader.load(config_file))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            slow_loader.release.set()
+            return await second
+
+    assert isinstance(asyncio.run(run()), ConfigLoader)
+
+
+def test_load_many_keeps_order_and_reports_errors(base_config, create_temp_yaml_file, tmp_path):
+    first = create_temp_yaml_file({**base_config, 'region': 'eu'}, filename='first.yaml')
+    second = create_temp_yaml_file({**base_config, 'region': 'us'}, filename='second.yaml')
+
+    async def run():
+        async with AsyncConfigLoader() as loader:
+            return await loader.load_many([second, tmp_path / 'missing.yaml', first], return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert results[0].config['region'] == 'us'
+    assert isinstance(results[1], FileNotFoundError)
+    assert results[2].config['region'] == 'eu'
+
+
+def test_auth_file_is_prefetched(base_config, create_temp_yaml_file, slow_loader):
+    auth_file = create_temp_yaml_file({'qTest_bearer_token': 'Bearer x'}, filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'authentication_path': str(auth_file)})
+    slow_loader.release.set()
+
+    async def run():
+        async with AsyncConfigLoader(loader_factory=slow_loader) as loader:
+            return await loader.load(config_file)
+
+    loaded = asyncio.run(run())
+
+    assert loaded.config['auth'].get_data() == {'qTest_bearer_token': 'Bearer x'}
+    assert slow_loader.prefetched_paths == [sorted([str(Path(auth_file).resolve()), str(Path(config_file).resolve())])]
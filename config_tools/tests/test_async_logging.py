@@ -0,0 +1,144 @@
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from config_tools import prepare_logger as prepare_logger_module
+from config_tools.prepare_logger import (AsyncLoggingHandle, BlockingQueueListener, CustomFormatter, OverflowQueueHandler,
+                                         close_logger, prepare_logger)
+
+
+def _log_lines(log_dir):
+    return [line for path in sorted(Path(log_dir).glob('*.log')) for line in path.read_text().splitlines()]
+
+
+def test_async_logger_flushes_every_record_on_close(tmp_path, capsys):
+    log_dir = tmp_path / 'logs'
+    logger = prepare_logger(str(log_dir), 'async_', async_mode=True)
+
+    for n in range(500):
+        logger.info(f"record {n}")
+    close_logger(str(log_dir), 'async_')
+
+    lines = _log_lines(log_dir)
+    assert len(lines) == 500
+    assert lines[-1].endswith("record 499")
+
+
+def test_concurrent_async_logging_keeps_every_record(tmp_path, capsys):
+    log_dir = tmp_path / 'logs'
+    logger = prepare_logger(str(log_dir), 'threads_', async_mode=True)
+
+    def worker(thread_id):
+        for n in range(100):
+            logger.debug(f"thread {thread_id} record {n}")
+
+    threads = [threading.Thread(target=worker, args=(thread_id,)) for thread_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    close_logger(str(log_dir), 'threads_')
+
+    assert len(_log_lines(log_dir)) == 800
+
+
+@pytest.mark.parametrize('overflow, dropped', [('drop', 0), ('count', 2)])
+def test_full_queue_drops_records(overflow, dropped):
+    log_queue = queue.Queue(maxsize=1)
+    handler = OverflowQueueHandler(log_queue, overflow)
+    logger = logging.getLogger(f'test_overflow_{overflow}')
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for n in range(3):
+            logger.warning(f"record {n}")
+    finally:
+        logger.removeHandler(handler)
+
+    assert log_queue.qsize() == 1
+    assert handler.dropped == dropped
+
+
+class SlowHandler(logging.Handler):
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.messages.append(record.getMessage())
+
+
+def test_stop_flushes_a_full_queue():
+    log_queue = queue.Queue(maxsize=5)
+    slow = SlowHandler(0.01)
+    listener = BlockingQueueListener(log_queue, slow)
+    listener.start()
+    queue_handler = OverflowQueueHandler(log_queue)
+    handle = AsyncLoggingHandle(listener, queue_handler)
+    logger = logging.getLogger('test_stop_full_queue')
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    try:
+        for n in range(50):
+            logger.warning(f"record {n}")
+        assert log_queue.full()
+        handle.stop()
+    finally:
+        logger.removeHandler(queue_handler)
+
+    assert handle.stopped
+    assert slow.messages == [f"record {n}" for n in range(50)]
+
+
+def test_stop_is_retried_while_the_queue_stays_full(monkeypatch):
+    monkeypatch.setattr(prepare_logger_module, 'STOP_TIMEOUT', 0.05)
+    release = threading.Event()
+
+    class BlockedHandler(logging.Handler):
+        def emit(self, record):
+            release.wait()
+
+    log_queue = queue.Queue(maxsize=1)
+    listener = BlockingQueueListener(log_queue, BlockedHandler())
+    listener.start()
+    handle = AsyncLoggingHandle(listener, OverflowQueueHandler(log_queue))
+    log_queue.put(logging.makeLogRecord({'msg': 'first'}))
+    log_queue.put(logging.makeLogRecord({'msg': 'second'}))
+
+    handle.stop()
+    assert not handle.stopped
+    release.set()
+    handle.stop()
+    assert handle.stopped
+
+
+def test_one_exit_hook_serves_every_async_logger(tmp_path, capsys):
+    handles = prepare_logger_module._async_handles
+    prepare_logger(str(tmp_path / 'a'), 'a_', async_mode=True)
+    prepare_logger(str(tmp_path / 'b'), 'b_', async_mode=True)
+    assert len(handles) == 2
+
+    close_logger(str(tmp_path / 'a'), 'a_')
+    assert len(handles) == 1
+    prepare_logger_module.stop_async_logging()
+    assert handles == []
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        OverflowQueueHandler(queue.Queue(), 'explode')
+
+
+def test_formatter_keeps_microseconds_within_a_cached_second():
+    formatter = CustomFormatter(fmt='%(asctime)s %(message)s', datefmt='%Y-%m-%d %H:%M:%S.%f')
+    first = logging.makeLogRecord({'msg': 'a', 'created': 1700000000.123456})
+    second = logging.makeLogRecord({'msg': 'b', 'created': 1700000000.654321})
+
+    assert formatter.format(first).split()[1].endswith('.123456')
+    assert formatter.format(second).split()[1].endswith('.654321')
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.validation_rules_auth import auth_rules
+from config_tools.validation_rules_config import config_rules
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / 'scripts'
+
+
+@pytest.fixture
+def scripts(monkeypatch):
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    import benchmark_suite
+    import generate_synthetic_config
+    return benchmark_suite, generate_synthetic_config
+
+
+def test_generated_config_pair_passes_the_shipped_rules(tmp_path, scripts):
+    _, generator = scripts
+    config_path = generator.write_config_pair(tmp_path, extra_sections=3, width=2, depth=2, seed=7)
+
+    loader = ConfigLoader(config_path, config_rules, auth_rules)
+
+    assert loader.config['section_2']['key_1']['key_0'] is not None
+    assert 'qTest_bearer_token' in loader.config['auth'].get_data()
+
+
+def test_generation_is_deterministic_per_seed(scripts):
+    _, generator = scripts
+
+    first = generator.generate_config(config_rules, extra_sections=2, seed=3)
+
+    assert first == generator.generate_config(config_rules, extra_sections=2, seed=3)
+    assert yaml.safe_load(yaml.dump(first)) == first
+    assert len(first) == len(config_rules) + 2
+
+
+def test_summarize_reports_milliseconds(scripts):
+    suite, _ = scripts
+
+    assert suite.summarize([0.003, 0.001, 0.002]) == {'runs': 3, 'min_ms': 1.0, 'median_ms': 2.0, 'max_ms': 3.0}
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold(scripts, capsys):
+    suite, _ = scripts
+    baseline = {'results': {'load': {'median_ms': 10.0}, 'logging/sync': {'p99_us': 5.0}, 'new': {'median_ms': 0}}}
+    current = {'results': {'load': {'median_ms': 10.5}, 'logging/sync': {'p99_us': 6.0}, 'gone': {'median_ms': 1}}}
+
+    assert suite.compare(current, baseline, threshold=0.10) == ['logging/sync']
+    assert 'REGRESSION' in capsys.readouterr().out
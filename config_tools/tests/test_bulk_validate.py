@@ -0,0 +1,76 @@
+import json
+from datetime import date
+
+import pytest
+import yaml
+
+from config_tools import bulk_validate
+
+RULES_SPEC = 'config_tools.validation_rules_config:config_rules'
+AUTH_RULES_SPEC = 'config_tools.validation_rules_auth:auth_rules'
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    auth_file = tmp_path / 'auth.yaml'
+    auth_file.write_text(yaml.dump({'qTest_bearer_token': 'Bearer 12345678-1234-1234-1234-123456789abc'}))
+    valid = {
+        'authentication_path': str(auth_file),
+        'qTest_domain': 'https://example.qtestnet.com/',
+        'max_concurrent_requests': 4,
+        'target_date': date.today(),
+        'output_filetype': 'CSV',
+    }
+    configs = tmp_path / 'configs'
+    configs.mkdir()
+    (configs / 'a_valid.yaml').write_text(yaml.dump(valid))
+    (configs / 'b_invalid.yaml').write_text(yaml.dump({**valid, 'output_filetype': 'PDF'}))
+    (configs / 'c_wrong_type.yaml').write_text(yaml.dump({**valid, 'qTest_domain': 123}))
+    return configs
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_every_file_gets_a_result(config_dir, workers):
+    paths = bulk_validate.find_config_files(config_dir)
+
+    results = list(bulk_validate.validate_files(paths, RULES_SPEC, AUTH_RULES_SPEC, workers=workers))
+
+    assert [result['ok'] for result in results] == [True, False, False]
+    assert 'PDF' in results[1]['errors'][0]
+    assert 'qTest_domain' in results[2]['errors'][0]
+
+
+def test_authentication_files_are_not_validated_as_configs(config_dir):
+    auth_file = config_dir / 'auth.yaml'
+    (config_dir.parent / 'auth.yaml').rename(auth_file)
+    for path in config_dir.glob('*_*.yaml'):
+        path.write_text(path.read_text().replace(str(config_dir.parent / 'auth.yaml'), str(auth_file)))
+
+    assert auth_file not in bulk_validate.find_config_files(config_dir)
+    assert auth_file in bulk_validate.find_config_files(config_dir, include_authentication_files=True)
+
+
+def test_unexpected_exception_is_reported_per_file(config_dir, monkeypatch):
+    class ExplodingPlan:
+        def validate(self, config):
+            raise RuntimeError("exploded")
+
+    monkeypatch.setattr(bulk_validate, '_config_plan', ExplodingPlan())
+
+    result = bulk_validate.validate_file(config_dir / 'a_valid.yaml')
+
+    assert result['ok'] is False
+    assert 'exploded' in result['errors'][0]
+
+
+def test_cli_prints_json_lines_and_fails_on_errors(config_dir, capsys):
+    exit_code = bulk_validate.main([str(config_dir), '--config-rules', RULES_SPEC, '--workers', '1'])
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 1
+    assert [line['ok'] for line in lines] == [True, False, False]
+
+
+def test_bad_rules_spec_is_rejected():
+    with pytest.raises(ValueError):
+        bulk_validate.import_rules('no_colon_here')
@@ -0,0 +1,56 @@
+import pytest
+
+from config_tools.collection_validators import (AllowedIntValues, AllowedValues, CollectionValidator, EachIntInRange,
+                                                EachLengthBetween, EachMatches, UniqueItems)
+from config_tools.config_validator import ConfigValidator
+
+
+def test_collection_validator_requires_find_violations():
+    class Incomplete(CollectionValidator):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_error_lists_every_offending_index():
+    validator = AllowedValues(['a', 'b'])
+
+    with pytest.raises(ValueError, match=r"has 7 value\(s\) outside the allowed set at indices \[1, 2, 3, 4, 5, 6, 7\]"):
+        validator('tags', ['a'] + ['z'] * 7)
+    assert validator.check('tags', 'a') is None
+    assert validator.check('tags', [['a']]) is not None
+    assert validator.check('tags', 5) == "Config key 'tags' must be a list. Found: int"
+
+
+def test_allowed_int_values_rejects_bools_and_unknown_ids():
+    validator = AllowedIntValues(range(0, 1000, 2))
+
+    assert validator.find_violations([0, 2, 3, True, '4', 998, 1000]) == [2, 3, 4, 6]
+
+
+def test_unique_items_treats_equal_mappings_as_duplicates_regardless_of_key_order():
+    items = [{'a': 1, 'b': [1, 2]}, {'b': [1, 2], 'a': 1}, {'a': 1, 'b': [2, 1]}, [1, {'x': 1}], [1, {'x': 1}], 1, 1.0]
+
+    assert UniqueItems().find_violations(items) == [1, 4, 6]
+
+
+def test_unique_items_keeps_lists_and_mappings_apart():
+    assert UniqueItems().find_violations([[1, 2], {1: 2}, [[1, 2]], {'a': None}, {'a': []}]) == []
+
+
+@pytest.mark.parametrize('validator, items, violations', [
+    (EachIntInRange(1, 10), [1, 10, 0, 11, True, 5.0], [2, 3, 4, 5]),
+    (EachMatches(r'[a-z]+'), ['ok', 'Not', 'ok2', 3], [1, 2, 3]),
+    (EachLengthBetween(1, 2), ['a', '', 'abc', [1], {}, 5], [1, 2, 4, 5]),
+])
+def test_per_item_validators(validator, items, violations):
+    assert validator.find_violations(items) == violations
+
+
+def test_validators_plug_into_rules():
+    rules = {'ids': {'required': True, 'validator': UniqueItems()}}
+
+    ConfigValidator({'ids': [1, 2, 3]}, rules).validate()
+    with pytest.raises(ValueError, match='duplicate'):
+        ConfigValidator({'ids': [{'a': 1, 'b': 2}, {'b': 2, 'a': 1}]}, rules).validate()
@@ -0,0 +1,65 @@
+import os
+import shutil
+
+import pytest
+
+from config_tools.compiled_config import (ARTIFACT_HEADER, artifact_path_for, compile_config, load_compiled_config,
+                                          write_artifact)
+from config_tools.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def compiled(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'region': 'eu'})
+    artifacts = compile_config(config_file)
+    # Make the artifact distinguishable from the YAML it was compiled from.
+    stat = os.stat(config_file)
+    write_artifact(config_file, {**base_config, 'region': 'compiled'}, stat)
+    return config_file, artifacts[config_file.resolve()]
+
+
+def test_artifacts_are_only_loaded_when_opted_in(compiled):
+    config_file, _ = compiled
+
+    assert ConfigLoader(config_file).config['region'] == 'eu'
+    assert ConfigLoader(config_file, use_compiled=True).config['region'] == 'compiled'
+
+
+def test_naming_the_artifact_loads_it(compiled):
+    _, artifact = compiled
+
+    assert ConfigLoader(artifact).config['region'] == 'compiled'
+
+
+def test_edited_source_makes_the_artifact_stale(compiled):
+    config_file, _ = compiled
+    config_file.write_text(config_file.read_text().replace('region: eu', 'region: us'))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+    assert load_compiled_config(config_file) is None
+    assert ConfigLoader(config_file, use_compiled=True).config['region'] == 'us'
+
+
+def test_source_rolled_back_to_an_older_mtime_is_stale(compiled, tmp_path):
+    config_file, _ = compiled
+    previous = tmp_path / 'previous.yaml'
+    shutil.copy2(config_file, previous)
+    stat = os.stat(previous)
+    os.utime(previous, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+    # Same size, older mtime: what `cp -p` or `rsync -a` of an earlier release leaves behind.
+    shutil.copy2(previous, config_file)
+
+    assert load_compiled_config(config_file) is None
+
+
+def test_corrupt_artifact_is_ignored_or_rejected(compiled):
+    config_file, artifact = compiled
+    data = bytearray(artifact.read_bytes())
+    data[ARTIFACT_HEADER.size + 5] ^= 0xFF
+    artifact.write_bytes(bytes(data))
+
+    assert load_compiled_config(config_file) is None
+    assert ConfigLoader(config_file, use_compiled=True).config['region'] == 'eu'
+    with pytest.raises(ValueError, match='corrupt, stale'):
+        ConfigLoader(artifact_path_for(config_file))
@@ -0,0 +1,100 @@
+from datetime import date, datetime, timedelta
+from functools import partial
+
+import pytest
+
+from config_tools import compiled_rules
+from config_tools.compiled_rules import CompiledRules
+from config_tools.config_validator import ConfigValidator
+from config_tools.validation_rules_config import config_rules
+
+VALID_CONFIG = {
+    'authentication_path': 'auth.yaml',
+    'qTest_domain': 'https://example.qtestnet.com/',
+    'retry_attempts': 3,
+    'log_name_prefix': 'run_',
+    'max_concurrent_requests': 4,
+    'target_date': date.today(),
+    'output_filetype': 'CSV',
+}
+
+
+def test_valid_config_has_no_violations():
+    report = CompiledRules(config_rules).validate(VALID_CONFIG)
+
+    assert report.ok
+    assert report.as_dict() == {'ok': True, 'errors': []}
+
+
+def test_every_violation_is_reported():
+    config = {**VALID_CONFIG, 'qTest_domain': 'http://example.com', 'retry_attempts': -1, 'output_filetype': 'PDF'}
+    del config['max_concurrent_requests']
+
+    report = CompiledRules(config_rules).validate(config)
+
+    assert sorted(violation.key for violation in report.violations) == [
+        'max_concurrent_requests', 'output_filetype', 'qTest_domain', 'retry_attempts']
+    with pytest.raises(ValueError):
+        report.raise_for_errors()
+
+
+def test_messages_match_config_validator():
+    config = {**VALID_CONFIG, 'retry_attempts': -1}
+
+    with pytest.raises(ValueError) as error:
+        ConfigValidator(config, config_rules).validate()
+
+    assert CompiledRules(config_rules).validate(config).violations[0].message == str(error.value)
+
+
+def test_collect_all_mode_lists_every_violation():
+    config = {**VALID_CONFIG, 'retry_attempts': -1, 'output_filetype': 'PDF'}
+
+    with pytest.raises(ValueError) as error:
+        ConfigValidator(config, config_rules).validate(collect_all=True)
+
+    assert 'retry_attempts' in str(error.value) and 'output_filetype' in str(error.value)
+
+
+@pytest.mark.parametrize('key, value', [
+    ('qTest_domain', 123),
+    ('retry_attempts', 'three'),
+    ('target_date', 'yesterday'),
+    ('log_name_prefix', ['run_']),
+])
+def test_wrong_typed_values_are_violations(key, value):
+    report = CompiledRules(config_rules).validate({**VALID_CONFIG, key: value})
+
+    assert [violation.key for violation in report.violations] == [key]
+    assert 'unexpected type' in report.violations[0].message or 'must be' in report.violations[0].message
+
+
+def test_wrapped_validator_type_errors_are_violations():
+    def validator(key, value):
+        value.upper()
+
+    report = CompiledRules({'name': {'validator': validator}}).validate({'name': 5})
+
+    assert report.violations[0].message == "Config key 'name' has an unexpected type int. Found: 5"
+
+
+def test_bare_date_rule_cutoff_is_fixed_at_compile_time(monkeypatch):
+    class FutureDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2100, 1, 1)
+
+    rules = {'target_date': {'validator': ConfigValidator.validate_date}}
+    monkeypatch.setattr(compiled_rules, 'datetime', FutureDatetime)
+    plan = CompiledRules(rules)
+
+    assert not plan.validate({'target_date': date(2090, 1, 1)}).ok
+    assert plan.validate({'target_date': date(2099, 6, 1)}).ok
+
+
+def test_parameterized_validators_are_specialized():
+    check = compiled_rules.compile_validator(partial(ConfigValidator.validate_int_range, min_value=1, max_value=3))
+
+    assert check('n', 2) is None
+    assert check('n', 4) == "Config key 'n' must be less than or equal to 3. Found: 4"
+    assert compiled_rules.compile_validator(ConfigValidator.validate_date)('d', date.today() - timedelta(days=1)) is None
@@ -0,0 +1,63 @@
+import os
+
+from config_tools.config_cache import CACHE_MAGIC, ConfigCache
+from config_tools.config_loader import ConfigLoader
+
+
+def test_second_load_is_served_from_cache(tmp_path, base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 3})
+    cache = ConfigCache(tmp_path / 'cache')
+
+    first = ConfigLoader(config_file, cache=cache)
+    second = ConfigLoader(config_file, cache=cache)
+
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+    assert second.config['retry_attempts'] == first.config['retry_attempts'] == 3
+
+
+def test_changed_file_is_a_miss(tmp_path, base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 3})
+    cache = ConfigCache(tmp_path / 'cache')
+    ConfigLoader(config_file, cache=cache)
+
+    create_temp_yaml_file({**base_config, 'retry_attempts': 4})
+    loader = ConfigLoader(config_file, cache=cache)
+
+    assert loader.config['retry_attempts'] == 4
+    assert cache.stats()['misses'] == 2
+
+
+def test_corrupt_entry_is_discarded(tmp_path, base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+    cache = ConfigCache(tmp_path / 'cache')
+    ConfigLoader(config_file, cache=cache)
+
+    cache_file = cache.cache_file_for(config_file.resolve())
+    cache_file.write_bytes(CACHE_MAGIC + b'\xffgarbage')
+
+    assert ConfigLoader(config_file, cache=cache).config['log_name_prefix'] == 'test_'
+    assert cache.stats()['hits'] == 0
+
+
+def test_clear_removes_entries(tmp_path, base_config, create_temp_yaml_file):
+    cache = ConfigCache(tmp_path / 'cache')
+    ConfigLoader(create_temp_yaml_file(base_config), cache=cache)
+
+    cache.clear()
+
+    assert not any(name.endswith('.pickle') for name in os.listdir(tmp_path / 'cache'))
+    assert cache.stats() == {'hits': 0, 'misses': 0}
+
+
+def test_cache_directory_is_private_and_shared_entries_are_ignored(tmp_path, base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+    cache = ConfigCache(tmp_path / 'cache')
+    ConfigLoader(config_file, cache=cache)
+    assert os.stat(tmp_path / 'cache').st_mode & 0o777 == 0o700
+
+    os.chmod(cache.cache_file_for(config_file.resolve()), 0o666)
+    ConfigLoader(config_file, cache=cache)
+    os.chmod(tmp_path / 'cache', 0o777)
+    ConfigLoader(config_file, cache=cache)
+
+    assert cache.stats() == {'hits': 0, 'misses': 3}
@@ -0,0 +1,151 @@
+import os
+import threading
+from functools import partial
+
+import pytest
+
+from config_tools.config_compose import FragmentCache, compose, deep_merge, dependencies_fresh
+from config_tools.config_loader import ConfigLoader
+from config_tools.config_validator import ConfigValidator
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+def test_deep_merge_merges_mappings_and_replaces_everything_else():
+    base = {'db': {'host': 'a', 'pool': {'size': 1}}, 'hosts': [1, 2], 'flag': True}
+    shared = base['db']
+
+    merged = deep_merge(dict(base), {'db': {'pool': {'timeout': 5}}, 'hosts': [3], 'flag': None})
+
+    assert merged == {'db': {'host': 'a', 'pool': {'size': 1, 'timeout': 5}}, 'hosts': [3], 'flag': None}
+    assert shared == {'host': 'a', 'pool': {'size': 1}}
+
+
+def test_extends_then_include_then_own_keys(tmp_path):
+    _write(tmp_path / 'shared/base.yaml', "db: {host: base, port: 1}\nname: base\n")
+    _write(tmp_path / 'shared/eu.yaml', "__extends__: base.yaml\ndb: {host: eu}\nregion: eu\n")
+    config_file = _write(tmp_path / 'tenant.yaml', "__extends__: shared/eu.yaml\n__include__: [shared/base.yaml]\nname: tenant\n")
+
+    config = {'__extends__': 'shared/eu.yaml', '__include__': ['shared/base.yaml'], 'name': 'tenant'}
+    composed, dependencies = compose(config, config_file, FragmentCache())
+
+    assert composed == {'db': {'host': 'base', 'port': 1}, 'name': 'tenant', 'region': 'eu'}
+    assert sorted(os.path.basename(dependency[0]) for dependency in dependencies) == ['base.yaml', 'eu.yaml']
+
+
+def test_plain_include_and_extends_keys_are_data(base_config, create_temp_yaml_file):
+    config = {**base_config, 'include': ['*.csv'], 'extends': 'BaseModel'}
+
+    assert compose(config, 'root.yaml', FragmentCache()) == (config, [])
+    assert ConfigLoader(create_temp_yaml_file(config)).config['include'] == ['*.csv']
+
+
+def test_include_cycle_is_reported(tmp_path):
+    _write(tmp_path / 'a.yaml', "__include__: b.yaml\n")
+    _write(tmp_path / 'b.yaml', "__include__: a.yaml\n")
+
+    with pytest.raises(ValueError, match='Include cycle detected'):
+        compose({'__include__': 'a.yaml'}, tmp_path / 'root.yaml', FragmentCache())
+
+
+@pytest.mark.parametrize('directive', [5, ['ok.yaml', ''], {'a': 'b'}])
+def test_malformed_directives_are_rejected(tmp_path, directive):
+    with pytest.raises(ValueError, match='must be a path or a list of paths'):
+        compose({'__include__': directive}, tmp_path / 'root.yaml', FragmentCache())
+
+
+def test_missing_fragment_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError, match='missing.yaml'):
+        compose({'__include__': 'missing.yaml'}, tmp_path / 'root.yaml', FragmentCache())
+
+
+def test_fragments_are_parsed_once_and_copied_per_load(tmp_path):
+    fragment = _write(tmp_path / 'base.yaml', "db: {host: base}\n")
+    cache = FragmentCache()
+
+    first, _ = cache.load(fragment)
+    first['db']['host'] = 'mutated'
+    second, _ = cache.load(fragment)
+    _touch(fragment)  # Touched, not changed: re-hashed but not re-parsed.
+    third, _ = cache.load(fragment)
+
+    assert second == third == {'db': {'host': 'base'}}
+    assert cache.stats() == {'hits': 2, 'parses': 1, 'fragments': 1}
+
+
+def test_concurrent_loads_share_one_parse(tmp_path):
+    fragment = _write(tmp_path / 'base.yaml', "items: [%s]\n" % ", ".join(str(n) for n in range(5000)))
+    cache = FragmentCache()
+    barrier = threading.Barrier(8)
+
+    def load():
+        barrier.wait()
+        cache.load(fragment.resolve())
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats()['parses'] == 1
+
+
+def test_fragment_cache_evicts_least_recently_used(tmp_path):
+    cache = FragmentCache(maxsize=2)
+    paths = [_write(tmp_path / f"{name}.yaml", f"name: {name}\n") for name in 'abc']
+    for path in paths:
+        cache.load(path)
+
+    assert cache.stats()['fragments'] == 2
+    with pytest.raises(ValueError):
+        FragmentCache(maxsize=0)
+
+
+def test_dependencies_go_stale_only_on_content_change(tmp_path):
+    fragment = _write(tmp_path / 'base.yaml', "a: 1\n")
+    _, dependency = FragmentCache().load(fragment)
+
+    _touch(fragment)
+    assert dependencies_fresh([dependency])
+    fragment.write_text("a: 2\n")
+    assert not dependencies_fresh([dependency])
+    fragment.unlink()
+    assert not dependencies_fresh([dependency])
+
+
+def test_loader_reloads_when_a_fragment_changes(base_config, create_temp_yaml_file, tmp_path):
+    fragment = _write(tmp_path / 'base.yaml', "region: eu\n")
+    config_file = create_temp_yaml_file({**base_config, '__extends__': 'base.yaml'})
+    loader = ConfigLoader(config_file)
+
+    assert loader.config['region'] == 'eu' and '__extends__' not in loader.config
+    assert [dependency[0] for dependency in loader.dependencies] == [str(fragment.resolve())]
+
+    fragment.write_text("region: us\n")
+    _touch(fragment)
+    assert loader.reload() is True
+    assert loader.config['region'] == 'us'
+
+
+def test_failed_reload_keeps_the_installed_dependencies(base_config, create_temp_yaml_file, tmp_path):
+    fragment = _write(tmp_path / 'base.yaml', "retry_attempts: 1\n")
+    config_file = create_temp_yaml_file({**base_config, '__extends__': 'base.yaml'})
+    rules = {'retry_attempts': {'required': True,
+                                'validator': partial(ConfigValidator.validate_int_range, min_value=1)}}
+    loader = ConfigLoader(config_file, config_rules=rules)
+    installed = list(loader.dependencies)
+
+    fragment.write_text("retry_attempts: 0\n")
+    _touch(fragment)
+    assert loader.reload() is False
+    assert loader.dependencies == installed and loader.config['retry_attempts'] == 1
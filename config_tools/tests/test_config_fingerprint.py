@@ -0,0 +1,114 @@
+import json
+import os
+from datetime import date
+
+import pytest
+
+from config_tools.config_fingerprint import (ConfigFingerprint, canonical_encoding, diff_configs, fingerprint_config,
+                                             fingerprint_file, main, read_manifest, write_manifest)
+from config_tools.config_loader import ConfigLoader
+from config_tools.utils import SensitiveDict
+
+CONFIG = {'db': {'host': 'a', 'pool': {'size': 5}}, 'hosts': ['x', 'y'], 'since': date(2024, 1, 1)}
+
+
+def test_key_order_does_not_change_the_fingerprint():
+    reordered = {'since': date(2024, 1, 1), 'hosts': ['x', 'y'], 'db': {'pool': {'size': 5}, 'host': 'a'}}
+
+    assert fingerprint_config(CONFIG) == fingerprint_config(reordered)
+    assert fingerprint_config(CONFIG) != fingerprint_config({**CONFIG, 'hosts': ['y', 'x']})
+
+
+# Lists and tuples are deliberately absent: they share an encoding, so a frozen snapshot fingerprints
+# like the loaded config.
+@pytest.mark.parametrize('left, right', [(1, '1'), (1, 1.0), (True, 1), (None, 'None'), ({'a': 1}, [['a', 1]])])
+def test_types_are_part_of_the_encoding(left, right):
+    assert canonical_encoding(left) != canonical_encoding(right)
+
+
+def test_secrets_are_excluded_or_hmaced():
+    config = {**CONFIG, 'auth': SensitiveDict({'token': 'hunter2'}), 'logger': object()}
+
+    plain = fingerprint_config(config)
+    keyed = fingerprint_config(config, secret_key=b'k1')
+
+    assert 'auth' not in plain.sections and 'logger' not in plain.sections
+    assert 'hunter2' not in json.dumps(keyed.as_manifest())
+    assert keyed.sections['auth'] != fingerprint_config(config, secret_key=b'k2').sections['auth']
+    rotated = fingerprint_config({**config, 'auth': SensitiveDict({'token': 'new'})}, secret_key=b'k1')
+    assert diff_configs(config, {**config, 'auth': SensitiveDict({'token': 'new'})}, b'k1',
+                        keyed, rotated).changed == ['auth']
+
+
+def test_diff_reports_dotted_paths():
+    new = {'db': {'host': 'b', 'pool': {}, 'user': 'u'}, 'hosts': ['x', 'y'], 'region': 'eu'}
+
+    diff = diff_configs(CONFIG, new)
+
+    assert diff.as_dict() == {'identical': False, 'added': ['db.user', 'region'],
+                              'removed': ['db.pool.size', 'since'], 'changed': ['db.host']}
+    assert not diff_configs(CONFIG, dict(CONFIG))
+
+
+def test_manifest_round_trip_and_corruption(tmp_path):
+    fingerprint = fingerprint_config(CONFIG)
+    manifest = tmp_path / 'expected.json'
+    write_manifest(fingerprint, manifest, source='config.yaml')
+
+    assert read_manifest(manifest) == fingerprint
+
+    data = json.loads(manifest.read_text())
+    data['sections']['db'] = '0' * 64
+    manifest.write_text(json.dumps(data))
+    with pytest.raises(ValueError, match='corrupt'):
+        read_manifest(manifest)
+    with pytest.raises(ValueError, match='Unsupported'):
+        ConfigFingerprint.from_manifest({'format': 99})
+
+
+def test_cli_write_and_check(base_config, create_temp_yaml_file, tmp_path, capsys, monkeypatch):
+    auth_file = create_temp_yaml_file({'qTest_bearer_token': 'Bearer x'}, filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'region': 'eu', 'authentication_path': str(auth_file)})
+    manifest = tmp_path / 'expected.json'
+    monkeypatch.setenv('FINGERPRINT_KEY', 'k')
+
+    assert main(['write', str(config_file), str(manifest), '--secret-key-env', 'FINGERPRINT_KEY']) == 0
+    assert main(['check', str(config_file), str(manifest), '--secret-key-env', 'FINGERPRINT_KEY']) == 0
+    capsys.readouterr()
+
+    auth_file.write_text("qTest_bearer_token: Bearer y\n")
+    assert main(['check', str(config_file), str(manifest), '--secret-key-env', 'FINGERPRINT_KEY']) == 1
+    assert json.loads(capsys.readouterr().out)['changed'] == ['auth']
+
+    assert main(['check', str(config_file), str(manifest)]) == 2  # Secrets handled differently.
+    assert main(['check', str(config_file), str(manifest), '--secret-key-env', 'UNSET_FINGERPRINT_KEY']) == 2
+
+
+def test_cli_reads_files_like_the_loader(base_config, create_temp_yaml_file, tmp_path, monkeypatch):
+    # The loader never composes the authentication file, so a directive key there is plain data.
+    auth_file = create_temp_yaml_file({'qTest_bearer_token': 'Bearer x', '__include__': 'missing.yaml'},
+                                      filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'region': 'eu', 'authentication_path': str(auth_file)})
+    manifest = tmp_path / 'expected.json'
+    write_manifest(ConfigLoader(config_file).fingerprint(b'k'), manifest)
+    monkeypatch.setenv('FINGERPRINT_KEY', 'k')
+
+    assert fingerprint_file(config_file, b'k') == ConfigLoader(config_file).fingerprint(b'k')
+    assert main(['check', str(config_file), str(manifest), '--secret-key-env', 'FINGERPRINT_KEY']) == 0
+
+
+def test_loader_fingerprint_matches_file_and_tracks_reload(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'region': 'eu'})
+    loader = ConfigLoader(config_file)
+    other = ConfigLoader(create_temp_yaml_file({**base_config, 'region': 'us'}, filename='other.yaml'))
+
+    before = loader.fingerprint()
+    assert loader.fingerprint() is before
+    assert loader.diff(other).changed == ['region']
+
+    config_file.write_text(config_file.read_text().replace('region: eu', 'region: us'))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert loader.reload() is True
+    assert loader.fingerprint() != before
+    assert loader.diff(other).identical
@@ -0,0 +1,90 @@
+import os
+from functools import partial
+
+import pytest
+
+from config_tools.compiled_rules import CompiledRules
+from config_tools.config_index import ConfigIndex, coerce, resolve_path
+from config_tools.config_loader import ConfigLoader
+from config_tools.config_validator import ConfigValidator
+from config_tools.utils import normalize_config
+
+CONFIG = {'database': {'pool': {'size': '20', 'timeout': 2.0}, 'hosts': ['a', 'b'], 'ports': {5432: 'primary'}},
+          'features': {'debug': 'yes', 'empty': None}, 'dotted.key': 'top'}
+
+
+def test_index_flattens_every_path():
+    index = ConfigIndex(CONFIG)
+
+    assert index.get('database.pool.size') == '20'
+    assert index.get('database.hosts') == ['a', 'b']
+    assert index.get('database.ports.5432') == 'primary'
+    assert index.get('dotted.key') == 'top'
+    assert index.get('features.empty', default='fallback') == 'fallback'
+    assert index.get('database.missing.path', default=0) == 0
+    assert 'database.pool' in index and 'database.pool.size.extra' not in index
+
+
+def test_resolve_path_matches_the_index():
+    for path in ('database.pool.size', 'database.ports.5432', 'dotted.key', 'features.empty', 'nope.nope'):
+        assert resolve_path(CONFIG, path) == ConfigIndex(CONFIG).get(path)
+
+
+@pytest.mark.parametrize('value, type, expected', [
+    ('20', int, 20), (3.0, int, 3), ('yes', bool, True), ('Off', bool, False), (0, bool, False),
+    ('a', list, ['a']), (['a'], tuple, ('a',)), ('2.5', float, 2.5), (5, str, '5'),
+])
+def test_coerce(value, type, expected):
+    assert coerce('key', value, type) == expected
+
+
+@pytest.mark.parametrize('value, type', [('2.5', int), (2.5, int), (True, int), ('maybe', bool), ('x', float)])
+def test_coerce_rejects_inexact_conversions(value, type):
+    with pytest.raises(ValueError, match="Config key 'key' cannot be converted"):
+        coerce('key', value, type)
+
+
+def test_apply_changes_rewalks_only_changed_keys():
+    index = ConfigIndex(CONFIG)
+    updated = {**CONFIG, 'features': {'debug': 'no'}}
+
+    new_index = index.apply_changes(updated, {'features'})
+
+    assert new_index.get('features.debug', type=bool) is False
+    assert new_index.get('features.empty') is None and 'features.empty' not in new_index
+    assert new_index.get('database.pool.size', type=int) == 20
+    assert index.get('features.debug', type=bool) is True
+
+
+def test_nested_keys_are_normalized():
+    config = normalize_config({' pool settings ': {'max size': 5, 'inner': [{'a key': 1}]}})
+
+    assert config == {'pool_settings': {'max_size': 5, 'inner': [{'a_key': 1}]}}
+
+
+def test_dotted_rules_validate_nested_values():
+    rules = {'database.pool.size': {'required': True, 'validator': partial(ConfigValidator.validate_int_range, min_value=1)},
+             'database.pool.name': {'required': True}}
+    config = {'database': {'pool': {'size': 0}}}
+
+    with pytest.raises(ValueError) as excinfo:
+        ConfigValidator(config, rules).validate(collect_all=True)
+    assert "'database.pool.size' must be greater than or equal to 1" in str(excinfo.value)
+    assert "Missing required config key: 'database.pool.name'" in str(excinfo.value)
+    report = CompiledRules(rules).validate(config)
+    assert {violation.message for violation in report.violations} == set(str(excinfo.value).split('; '))
+
+
+def test_loader_get_is_reindexed_on_reload(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'database': {'pool size': '10'}})
+    loader = ConfigLoader(config_file)
+
+    assert loader.get('database.pool_size', type=int) == 10
+    with pytest.raises(ValueError):
+        loader.get('database.pool_size', type=bool)
+
+    config_file.write_text(config_file.read_text().replace("'10'", "'30'"))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert loader.reload() is True
+    assert loader.get('database.pool_size', type=int) == 30
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+
+import pytest
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.config_registry import ConfigRegistry
+
+
+def _touch(path, content):
+    """Rewrite a file and move its mtime forward so the change is visible at any timestamp resolution."""
+    path.write_text(content)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+def test_same_arguments_share_one_loader(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+    registry = ConfigRegistry(ConfigLoader)
+
+    assert registry.get_or_load(config_file) is registry.get_or_load(config_file)
+    assert registry.loads == 1
+
+
+def test_loader_kwargs_are_part_of_the_key(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+    registry = ConfigRegistry(ConfigLoader)
+
+    eager = registry.get_or_load(config_file)
+    lazy = registry.get_or_load(config_file, lazy=True)
+
+    assert eager is not lazy
+    assert lazy.lazy and not eager.lazy
+    assert registry.get_or_load(config_file, lazy=True) is lazy
+
+
+def test_changed_config_file_is_reloaded(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1})
+    registry = ConfigRegistry(ConfigLoader)
+    first = registry.get_or_load(config_file)
+
+    _touch(config_file, config_file.read_text().replace('retry_attempts: 1', 'retry_attempts: 2'))
+    second = registry.get_or_load(config_file)
+
+    assert second is not first
+    assert second.config['retry_attempts'] == 2
+
+
+def test_changed_auth_file_is_reloaded(base_config, create_temp_yaml_file):
+    auth_file = create_temp_yaml_file({'token': 'a'}, filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'authentication_path': str(auth_file)})
+    registry = ConfigRegistry(ConfigLoader)
+    first = registry.get_or_load(config_file)
+
+    _touch(auth_file, 'token: b\n')
+
+    assert registry.get_or_load(config_file) is not first
+
+
+def test_auth_edit_during_load_is_not_recorded_as_fresh(base_config, create_temp_yaml_file):
+    auth_file = create_temp_yaml_file({'token': 'a'}, filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'authentication_path': str(auth_file)})
+
+    def factory(path, **kwargs):
+        loader = ConfigLoader(path, **kwargs)
+        _touch(auth_file, 'token: b\n')  # Lands after the loader read the file, before the registry records it.
+        return loader
+
+    registry = ConfigRegistry(factory)
+    registry.get_or_load(config_file)
+
+    assert registry.get_or_load(config_file).config['auth'].get_data() == {'token': 'b'}
+    assert registry.loads == 2
+
+
+def test_least_recently_used_entry_is_evicted(base_config, create_temp_yaml_file):
+    paths = [create_temp_yaml_file(base_config, filename=f'config_{n}.yaml') for n in range(3)]
+    registry = ConfigRegistry(ConfigLoader, maxsize=2)
+
+    for path in paths:
+        registry.get_or_load(path)
+
+    assert len(registry) == 2
+    registry.get_or_load(paths[0])
+    assert registry.loads == 4
+
+
+def test_concurrent_callers_wait_on_a_single_load(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+    registry = ConfigRegistry(ConfigLoader)
+    barrier = threading.Barrier(8)
+    loaders = []
+
+    def worker():
+        barrier.wait()
+        loaders.append(registry.get_or_load(config_file))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.loads == 1
+    assert all(loader is loaders[0] for loader in loaders)
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ConfigRegistry(ConfigLoader, maxsize=0)
+
+
+def test_evicted_loader_keeps_working_for_its_holder(base_config, create_temp_yaml_file):
+    auth_file = create_temp_yaml_file({'qTest_bearer_token': 'Bearer x'}, filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1, 'authentication_path': str(auth_file)})
+    registry = ConfigRegistry(ConfigLoader, maxsize=1)
+    held = registry.get_or_load(config_file, secret_ttl=300)
+    held.start_reload(interval=0.05, use_inotify=False)
+    try:
+        registry.get_or_load(create_temp_yaml_file(base_config, filename='other.yaml'))
+        registry.invalidate()
+
+        assert held.config['auth'].source._thread.is_alive()
+        _touch(config_file, config_file.read_text().replace('retry_attempts: 1', 'retry_attempts: 2'))
+        deadline = time.monotonic() + 5
+        while held.config['retry_attempts'] != 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert held.config['retry_attempts'] == 2
+    finally:
+        held.close()
@@ -0,0 +1,108 @@
+import os
+import time
+from functools import partial
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.config_validator import ConfigValidator
+
+RULES = {'retry_attempts': {'required': False, 'validator': partial(ConfigValidator.validate_int_range, min_value=0)}}
+
+
+def _rewrite(path, old, new):
+    path.write_text(path.read_text().replace(old, new))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_reload_swaps_in_changed_keys_and_notifies(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1, 'region': 'eu'})
+    loader = ConfigLoader(config_file, config_rules=RULES)
+    notifications = []
+    loader.subscribe(lambda snapshot, changed: notifications.append((snapshot['retry_attempts'], changed)))
+
+    _rewrite(config_file, 'retry_attempts: 1', 'retry_attempts: 2')
+
+    assert loader.reload() is True
+    assert loader.config['retry_attempts'] == 2
+    assert notifications == [(2, {'retry_attempts'})]
+    assert loader.reload() is False
+
+
+def test_invalid_edit_keeps_last_good_config(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1})
+    loader = ConfigLoader(config_file, config_rules=RULES)
+
+    _rewrite(config_file, 'retry_attempts: 1', 'retry_attempts: -5')
+
+    assert loader.reload() is False
+    assert loader.config['retry_attempts'] == 1
+
+
+def test_wrong_typed_edit_keeps_last_good_config(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1})
+    loader = ConfigLoader(config_file, config_rules=RULES)
+
+    _rewrite(config_file, 'retry_attempts: 1', 'retry_attempts: three')
+
+    assert loader.reload() is False
+    assert loader.config['retry_attempts'] == 1
+
+
+def test_watcher_survives_a_bad_edit_and_picks_up_the_fix(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1})
+    loader = ConfigLoader(config_file, config_rules=RULES)
+    loader.start_reload(interval=0.05, use_inotify=False)
+    try:
+        _rewrite(config_file, 'retry_attempts: 1', 'retry_attempts: three')
+        time.sleep(0.3)
+        assert loader.config['retry_attempts'] == 1
+        assert loader._watcher._thread.is_alive()
+
+        _rewrite(config_file, 'retry_attempts: three', 'retry_attempts: 3')
+        assert _wait_for(lambda: loader.config['retry_attempts'] == 3)
+    finally:
+        loader.stop_reload()
+
+
+def test_watcher_thread_survives_a_raising_callback(tmp_path):
+    from config_tools.config_watcher import FileWatcher
+
+    watched = tmp_path / 'watched.yaml'
+    watched.write_text('a: 1\n')
+    calls = []
+    errors = []
+
+    def on_change(changed):
+        calls.append(changed)
+        raise TypeError("boom")
+
+    watcher = FileWatcher([watched], on_change, interval=0.05, use_inotify=False, on_error=errors.append)
+    watcher.start()
+    try:
+        _rewrite(watched, 'a: 1', 'a: 2')
+        assert _wait_for(lambda: len(calls) == 1)
+        _rewrite(watched, 'a: 2', 'a: 3')
+        assert _wait_for(lambda: len(calls) == 2)
+        assert all(isinstance(error, TypeError) for error in errors)
+    finally:
+        watcher.stop()
+
+
+def test_auth_reload_replaces_auth_data(base_config, create_temp_yaml_file):
+    auth_file = create_temp_yaml_file({'token': 'a'}, filename='auth.yaml')
+    config_file = create_temp_yaml_file({**base_config, 'authentication_path': str(auth_file)})
+    loader = ConfigLoader(config_file)
+
+    _rewrite(auth_file, 'token: a', 'token: b')
+
+    assert loader.reload() is True
+    assert loader.config['auth'].get_data() == {'token': 'b'}
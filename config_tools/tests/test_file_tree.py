@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from config_tools.file_tree import TreeFilter, extract_number, generate_file_tree, main, write_file_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / 'project'
+    for relative in ('10_late/a.py', '2_early/b.py', '2_early/nested/c.txt', 'docs/readme.md',
+                     'docs/notes.tmp', '.git/HEAD', 'setup.py', '_private.py'):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x')
+    return root
+
+
+def _render(root, **kwargs):
+    stream = io.StringIO()
+    write_file_tree(str(root), stream, **kwargs)
+    return stream.getvalue()
+
+
+def test_entries_sort_by_leading_number_then_name():
+    assert sorted(['b', '10_x', '2_y', 'a'], key=lambda name: (extract_number(name), name)) == ['2_y', '10_x', 'a', 'b']
+
+
+def test_parallel_and_sequential_output_match(tree):
+    tree_filter = TreeFilter(['_'], ['.tmp'], ['.txt'], ['.git'])
+
+    sequential = _render(tree, tree_filter=tree_filter, workers=0)
+
+    assert sequential == _render(tree, tree_filter=tree_filter, workers=4, parallel_depth=3)
+    assert sequential == _render(tree, tree_filter=tree_filter, workers=1)
+    assert sequential.splitlines() == [
+        'project/',
+        '│   ├── 2_early/',
+        '│   │   ├── b.py',
+        '│   │   └── nested/',
+        '│   ├── 10_late/',
+        '│   │   └── a.py',
+        '│   ├── docs/',
+        '│   │   └── readme.md',
+        '│   └── setup.py',
+    ]
+
+
+def test_filters_only_apply_to_files(tree):
+    (tree / '_private_dir').mkdir()
+
+    output = _render(tree, tree_filter=TreeFilter(exclude_prefixes=['_']), workers=0)
+
+    assert '_private_dir/' in output
+    assert '_private.py' not in output
+    assert '.git/' in output
+
+
+def test_generate_file_tree_writes_header_and_replaces_old_trees(tree, tmp_path):
+    prefix = str(tmp_path / 'out' / 'tree')
+    (tmp_path / 'out').mkdir()
+    (tmp_path / 'out' / 'tree_old.txt').write_text('old')
+
+    output_file = generate_file_tree(str(tree), prefix, exclude_folders=['.git'], delete_existing=True, workers=2)
+
+    text = open(output_file, encoding='utf-8').read()
+    assert text.startswith(f"Target Path: {tree}\n")
+    assert "Exclude Folders: '.git'\n" in text
+    assert not (tmp_path / 'out' / 'tree_old.txt').exists()
+
+
+def test_cli_prints_tree_and_rejects_missing_directories(tree, tmp_path, capsys):
+    assert main([str(tree), '--stdout', '--exclude-folder', '.git', '--workers', '0']) == 0
+    assert capsys.readouterr().out == _render(tree, tree_filter=TreeFilter(exclude_folders=['.git']), workers=0)
+
+    assert main([str(tmp_path / 'missing'), '--stdout']) == 1
@@ -0,0 +1,94 @@
+import os
+import pickle
+import threading
+
+import pytest
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.frozen_config import FrozenConfig, freeze, thaw
+from config_tools.utils import SensitiveDict
+
+DATA = {'name': 'svc', 'limits': {'retries': 3, 'hosts': ['a', 'b']}, 'tags': {'x', 'y'}}
+
+
+def test_freeze_is_deep_and_immutable():
+    frozen = freeze(DATA)
+
+    assert frozen['limits']['hosts'] == ('a', 'b')
+    assert frozen.limits.retries == 3
+    assert frozen['tags'] == frozenset({'x', 'y'})
+    with pytest.raises(AttributeError):
+        frozen.name = 'other'
+    with pytest.raises(TypeError):
+        frozen['name'] = 'other'
+    with pytest.raises(AttributeError, match="no key or attribute 'missing'"):
+        frozen.missing
+
+
+def test_freeze_copies_instead_of_sharing_mutable_input():
+    data = {'limits': {'hosts': ['a']}}
+    frozen = freeze(data)
+    data['limits']['hosts'].append('b')
+
+    assert frozen['limits']['hosts'] == ('a',)
+    assert freeze(frozen) is frozen
+
+
+def test_thaw_round_trips_and_pickles():
+    frozen = freeze(DATA)
+
+    assert thaw(freeze({'limits': DATA['limits']})) == {'limits': DATA['limits']}
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_same_key_layouts_share_one_index():
+    rows = freeze([{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}])
+
+    assert rows[0]._index is rows[1]._index
+    assert isinstance(rows[0], FrozenConfig)
+
+
+def test_sensitive_values_stay_masked():
+    frozen = freeze({'auth': SensitiveDict({'token': 'secret'})})
+
+    assert isinstance(frozen['auth'], SensitiveDict)
+    assert 'secret' not in repr(frozen)
+    assert frozen['auth'].get_data()['token'] == 'secret'
+
+
+def test_snapshot_is_shared_until_reload(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'region': 'eu'})
+    loader = ConfigLoader(config_file)
+    snapshots = []
+    threads = [threading.Thread(target=lambda: snapshots.append(loader.snapshot())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0]['region'] == 'eu'
+
+    config_file.write_text(config_file.read_text().replace('region: eu', 'region: us'))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert loader.reload() is True
+
+    assert loader.snapshot()['region'] == 'us'
+    assert snapshots[0]['region'] == 'eu'
+
+
+def test_reload_refreezes_only_changed_sections(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': 1, 'hosts': ['a', 'b'], 'db': {'port': 1}})
+    loader = ConfigLoader(config_file)
+    before = loader.snapshot()
+
+    config_file.write_text(config_file.read_text().replace('retry_attempts: 1', 'retry_attempts: 2'))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert loader.reload() is True
+    after = loader.snapshot()
+
+    assert after['retry_attempts'] == 2 and before['retry_attempts'] == 1
+    assert after['hosts'] is before['hosts'] and after['db'] is before['db']
+    assert list(after) == list(loader.config)
@@ -0,0 +1,111 @@
+from functools import partial
+
+import pytest
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.config_validator import ConfigValidator
+from config_tools.lazy_config import LazyConfig, index_top_level_keys
+
+RULES = {'retry_attempts': {'required': False, 'validator': partial(ConfigValidator.validate_int_range, min_value=0)}}
+
+
+def _write(tmp_path, text, name='lazy.yaml'):
+    path = tmp_path / name
+    path.write_bytes(text.encode('utf-8'))
+    return path
+
+
+def test_index_maps_each_key_to_its_section(tmp_path):
+    text = "# header\nalpha: 1\nbeta:\n  nested: [1, 2]\n'gamma key': three\n"
+    path = _write(tmp_path, text)
+
+    sections = index_top_level_keys(path, chunk_size=8)
+
+    assert list(sections) == ['alpha', 'beta', 'gamma_key']
+    start, end = sections['beta']
+    assert text.encode()[start:end] == b"beta:\n  nested: [1, 2]\n"
+
+
+@pytest.mark.parametrize('text', [
+    '{alpha: 1}\n',
+    '---\nalpha: 1\n---\nbeta: 2\n',
+    'note: "first line\nsecond: line"\nthird: 3\n',
+    "note: 'it''s\nsecond: line'\n",
+    'items: [1,\nsecond: 2]\n',
+    '\ufeffalpha: 1\nbeta: 2\n',
+    'alpha: 1\n? beta\n: 2\n',
+    'alpha: &anchor 1\n&other beta: 2\n',
+])
+def test_index_falls_back_to_eager_parsing(tmp_path, text):
+    assert index_top_level_keys(_write(tmp_path, text)) is None
+
+
+def test_closed_quoted_and_flow_values_stay_lazy(tmp_path):
+    path = _write(tmp_path, 'a: "x: y"\nb: \'it\'\'s\'\nc: [1, {d: 2}]\ne: "esc \\" quote"\n')
+    assert list(index_top_level_keys(path)) == ['a', 'b', 'c', 'e']
+
+
+def test_sections_parse_on_first_access(tmp_path):
+    loaded = []
+    config = LazyConfig.from_file(_write(tmp_path, 'alpha: 1\nbeta:\n  Nested Key: 2\n'),
+                                  on_load=lambda key, value: loaded.append(key))
+
+    assert config.loaded_keys() == set()
+    assert config['beta'] == {'Nested_Key': 2}
+    assert loaded == ['beta']
+    assert dict(config) == {'alpha': 1, 'beta': {'Nested_Key': 2}}
+    assert loaded == ['beta', 'alpha']
+
+
+def test_misread_index_switches_to_eager_mode(tmp_path):
+    text = 'note: "first line\nsecond: 2\nthird: 3"\nlast: 4\n'
+    path = _write(tmp_path, text)
+    # Force the index a plain line scan would produce, with phantom 'second' and 'third' keys.
+    sections = {}
+    for key, line in (('note', 'note:'), ('second', 'second:'), ('third', 'third:'), ('last', 'last:')):
+        sections[key] = text.index(line)
+    starts = list(sections.values()) + [len(text)]
+    config = LazyConfig(path, {key: (start, starts[i + 1]) for i, (key, start) in enumerate(sections.items())})
+
+    assert config['second'] == 2  # Parses standalone, before the misread is noticed.
+    assert config['note'] == 'first line second: 2 third: 3'  # Needs the full parse.
+
+    with pytest.raises(KeyError):
+        config['second']
+    assert list(config) == ['note', 'last']
+    assert 'third' not in config
+    assert dict(config) == {'note': 'first line second: 2 third: 3', 'last': 4}
+
+
+def test_lazy_loader_reads_multiline_scalars(tmp_path, base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file(base_config)
+    with open(config_file, 'a') as file:
+        file.write('note: "first line\nsecond: line"\n')
+
+    loader = ConfigLoader(config_file, lazy=True)
+
+    assert loader.config['note'] == 'first line second: line'
+    assert 'second' not in loader.config
+    assert loader.get('note') == 'first line second: line'
+
+
+@pytest.mark.parametrize('prefix, suffix', [('\ufeff', 'beta: 2\n'), ('', 'alpha: 1\n? beta\n: 2\n')])
+def test_lazy_and_eager_loaders_agree(base_config, create_temp_yaml_file, prefix, suffix):
+    config_file = create_temp_yaml_file(base_config)
+    config_file.write_bytes((prefix + config_file.read_text() + suffix).encode('utf-8'))
+    rules = {'beta': {'required': True}}
+
+    lazy = ConfigLoader(config_file, config_rules=rules, lazy=True)
+    eager = ConfigLoader(config_file, config_rules=rules)
+
+    assert lazy.config['beta'] == eager.config['beta'] == 2
+    assert 'beta' in lazy.config and lazy.get('beta') == 2
+
+
+def test_lazy_loader_validates_sections_on_access(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'retry_attempts': -1})
+    loader = ConfigLoader(config_file, config_rules=RULES, lazy=True)
+
+    assert isinstance(loader.config, LazyConfig)
+    with pytest.raises(ValueError):
+        loader.config['retry_attempts']
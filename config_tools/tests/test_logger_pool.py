@@ -0,0 +1,129 @@
+import logging
+import os
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from config_tools import prepare_logger as prepare_logger_module
+from config_tools.config_loader import ConfigLoader
+from config_tools.prepare_logger import (CompressingRotatingFileHandler, apply_retention, close_logger,
+                                         prepare_logger)
+
+
+def _file_handler(log_path, prefix):
+    entry = prepare_logger_module._LOGGER_POOL[prepare_logger_module._pool_key(str(log_path), prefix)]
+    return next(handler for handler in entry.handlers if isinstance(handler, logging.FileHandler))
+
+
+def _touch(path, size=10, age_days=0):
+    path.write_bytes(b'x' * size)
+    mtime = time.time() - age_days * 86400
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_loggers_are_pooled_per_directory_and_prefix(tmp_path):
+    first = prepare_logger(str(tmp_path), 'svc_')
+
+    assert prepare_logger(str(tmp_path), 'svc_') is first
+    assert prepare_logger(str(tmp_path), 'other_') is not first
+    assert len(list(tmp_path.glob('*.log'))) == 2
+
+    close_logger(str(tmp_path), 'svc_')
+    assert prepare_logger(str(tmp_path), 'svc_') is first  # Reopened on the same logger object.
+
+
+def test_retention_only_matches_its_own_prefix(tmp_path):
+    own = [_touch(tmp_path / 'app_2024_01_01_000000.log'), _touch(tmp_path / 'app_2024_01_01_000000.log.1.gz'),
+           _touch(tmp_path / 'app_2024_01_01_000000.log.2')]
+    others = [_touch(tmp_path / 'app_worker_2024_01_01_000000.log'), _touch(tmp_path / 'notes.log'),
+              _touch(tmp_path / 'app_2024_01_01_000000.log.3.pending'), _touch(tmp_path / '2024_01_01_000000.log')]
+
+    deleted = apply_retention(str(tmp_path), 'app_', max_total_bytes=1)
+
+    assert sorted(deleted) == sorted(str(path) for path in own)
+    assert all(path.exists() for path in others)
+
+
+def test_retention_keeps_files_of_other_pooled_loggers(tmp_path):
+    prepare_logger(str(tmp_path), 'svc_b_').info('still writing')
+    other_file = _file_handler(tmp_path, 'svc_b_').baseFilename
+    old = _touch(tmp_path / '2020_01_01_000000.log.1.gz', age_days=30)
+
+    prepare_logger(str(tmp_path), '', max_total_bytes=1, max_age_days=7)
+    _file_handler(tmp_path, '').wait_for_compression()
+
+    assert os.path.exists(other_file)
+    assert os.path.exists(_file_handler(tmp_path, '').baseFilename)
+    assert not old.exists()
+
+
+def test_rotated_logs_are_compressed_in_the_background(tmp_path):
+    handler = CompressingRotatingFileHandler(str(tmp_path / 'app_2024_01_01_000000.log'), maxBytes=200, backupCount=3)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        for index in range(20):
+            handler.emit(logging.makeLogRecord({'msg': f"record {index:03d} " + 'x' * 40}))
+        handler.wait_for_compression()
+    finally:
+        handler.close()
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == ['app_2024_01_01_000000.log'] + [f"app_2024_01_01_000000.log.{n}.gz" for n in (1, 2, 3)]
+
+
+def test_failed_compression_never_stops_logging(tmp_path, monkeypatch):
+    def failing_gzip(source, dest):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(prepare_logger_module, '_gzip_file', failing_gzip)
+    handler = CompressingRotatingFileHandler(str(tmp_path / 'app_2024_01_01_000000.log'), maxBytes=100, backupCount=2)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    failed = Future()
+    failed.set_exception(RuntimeError("earlier task failed"))
+    handler._pending = failed
+    try:
+        for index in range(10):
+            handler.emit(logging.makeLogRecord({'msg': f"record {index} " + 'x' * 40}))
+        handler.wait_for_compression()
+    finally:
+        handler.close()
+
+    # Every failed rotation is kept under its own name, and the last record reached the active file.
+    kept = sorted(tmp_path.glob('app_2024_01_01_000000.log.1.*'))
+    assert len(kept) >= 2
+    records = ''.join(path.read_text() for path in kept) + (tmp_path / 'app_2024_01_01_000000.log').read_text()
+    assert all(f"record {index} " in records for index in range(10))
+    assert {str(path) for path in kept} <= set(apply_retention(str(tmp_path), 'app_', max_total_bytes=1))
+
+
+def test_retention_applies_without_compression(tmp_path):
+    old = _touch(tmp_path / 'app_2023_01_01_000000.log', age_days=30)
+    handler = CompressingRotatingFileHandler(str(tmp_path / 'app_2024_01_01_000000.log'), maxBytes=100, backupCount=2,
+                                             max_age_days=7, retention_prefix='app_', compress=False)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        for index in range(5):
+            handler.emit(logging.makeLogRecord({'msg': f"record {index} " + 'x' * 40}))
+        handler.wait_for_compression()
+    finally:
+        handler.close()
+
+    assert not old.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'app_2024_01_01_000000.log', 'app_2024_01_01_000000.log.1', 'app_2024_01_01_000000.log.2']
+
+
+@pytest.mark.parametrize('value', ['7', 0, -1, True])
+def test_invalid_retention_limits_are_rejected(tmp_path, value):
+    with pytest.raises(ValueError, match='max_age_days must be a positive number'):
+        CompressingRotatingFileHandler(str(tmp_path / 'a.log'), max_age_days=value)
+
+
+def test_loader_rejects_wrong_typed_retention_before_creating_the_logger(base_config, create_temp_yaml_file):
+    config_file = create_temp_yaml_file({**base_config, 'log_retention_days': '7'})
+
+    with pytest.raises(ValueError, match="'log_retention_days' must be a positive integer"):
+        ConfigLoader(config_file)
+    assert not prepare_logger_module._LOGGER_POOL
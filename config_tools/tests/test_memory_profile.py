@@ -0,0 +1,90 @@
+import json
+import sys
+import tracemalloc
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.frozen_config import freeze
+from config_tools.lazy_config import LazyConfig
+from config_tools.memory_profile import MemoryTrace, deep_sizeof, memory_breakdown
+from config_tools.secret_providers import SecretCache, SecretProvider
+from config_tools.utils import SensitiveDict
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    shared = ['x' * 1000]
+    seen = set()
+
+    first = deep_sizeof({'a': shared}, seen)
+    second = deep_sizeof({'b': shared}, seen)
+
+    assert first > sys.getsizeof('x' * 1000)
+    assert second < sys.getsizeof('x' * 1000)
+
+
+def test_deep_sizeof_walks_frozen_and_sensitive_values_without_fetching():
+    class NeverFetch(SecretProvider):
+        def fetch(self):
+            raise AssertionError("measuring must not fetch secrets")
+
+    payload = 'y' * 5000
+    assert deep_sizeof(freeze({'a': payload})) > 5000
+    assert deep_sizeof(SensitiveDict({'token': payload})) > 5000
+    assert deep_sizeof(SensitiveDict(source=SecretCache(NeverFetch(), background=False))) < 5000
+
+
+def test_breakdown_is_sorted_and_charges_shared_values_to_the_first_key():
+    shared = 'z' * 4000
+    breakdown = memory_breakdown({'small': 1, 'first': shared, 'second': shared})
+
+    assert next(iter(breakdown['keys'])) == 'first'
+    assert breakdown['keys']['first']['bytes'] > 4000
+    assert breakdown['keys']['second']['bytes'] < 4000
+    assert breakdown['total_bytes'] == breakdown['container_bytes'] + sum(
+        entry['bytes'] for entry in breakdown['keys'].values())
+
+
+def test_unparsed_lazy_sections_are_not_measured(tmp_path):
+    path = tmp_path / 'lazy.yaml'
+    path.write_text('alpha: 1\nbeta: [1, 2, 3]\n')
+    config = LazyConfig.from_file(path)
+    config['alpha']
+
+    keys = memory_breakdown(config)['keys']
+
+    assert keys['beta'] == {'bytes': 0, 'objects': 0, 'loaded': False}
+    assert keys['alpha']['loaded'] and 'beta' not in config.loaded_keys()
+
+
+def test_trace_only_stops_tracing_it_started():
+    trace = MemoryTrace(top=3)
+    trace.start()
+    with trace.phase('allocate'):
+        blob = [bytes(1000) for _ in range(100)]
+    trace.stop()
+
+    phase = trace.as_dict()['phases'][0]
+    assert phase['phase'] == 'allocate' and phase['allocated_bytes'] >= 100_000
+    assert len(phase['top_sites']) <= 3
+    assert not tracemalloc.is_tracing()
+    del blob
+
+    tracemalloc.start()
+    try:
+        outer = MemoryTrace()
+        outer.start()
+        outer.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_loader_memory_report(base_config, create_temp_yaml_file, tmp_path):
+    loader = ConfigLoader(create_temp_yaml_file({**base_config, 'blob': 'b' * 10000}), trace_memory=True)
+    output = tmp_path / 'report.json'
+
+    report = loader.memory_report(output)
+
+    assert next(iter(report['breakdown']['keys'])) == 'blob'
+    assert {phase['phase'] for phase in report['trace']['phases']} >= {'parse_yaml', 'validate'}
+    assert json.loads(output.read_text())['config_path'] == str(loader.config_path)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,125 @@
+import gc
+import threading
+import time
+
+import pytest
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.secret_providers import SecretCache, SecretProvider
+
+
+class CountingProvider(SecretProvider):
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.fetches = 0
+        self.fail = False
+        self._lock = threading.Lock()
+
+    def fetch(self):
+        time.sleep(self.delay)
+        with self._lock:
+            self.fetches += 1
+            fetches = self.fetches
+        if self.fail:
+            raise OSError("vault unreachable")
+        return {'token': f"token-{fetches}"}
+
+
+def _refresh_threads():
+    return [thread for thread in threading.enumerate() if thread.name == 'secret-refresh']
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_secret_provider_requires_fetch():
+    class Incomplete(SecretProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_concurrent_misses_share_one_fetch():
+    provider = CountingProvider(delay=0.1)
+    cache = SecretCache(provider, background=False)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def get():
+        barrier.wait()
+        results.append(cache.get())
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.fetches == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_expired_value_is_served_while_refreshes_fail():
+    provider = CountingProvider()
+    cache = SecretCache(provider, ttl=0.05, background=False)
+    assert cache.get() == {'token': 'token-1'}
+
+    provider.fail = True
+    time.sleep(0.06)
+    assert cache.get() == {'token': 'token-1'}
+    fetches = provider.fetches
+    assert cache.get() == {'token': 'token-1'}
+    assert provider.fetches == fetches  # Backed off instead of fetching on every call.
+
+
+def test_rejected_refresh_keeps_previous_value():
+    def only_first_token(data):
+        if data['token'] != 'token-1':
+            raise ValueError("unexpected token")
+
+    cache = SecretCache(CountingProvider(), background=False, validator=only_first_token)
+    cache.get()
+
+    with pytest.raises(ValueError):
+        cache.refresh()
+    assert cache.peek() == {'token': 'token-1'}
+
+
+def test_background_thread_refreshes_and_stops_on_close():
+    provider = CountingProvider()
+    cache = SecretCache(provider, ttl=0.1, refresh_ahead=0.5)
+    cache.get()
+
+    assert _wait_for(lambda: provider.fetches >= 3)
+    cache.close()
+    assert not any(thread.is_alive() for thread in _refresh_threads())
+
+
+def test_discarded_caches_do_not_leak_threads():
+    before = len(_refresh_threads())
+    for _ in range(5):
+        SecretCache(CountingProvider(), ttl=300).get()
+    gc.collect()
+
+    assert _wait_for(lambda: len(_refresh_threads()) == before)
+
+
+def test_loader_close_stops_the_refresh_thread(base_config, create_temp_yaml_file):
+    auth_file = create_temp_yaml_file({'qTest_bearer_token': 'Bearer x'}, filename='auth.yaml')
+    before = len(_refresh_threads())
+
+    loader = ConfigLoader(create_temp_yaml_file({**base_config, 'authentication_path': str(auth_file)}),
+                          secret_ttl=300)
+    assert loader.config['auth'].get_data() == {'qTest_bearer_token': 'Bearer x'}
+    assert len(_refresh_threads()) == before + 1
+    loader.close()
+    assert len(_refresh_threads()) == before
+    assert loader.config['auth'].get_data() == {'qTest_bearer_token': 'Bearer x'}
+
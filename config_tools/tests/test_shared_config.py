@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+from config_tools import shared_config
+from config_tools.config_loader import ConfigLoader
+from config_tools.frozen_config import FrozenConfig
+from config_tools.shared_config import (HEADER, VERSION, VERSION_OFFSET, SharedConfigPublisher, SharedConfigReader,
+                                        shareable_config)
+from config_tools.utils import SensitiveDict
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedConfigPublisher()
+    yield publisher
+    publisher.close()
+
+
+def test_reader_sees_each_published_version(publisher):
+    publisher.publish({'region': 'eu', 'limits': {'retries': 3}})
+    reader = SharedConfigReader(publisher.name)
+    try:
+        first = reader.read()
+        assert first.limits.retries == 3
+        assert reader.version == 1 and not reader.changed
+        assert reader.read() is first
+
+        publisher.publish({'region': 'us'})
+        assert reader.changed
+        assert reader.read()['region'] == 'us'
+        assert reader.version == 2
+    finally:
+        reader.close()
+
+
+def test_secrets_and_loggers_are_left_out_unless_requested():
+    import logging
+
+    config = {'region': 'eu', 'logger': logging.getLogger('x'), 'auth': SensitiveDict({'token': 'secret'})}
+
+    assert shareable_config(config) == {'region': 'eu'}
+    assert shareable_config(config, include_secrets=True)['auth'].get_data() == {'token': 'secret'}
+
+
+def test_payload_larger_than_capacity_is_rejected():
+    publisher = SharedConfigPublisher(capacity=128)
+    try:
+        with pytest.raises(ValueError, match='exceeds the shared segment capacity'):
+            publisher.publish({'blob': 'x' * 1024})
+    finally:
+        publisher.close()
+
+
+def test_reader_refuses_unpublished_and_half_written_segments(publisher):
+    publisher.publish({'region': 'eu'})
+    reader = SharedConfigReader(publisher.name)
+    try:
+        # Simulate a writer that died mid-publication: the version stays odd.
+        VERSION.pack_into(publisher._shm.buf, VERSION_OFFSET, 3)
+        with pytest.raises(ValueError, match='consistent config'):
+            reader.read(retries=5)
+    finally:
+        reader.close()
+
+    empty = SharedConfigPublisher(capacity=1024)
+    reader = SharedConfigReader(empty.name)
+    try:
+        with pytest.raises(ValueError, match='Nothing has been published'):
+            reader.read()
+    finally:
+        reader.close()
+        empty.close()
+
+
+def test_even_version_is_published_after_the_length(publisher, monkeypatch):
+    writes = []
+
+    class Recording:
+        def __init__(self, name, struct):
+            self.name, self.struct = name, struct
+
+        def pack_into(self, buf, offset, value):
+            writes.append((self.name, value))
+            self.struct.pack_into(buf, offset, value)
+
+        def unpack_from(self, buf, offset):
+            return self.struct.unpack_from(buf, offset)
+
+    monkeypatch.setattr(shared_config, 'VERSION', Recording('version', shared_config.VERSION))
+    monkeypatch.setattr(shared_config, 'LENGTH', Recording('length', shared_config.LENGTH))
+    publisher.publish({'region': 'eu'})
+
+    assert [name for name, _ in writes] == ['version', 'length', 'version']
+    assert writes[0][1] % 2 == 1 and writes[-1][1] % 2 == 0
+
+
+def test_reader_unpickles_straight_into_a_frozen_config(publisher, monkeypatch):
+    publisher.publish({'limits': {'hosts': ['a', 'b']}})
+    monkeypatch.setattr(shared_config, 'freeze', None)  # Readers must not freeze a second copy.
+    reader = SharedConfigReader(publisher.name)
+    try:
+        config = reader.read()
+    finally:
+        reader.close()
+
+    assert isinstance(config, FrozenConfig) and isinstance(config.limits, FrozenConfig)
+    assert config.limits.hosts == ('a', 'b')
+
+
+def test_concurrent_reads_never_see_a_torn_publication(publisher):
+    publisher.publish({'a': 0, 'b': 0})
+    stop = threading.Event()
+    torn = []
+    reads = []
+
+    def read_loop():
+        reader = SharedConfigReader(publisher.name)
+        try:
+            while not stop.is_set():
+                config = reader.read(retries=10_000)
+                if config['a'] != config['b'] or len(config.get('pad', '')) != config['a'] % 50:
+                    torn.append(dict(config))
+                reads.append(config['a'])
+        finally:
+            reader.close()
+
+    threads = [threading.Thread(target=read_loop) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for version in range(1, 500):
+        publisher.publish({'a': version, 'b': version, 'pad': 'x' * (version % 50)})
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert not torn
+    assert reads and max(reads) <= 499
+
+
+def test_loader_publishes_config_without_auth(base_config, create_temp_yaml_file):
+    loader = ConfigLoader(create_temp_yaml_file({**base_config, 'region': 'eu'}))
+    publisher = loader.publish_shared()
+    reader = SharedConfigReader(publisher.name)
+    try:
+        config = reader.read()
+        assert config['region'] == 'eu'
+        assert 'logger' not in config and 'auth' not in config
+        assert HEADER.unpack_from(publisher._shm.buf, 0)[1] == 2
+    finally:
+        reader.close()
+        publisher.close()
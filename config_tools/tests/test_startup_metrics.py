@@ -0,0 +1,73 @@
+import socket
+
+import pytest
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.startup_metrics import MetricSink, PhaseTimings, StatsdSink
+
+
+class RecordingSink(MetricSink):
+    def __init__(self):
+        self.metrics = []
+
+    def emit(self, name, value_ms, tags=None):
+        self.metrics.append((name, value_ms, tags))
+
+
+class FailingSink(MetricSink):
+    def emit(self, name, value_ms, tags=None):
+        raise RuntimeError("agent down")
+
+
+def test_metric_sink_requires_emit():
+    class Incomplete(MetricSink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_repeated_phases_are_summed():
+    timings = PhaseTimings()
+    timings.record('parse', 1_000_000)
+    timings.record('validate', 500_000)
+    timings.record('parse', 2_000_000)
+
+    assert timings.as_dict() == {'parse': 3.0, 'validate': 0.5}
+    assert timings.total_ms == 3.5
+    with timings.phase('index'):
+        pass
+    assert list(timings.as_dict()) == ['parse', 'validate', 'index']
+
+
+def test_emit_sends_every_phase_and_ignores_sink_errors():
+    timings = PhaseTimings()
+    timings.record('parse', 1_000_000)
+    sink = RecordingSink()
+
+    timings.emit([FailingSink(), sink], tags={'config': 'a.yaml'})
+
+    assert sink.metrics == [('startup.parse', 1.0, {'config': 'a.yaml'}), ('startup.total', 1.0, {'config': 'a.yaml'})]
+
+
+def test_statsd_sink_sends_udp_lines():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    receiver.settimeout(2)
+    sink = StatsdSink(port=receiver.getsockname()[1], prefix='svc')
+    try:
+        sink.emit('startup.total', 1.5, {'config': 'a.yaml'})
+        assert receiver.recv(1024) == b'svc.startup.total:1.500|ms|#config:a.yaml'
+    finally:
+        sink.close()
+        receiver.close()
+
+
+def test_loader_records_and_emits_startup_phases(base_config, create_temp_yaml_file):
+    sink = RecordingSink()
+    loader = ConfigLoader(create_temp_yaml_file(base_config), metric_sinks=[sink])
+
+    phases = loader.timings.as_dict()
+    assert {'parse_yaml', 'prepare_logger', 'validate'} <= set(phases)
+    assert {name for name, _, _ in sink.metrics} == {f"startup.{name}" for name in phases} | {'startup.total'}
+    assert all(tags == {'config': 'test_config.yaml'} for _, _, tags in sink.metrics)
@@ -1,12 +1,18 @@
 import json
 import logging
 from datetime import date, datetime
+from typing import Dict
 
 class SensitiveDict:
-    """Custom dictionary-like class for handling sensitive data."""
+    """Custom dictionary-like class for handling sensitive data.
+
+    With a `source` (such as a SecretCache) the data is read through it on every access, so rotated
+    secrets are picked up without rebuilding the dict.
+    """
     
-    def __init__(self, data):
+    def __init__(self, data=None, source=None):
         self._data = data
+        self._source = source
 
     def __repr__(self):
         return "<SensitiveDict>"
@@ -15,7 +21,17 @@ class SensitiveDict:
         return self.__repr__()
 
     def get_data(self):
+        if self._source is not None:
+            return self._source.get()
         return self._data
+
+    @property
+    def source(self):
+        return self._source
+
+    def __reduce__(self):
+        # A secret source holds locks and threads; pickles carry the current data instead.
+        return (self.__class__, (self.get_data(),))
     
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -29,3 +45,39 @@ class CustomJSONEncoder(json.JSONEncoder):
         if isinstance(obj, (date, datetime)):
             return obj.strftime("%Y-%m-%d")
         return super().default(obj)
+
+
+def normalize_config(config_data) -> Dict:
+    """Check parsed YAML is a mapping and normalize its keys at every level (strip, spaces to underscores)."""
+    if not isinstance(config_data, dict):
+        raise ValueError("YAML file content is not a valid dictionary.")
+
+    return {key.strip().replace(" ", "_"): normalize_nested(value) for key, value in config_data.items()}
+
+
+def normalize_nested(value, _seen=None):
+    """Normalize the string keys of every mapping nested in a parsed YAML value, the same way as top-level keys.
+
+    Mappings are updated in place (they come straight from the parser) and each is visited once, so
+    anchors shared through aliases, and recursive ones, are safe. Returns the value.
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return value
+    seen.add(id(value))
+
+    if isinstance(value, list):
+        for item in value:
+            normalize_nested(item, seen)
+        return value
+
+    if any(isinstance(key, str) and (key != key.strip() or " " in key) for key in value):
+        items = list(value.items())
+        value.clear()
+        for key, item in items:
+            value[key.strip().replace(" ", "_") if isinstance(key, str) else key] = item
+    for item in value.values():
+        normalize_nested(item, seen)
+    return value
@@ -1,3 +1,5 @@
+from functools import partial
+
 from config_tools.config_validator import ConfigValidator
 
 config_rules = {
@@ -10,22 +12,30 @@ config_rules = {
     },
     'retry_attempts': {
         'required': False,
-        'validator': lambda key, value: ConfigValidator.validate_int_range(key, value, min_value=0)
+        'validator': partial(ConfigValidator.validate_int_range, min_value=0)
     },
     'log_name_prefix': {
         'required': False,
         'validator': ConfigValidator.validate_log_prefix
     },
+    'log_retention_days': {
+        'required': False,
+        'validator': partial(ConfigValidator.validate_int_range, min_value=1)
+    },
+    'log_max_total_bytes': {
+        'required': False,
+        'validator': partial(ConfigValidator.validate_int_range, min_value=1)
+    },
     'max_concurrent_requests': {
         'required': True,
-        'validator': lambda key, value: ConfigValidator.validate_int_range(key, value, min_value=1)
+        'validator': partial(ConfigValidator.validate_int_range, min_value=1)
     },
     'target_date': {
         'required': True,
-        'validator': lambda key, value: ConfigValidator.validate_date(key, value)
+        'validator': ConfigValidator.validate_date
     },
     'output_filetype': {
         'required': True,
-        'validator': lambda key, value: ConfigValidator.validate_string_in_list(key, value, ["Excel", "CSV", "SQLite"])
+        'validator': partial(ConfigValidator.validate_string_in_list, target_list=["Excel", "CSV", "SQLite"])
     },
 }
@@ -0,0 +1,117 @@
+import argparse
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to sys.path to ensure the config_tools module is found
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from config_tools.file_tree import TreeFilter, write_file_tree
+
+EXCLUDE_PREFIXES = ["file_tree_"]
+EXCLUDE_SUFFIXES = [".tmp"]
+EXCLUDE_FILETYPES = [".pyc", ".log"]
+EXCLUDE_FOLDERS = ['.git', "__pycache__", "logs"]
+
+
+def build_tree(root, fanout, depth, files_per_dir):
+    """Create a synthetic tree with numbered and named entries and a few excluded ones; return the file count."""
+    count = 0
+    suffixes = ('.py', '.yaml', '.txt', '.pyc', '.log', '.tmp')
+    for i in range(files_per_dir):
+        name = f"{i}_module{suffixes[i % len(suffixes)]}" if i % 3 else f"file_{i}{suffixes[i % len(suffixes)]}"
+        with open(os.path.join(root, name), 'w'):
+            pass
+        count += 1
+    if depth == 0:
+        return count
+    os.mkdir(os.path.join(root, "__pycache__"))
+    for i in range(fanout):
+        child = os.path.join(root, f"{i:02d}_package" if i % 2 else f"pkg_{i}")
+        os.mkdir(child)
+        count += build_tree(child, fanout, depth - 1, files_per_dir)
+    return count
+
+
+def legacy_file_tree(target_path, file):
+    """The original listdir/isdir implementation, kept as the baseline."""
+    def extract_number(entry):
+        match = re.match(r'^(\d+)', entry)
+        if match:
+            return int(match.group(1))
+        return float('inf')
+
+    file.write(f"{os.path.basename(target_path)}/\n")
+
+    def walk_directory(current_path, prefix="│   "):
+        try:
+            entries = sorted(os.listdir(current_path), key=lambda entry: (extract_number(entry), entry))
+            entries = [e for e in entries if os.path.basename(e) not in EXCLUDE_FOLDERS]
+            for i, entry in enumerate(entries):
+                full_path = os.path.join(current_path, entry)
+                connector = "└──" if i == len(entries) - 1 else "├──"
+                if os.path.isdir(full_path):
+                    file.write(f"{prefix}{connector} {entry}/\n")
+                    new_prefix = prefix + ("    " if connector == "└──" else "│   ")
+                    walk_directory(full_path, new_prefix)
+                else:
+                    if any(entry.startswith(p) for p in EXCLUDE_PREFIXES):
+                        continue
+                    if any(entry.endswith(s) for s in EXCLUDE_SUFFIXES):
+                        continue
+                    if any(entry.endswith(ft) for ft in EXCLUDE_FILETYPES):
+                        continue
+                    file.write(f"{prefix}{connector} {entry}\n")
+        except PermissionError:
+            connector = "└──" if prefix.endswith("└──") else "├──"
+            file.write(f"{prefix}{connector} [Permission Denied]\n")
+
+    walk_directory(target_path)
+
+
+def timed(render, repeat):
+    """Return (best seconds, output) over `repeat` runs."""
+    best, output = float('inf'), None
+    for _ in range(repeat):
+        buffer = io.StringIO()
+        started = time.perf_counter()
+        render(buffer)
+        best = min(best, time.perf_counter() - started)
+        output = buffer.getvalue()
+    return best, output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the file tree generator on a synthetic tree.")
+    parser.add_argument('--fanout', type=int, default=6)
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--files-per-dir', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='file_tree_bench_')
+    try:
+        files = build_tree(root, args.fanout, args.depth, args.files_per_dir)
+        tree_filter = TreeFilter(EXCLUDE_PREFIXES, EXCLUDE_SUFFIXES, EXCLUDE_FILETYPES, EXCLUDE_FOLDERS)
+        candidates = (
+            ('legacy', lambda out: legacy_file_tree(root, out)),
+            ('scandir', lambda out: write_file_tree(root, out, tree_filter, workers=0)),
+            (f'scandir x{args.workers}', lambda out: write_file_tree(root, out, tree_filter, workers=args.workers)),
+        )
+        print(f"Synthetic tree: {files:,} files, fanout {args.fanout}, depth {args.depth}")
+        baseline_seconds, baseline_output = None, None
+        for name, render in candidates:
+            seconds, output = timed(render, args.repeat)
+            if baseline_output is None:
+                baseline_seconds, baseline_output = seconds, output
+            status = "identical" if output == baseline_output else "OUTPUT DIFFERS"
+            print(f"{name:>12}: {seconds * 1000:9.1f} ms  {baseline_seconds / seconds:5.2f}x  {status}")
+    finally:
+        shutil.rmtree(root)
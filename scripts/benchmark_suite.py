@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+
+# Add the project root to sys.path to ensure the config_tools module is found
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from config_tools.config_loader import ConfigLoader
+from config_tools.config_validator import ConfigValidator
+from config_tools.validation_rules_auth import auth_rules
+from config_tools.validation_rules_config import config_rules
+
+from benchmark_logging import benchmark as benchmark_logging, reset_logger
+from generate_synthetic_config import write_config_pair
+
+COLD_LOAD_SNIPPET = """
+import sys, time
+started = time.perf_counter()
+from config_tools.config_loader import ConfigLoader
+from config_tools.validation_rules_auth import auth_rules
+from config_tools.validation_rules_config import config_rules
+ConfigLoader(sys.argv[1], config_rules, auth_rules)
+sys.stderr.write(repr(time.perf_counter() - started))
+"""
+
+
+def summarize(samples):
+    """Return timing statistics in milliseconds for a list of durations in seconds."""
+    samples_ms = sorted(sample * 1000 for sample in samples)
+    return {
+        'runs': len(samples_ms),
+        'min_ms': round(samples_ms[0], 4),
+        'median_ms': round(statistics.median(samples_ms), 4),
+        'max_ms': round(samples_ms[-1], 4),
+    }
+
+
+def time_calls(function, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_cold_load(config_path, runs):
+    """Time import plus first ConfigLoader construction in a fresh interpreter."""
+    samples = []
+    env = dict(os.environ, PYTHONPATH=str(project_root))
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, '-c', COLD_LOAD_SNIPPET, str(config_path)],
+                                   env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True, text=True)
+        samples.append(float(completed.stderr.strip().splitlines()[-1]))
+    return summarize(samples)
+
+
+def bench_warm_load(config_path, runs):
+    """Time repeated ConfigLoader construction in an already warmed-up process."""
+    ConfigLoader(config_path, config_rules, auth_rules)
+    return summarize(time_calls(lambda: ConfigLoader(config_path, config_rules, auth_rules), runs))
+
+
+def bench_auth_load(config_path, runs):
+    """Time load_authentication_config on an existing loader."""
+    loader = ConfigLoader(config_path, config_rules, auth_rules)
+    auth_path = loader.config['authentication_path']
+    return summarize(time_calls(lambda: loader.load_authentication_config(auth_path), runs))
+
+
+def bench_validate(rule_count, runs):
+    """Time ConfigValidator.validate over a synthetic rules dict of the given size."""
+    rules = {f"key_{index}": {'required': True, 'validator': partial(ConfigValidator.validate_int_range, min_value=0)}
+             for index in range(rule_count)}
+    config = {f"key_{index}": index for index in range(rule_count)}
+    return summarize(time_calls(lambda: ConfigValidator(config, rules).validate(), runs))
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_suite(sizes, rule_counts, runs, log_calls):
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir, open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        for size in sizes:
+            config_path = write_config_pair(Path(work_dir) / f"size_{size}", extra_sections=size, seed=size)
+            results[f"load_cold/sections={size}"] = bench_cold_load(config_path, max(1, runs // 5))
+            results[f"load_warm/sections={size}"] = bench_warm_load(config_path, runs)
+            results[f"auth_load/sections={size}"] = bench_auth_load(config_path, runs)
+        for rule_count in rule_counts:
+            results[f"validate/rules={rule_count}"] = bench_validate(rule_count, runs)
+
+        reset_logger()
+        for name, async_mode in (('sync', False), ('async', True)):
+            throughput, p50, p99 = benchmark_logging(async_mode, log_calls, work_dir)
+            results[f"logging/{name}"] = {'calls_per_s': round(throughput), 'p50_us': round(p50, 2), 'p99_us': round(p99, 2)}
+    return results
+
+
+def compare(current, baseline, threshold):
+    """Print the change against a baseline results file and return the names that regressed."""
+    regressions = []
+    for name, stats in current['results'].items():
+        previous = baseline['results'].get(name)
+        if not previous:
+            continue
+        metric = 'median_ms' if 'median_ms' in stats else 'p99_us'
+        if not previous.get(metric):
+            continue
+        ratio = stats[metric] / previous[metric]
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:<32} {previous[metric]:>12.4f} -> {stats[metric]:>12.4f} {metric} ({ratio:.2f}x){flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark config loading, validation, auth loading and logging.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 10, 100], help="Filler sections per generated config")
+    parser.add_argument('--rule-counts', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--log-calls', type=int, default=20000)
+    parser.add_argument('--output', type=Path, default=None, help="Results file (default: bench_results/<commit>.json)")
+    parser.add_argument('--compare', type=Path, default=None, help="Baseline results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    current = {
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run_suite(args.sizes, args.rule_counts, args.runs, args.log_calls),
+    }
+
+    output = args.output or project_root / 'bench_results' / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as results_file:
+        json.dump(current, results_file, indent=2)
+    print(json.dumps(current['results'], indent=2))
+    print(f"Results written to: {output}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(current, json.load(baseline_file), args.threshold)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,75 @@
+import sys
+import timeit
+from datetime import date
+from pathlib import Path
+
+# Add the project root to sys.path to ensure the config_tools module is found
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from config_tools.collection_validators import AllowedIntValues, AllowedValues, UniqueItems
+from config_tools.compiled_rules import CompiledRules
+from config_tools.config_validator import ConfigValidator
+from config_tools.validation_rules_auth import auth_rules
+from config_tools.validation_rules_config import config_rules
+
+SAMPLE_CONFIG = {
+    'authentication_path': 'auth.yaml',
+    'qTest_domain': 'https://example.qtestnet.com/',
+    'retry_attempts': 3,
+    'log_name_prefix': 'run_',
+    'max_concurrent_requests': 8,
+    'target_date': date.today(),
+    'output_filetype': ['Excel', 'CSV'],
+}
+SAMPLE_AUTH = {'qTest_bearer_token': 'Bearer 0123abcd-0123-abcd-0123-0123456789ab'}
+
+
+def benchmark(rules, configs, repeat=5):
+    """Return the best per-config time in microseconds for validate() and CompiledRules."""
+    compiled = CompiledRules(rules)
+
+    def run_validator():
+        for config in configs:
+            ConfigValidator(config, rules).validate()
+
+    def run_compiled():
+        compiled.validate_many(configs)
+
+    baseline = min(timeit.repeat(run_validator, number=1, repeat=repeat)) / len(configs) * 1e6
+    optimized = min(timeit.repeat(run_compiled, number=1, repeat=repeat)) / len(configs) * 1e6
+    return baseline, optimized
+
+
+def benchmark_collections(size, repeat=3):
+    """Return the best time in ms to check a `size`-item list against a `size`-entry allow-list."""
+    allowed = [f"id-{i:06d}" for i in range(size)]
+    value = list(reversed(allowed))
+    allowed_ids = list(range(size))
+    value_ids = list(reversed(allowed_ids))
+
+    def list_scan():
+        # The original validate_string_in_list membership test against a plain list.
+        for item in value:
+            if item not in allowed:
+                raise ValueError(item)
+
+    candidates = {
+        'list scan': list_scan,
+        'validate_string_in_list': lambda: ConfigValidator.validate_string_in_list('ids', value, allowed),
+        'AllowedValues': (lambda validator: lambda: validator('ids', value))(AllowedValues(allowed)),
+        'AllowedIntValues': (lambda validator: lambda: validator('ids', value_ids))(AllowedIntValues(allowed_ids)),
+        'UniqueItems': (lambda validator: lambda: validator('ids', value))(UniqueItems()),
+    }
+    return {name: min(timeit.repeat(run, number=1, repeat=repeat)) * 1000 for name, run in candidates.items()}
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, rules, sample in (('config_rules', config_rules, SAMPLE_CONFIG), ('auth_rules', auth_rules, SAMPLE_AUTH)):
+        baseline, optimized = benchmark(rules, [dict(sample) for _ in range(count)])
+        print(f"{name}: validate() {baseline:.2f} us/config, CompiledRules {optimized:.2f} us/config, "
+              f"speedup {baseline / optimized:.1f}x")
+    for size in (1000, 20000):
+        timings = benchmark_collections(size)
+        print(f"{size}-item list: " + ", ".join(f"{name} {ms:.2f} ms" for name, ms in timings.items()))
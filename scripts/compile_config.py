@@ -0,0 +1,38 @@
+import argparse
+import sys
+from pathlib import Path
+
+# Add the project root to sys.path to ensure the config_tools module is found
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from config_tools.bulk_validate import import_rules
+from config_tools.compiled_config import compile_config
+
+
+def main(argv=None):
+    """Validate configs at deploy time and write '<file>.yaml.compiled' artifacts next to them."""
+    parser = argparse.ArgumentParser(description="Compile validated YAML configs into fast-loading artifacts.")
+    parser.add_argument('config_paths', nargs='+', type=Path)
+    parser.add_argument('--config-rules', default=None, help="Rules spec, e.g. config_tools.validation_rules_config:config_rules")
+    parser.add_argument('--auth-rules', default=None, help="Rules spec, e.g. config_tools.validation_rules_auth:auth_rules")
+    parser.add_argument('--no-auth', action='store_true', help="Do not compile the authentication file")
+    args = parser.parse_args(argv)
+
+    config_rules = import_rules(args.config_rules)
+    auth_rules = import_rules(args.auth_rules)
+    failed = 0
+    for config_path in args.config_paths:
+        try:
+            artifacts = compile_config(config_path, config_rules, auth_rules, include_auth=not args.no_auth)
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"Failed to compile '{config_path}': {e}", file=sys.stderr)
+            continue
+        for source, artifact in artifacts.items():
+            print(f"Compiled '{source}' -> '{artifact}'")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
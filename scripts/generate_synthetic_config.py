@@ -0,0 +1,111 @@
+import argparse
+import random
+import sys
+import uuid
+from datetime import date
+from functools import partial
+from pathlib import Path
+
+import yaml
+
+# Add the project root to sys.path to ensure the config_tools module is found
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from config_tools.collection_validators import (
+    AllowedIntValues, AllowedValues, EachIntInRange, EachLengthBetween, UniqueItems,
+)
+from config_tools.config_validator import ConfigValidator
+from config_tools.validation_rules_auth import auth_rules
+from config_tools.validation_rules_config import config_rules
+
+
+def _validator_parts(validator):
+    """Split a rules-dict validator into the underlying function and its bound keyword arguments."""
+    if isinstance(validator, partial):
+        return validator.func, dict(validator.keywords or {})
+    return validator, {}
+
+
+def generate_value(key, rule, rng):
+    """Return a value for `key` that satisfies its rule, based on the validator it uses."""
+    func, kwargs = _validator_parts(rule.get('validator'))
+    if func is ConfigValidator.validate_https_url:
+        return f"https://{key.lower()}-{rng.randrange(1000)}.example.com/"
+    if func is ConfigValidator.validate_log_prefix:
+        return f"{key.lower()}_"
+    if func is ConfigValidator.validate_int_range:
+        low = kwargs.get('min_value', 0)
+        high = kwargs.get('max_value', low + 100)
+        return rng.randint(low, high)
+    if func is ConfigValidator.validate_qTest_bearer_token:
+        return f"Bearer {uuid.UUID(int=rng.getrandbits(128))}"
+    if func is ConfigValidator.validate_date:
+        return kwargs.get('min_date') or date.today()
+    if func is ConfigValidator.validate_string_in_list:
+        return rng.choice(kwargs['target_list'])
+    if isinstance(func, (AllowedValues, AllowedIntValues)):
+        return rng.sample(sorted(func.allowed), min(len(func.allowed), 10))
+    if isinstance(func, UniqueItems):
+        return list(range(10))
+    if isinstance(func, EachIntInRange):
+        low = func.min_value if func.min_value != float('-inf') else 0
+        high = func.max_value if func.max_value != float('inf') else low + 100
+        return [rng.randint(low, high) for _ in range(10)]
+    if isinstance(func, EachLengthBetween):
+        return ["x" * func.min_length for _ in range(10)]
+    return f"{key}_value"
+
+
+def generate_section(rng, width, depth):
+    """Return a nested mapping `depth` levels deep with `width` entries per level and mixed leaf types."""
+    if depth <= 0:
+        leaf_type = rng.randrange(4)
+        if leaf_type == 0:
+            return rng.randrange(100000)
+        if leaf_type == 1:
+            return f"value-{rng.randrange(100000)}"
+        if leaf_type == 2:
+            return [rng.randrange(1000) for _ in range(5)]
+        return rng.random() < 0.5
+    return {f"key_{index}": generate_section(rng, width, depth - 1) for index in range(width)}
+
+
+def generate_config(rules, extra_sections=0, width=10, depth=2, seed=0):
+    """Generate a config that passes `rules`, padded with `extra_sections` nested filler sections."""
+    rng = random.Random(seed)
+    config = {key: generate_value(key, rule, rng) for key, rule in rules.items()}
+    for index in range(extra_sections):
+        config[f"section_{index}"] = generate_section(rng, width, depth)
+    return config
+
+
+def write_config_pair(output_dir, extra_sections=0, width=10, depth=2, seed=0, name="config"):
+    """Write a config and its auth file generated from config_rules/auth_rules; return the config path."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    auth_path = output_dir / f"{name}_auth.yaml"
+    config_path = output_dir / f"{name}.yaml"
+
+    config = generate_config(config_rules, extra_sections, width, depth, seed)
+    config['authentication_path'] = str(auth_path.resolve())
+    config['log_output_path'] = str((output_dir / 'logs').resolve())
+
+    with open(auth_path, 'w') as yaml_file:
+        yaml.dump(generate_config(auth_rules, seed=seed), yaml_file)
+    with open(config_path, 'w') as yaml_file:
+        yaml.dump(config, yaml_file, sort_keys=False)
+    return config_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a valid synthetic config and auth file from the validation rules.")
+    parser.add_argument('output_dir', type=Path)
+    parser.add_argument('--sections', type=int, default=10, help="Number of nested filler sections")
+    parser.add_argument('--width', type=int, default=10, help="Keys per nesting level")
+    parser.add_argument('--depth', type=int, default=2, help="Nesting depth of each filler section")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    config_path = write_config_pair(args.output_dir, args.sections, args.width, args.depth, args.seed)
+    print(f"Generated synthetic config file at: {config_path}")
@@ -0,0 +1,36 @@
+import argparse
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add the project root to sys.path to ensure the config_tools module is found
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from config_tools.bulk_validate import import_rules
+from config_tools.config_loader import ConfigLoader
+from config_tools.memory_profile import write_report
+
+
+def main(argv=None):
+    """Load a config with tracemalloc enabled and print (or write) its memory report as JSON."""
+    parser = argparse.ArgumentParser(description="Report per-key memory use and load-time allocations of a config.")
+    parser.add_argument('config_path', type=Path)
+    parser.add_argument('--config-rules', default=None, help="Rules spec, e.g. config_tools.validation_rules_config:config_rules")
+    parser.add_argument('--auth-rules', default=None, help="Rules spec, e.g. config_tools.validation_rules_auth:auth_rules")
+    parser.add_argument('--lazy', action='store_true', help="Load lazily; only parsed sections are measured")
+    parser.add_argument('--output', type=Path, default=None, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    # The loader logs the whole config to the console; keep stdout for the report.
+    with redirect_stdout(sys.stderr):
+        loader = ConfigLoader(args.config_path, import_rules(args.config_rules), import_rules(args.auth_rules),
+                              lazy=args.lazy, use_compiled=False, trace_memory=True)
+    report = loader.memory_report(args.output)
+    if args.output is None:
+        print(write_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
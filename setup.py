@@ -10,4 +10,11 @@ setup(
         'PyYAML',
     ],
     python_requires='>=3.7', 
+    entry_points={
+        'console_scripts': [
+            'config-tools-validate=config_tools.bulk_validate:main',
+            'config-tools-file-tree=config_tools.file_tree:main',
+            'config-tools-fingerprint=config_tools.config_fingerprint:main',
+        ],
+    },
 )